@@ -5,11 +5,30 @@ Gère le temps de jeu, les pauses, la vitesse et les événements temporels
 """
 
 import time
+import heapq
+import itertools
 import logging
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
-from collections import deque
+from collections import deque, defaultdict
+
+
+# Pas de simulation fixe (60 ticks par seconde de jeu)
+FIXED_TIMESTEP = 1.0 / 60.0
+# Durée maximale d'une frame prise en compte (évite la "spirale de la mort")
+MAX_FRAME_TIME = 0.25
+# Nombre maximal d'événements exécutés par frame (le reste est différé)
+MAX_EVENTS_PER_FRAME = 256
+# Taille de l'historique des FPS (1 seconde à 60 FPS)
+FPS_HISTORY_SIZE = 60
+_INV_FPS_HISTORY_SIZE = 1.0 / FPS_HISTORY_SIZE
+
+# Horloge haute résolution pour les mesures de performance
+_PERF = time.perf_counter
+
+# Taille de la fenêtre glissante des mesures du profileur
+PROFILER_WINDOW = 100
 
 
 class TimerState(Enum):
@@ -19,6 +38,12 @@ class TimerState(Enum):
     STOPPED = "stopped"
 
 
+# Membres de l'énumération liés une fois (comparaison par identité dans les chemins chauds)
+_RUNNING = TimerState.RUNNING
+_PAUSED = TimerState.PAUSED
+_STOPPED = TimerState.STOPPED
+
+
 @dataclass
 class ScheduledEvent:
     """Événement programmé dans le temps"""
@@ -58,6 +83,40 @@ class ScheduledEvent:
             self.is_active = False
 
 
+_heappop = heapq.heappop
+
+
+def drain_due(heap: List[Tuple[float, int, 'ScheduledEvent']], now: float,
+              max_events: int) -> List['ScheduledEvent']:
+    """
+    Dépile les événements dont l'échéance est atteinte
+    
+    Args:
+        heap: Tas de (échéance, numéro d'ordre, événement)
+        now: Temps de jeu courant
+        max_events: Nombre maximal d'événements à dépiler
+        
+    Returns:
+        Les événements dus, dans l'ordre de leur échéance
+    """
+    due = []
+    while heap and heap[0][0] <= now and len(due) < max_events:
+        due.append(_heappop(heap)[2])
+    return due
+
+
+def _format_time_ms(time_seconds: float) -> str:
+    """Formate un temps en "m:ss.mmm" (une seule division via divmod)"""
+    minutes, seconds = divmod(time_seconds, 60.0)
+    return f"{int(minutes)}:{seconds:06.3f}"
+
+
+def _format_time_s(time_seconds: float) -> str:
+    """Formate un temps en "m:ss" (une seule division via divmod)"""
+    minutes, seconds = divmod(time_seconds, 60.0)
+    return f"{int(minutes)}:{int(seconds):02d}"
+
+
 class GameTimer:
     """
     Gestionnaire principal du temps dans le jeu
@@ -68,12 +127,15 @@ class GameTimer:
         self.logger = logging.getLogger('GameTimer')
         
         # État du timer
-        self.state = TimerState.STOPPED
+        self.state = _STOPPED
         self.speed_multiplier = 1.0
         
         # Temps
         self.real_start_time = 0.0
         self.game_time = 0.0  # Temps de jeu total (sans pauses)
+        self.fixed_dt = FIXED_TIMESTEP
+        self._accumulator = 0.0  # Temps de jeu en attente de ticks fixes
+        self.interpolation = 0.0  # Fraction de tick restante, pour le rendu
         self.total_real_time = 0.0  # Temps réel total
         self.last_update_time = 0.0
         
@@ -81,67 +143,67 @@ class GameTimer:
         self.paused_time = 0.0
         self.pause_start_time = 0.0
         
-        # Événements programmés
-        self.scheduled_events: List[ScheduledEvent] = []
+        # Événements programmés: tas de (échéance, numéro d'ordre, événement)
+        self.scheduled_events: List[Tuple[float, int, ScheduledEvent]] = []
+        self._event_sequence = itertools.count()
+        self._event_budget = MAX_EVENTS_PER_FRAME
+        self._event_backlog_warned = False
         self.completed_events: List[ScheduledEvent] = []
         
         # Historique des FPS pour statistiques
-        self.fps_history: deque = deque(maxlen=60)  # 1 seconde d'historique à 60 FPS
+        self.fps_history: deque = deque(maxlen=FPS_HISTORY_SIZE)
+        self._fps_sum = 0.0  # Somme courante de l'historique
+        self._fps_warm = False  # Vrai une fois l'historique rempli
         self.frame_count = 0
         self.fps_update_timer = 0.0
         
-        # Statistiques de performance
-        self.stats = {
-            'total_frames': 0,
-            'average_fps': 0.0,
-            'min_fps': float('inf'),
-            'max_fps': 0.0,
-            'total_pause_time': 0.0,
-            'pause_count': 0
-        }
+        # Statistiques de performance (attributs simples, lus à chaque frame)
+        self._reset_stats()
         
         self.logger.info("GameTimer initialisé")
     
     def start(self):
         """Démarre le timer"""
-        if self.state == TimerState.STOPPED:
+        if self.state is _STOPPED:
             self.real_start_time = time.time()
             self.last_update_time = self.real_start_time
             self.game_time = 0.0
             self.paused_time = 0.0
-        elif self.state == TimerState.PAUSED:
+            self._accumulator = 0.0
+            self.interpolation = 0.0
+        elif self.state is _PAUSED:
             # Reprise après pause
             pause_duration = time.time() - self.pause_start_time
             self.paused_time += pause_duration
-            self.stats['total_pause_time'] += pause_duration
+            self.total_pause_time += pause_duration
         
-        self.state = TimerState.RUNNING
+        self.state = _RUNNING
         self.last_update_time = time.time()
         self.logger.info("Timer démarré")
     
     def pause(self):
         """Met le timer en pause"""
-        if self.state == TimerState.RUNNING:
-            self.state = TimerState.PAUSED
+        if self.state is _RUNNING:
+            self.state = _PAUSED
             self.pause_start_time = time.time()
-            self.stats['pause_count'] += 1
+            self.pause_count += 1
             self.logger.info("Timer mis en pause")
     
     def resume(self):
         """Reprend le timer après une pause"""
-        if self.state == TimerState.PAUSED:
+        if self.state is _PAUSED:
             self.start()  # start() gère la reprise
             self.logger.info("Timer repris")
     
     def stop(self):
         """Arrête le timer"""
-        if self.state == TimerState.PAUSED:
+        if self.state is _PAUSED:
             # Finalise le calcul du temps de pause
             pause_duration = time.time() - self.pause_start_time
             self.paused_time += pause_duration
-            self.stats['total_pause_time'] += pause_duration
+            self.total_pause_time += pause_duration
         
-        self.state = TimerState.STOPPED
+        self.state = _STOPPED
         self.logger.info(f"Timer arrêté - Temps de jeu total: {self.game_time:.2f}s")
     
     def update(self, delta_time: float):
@@ -151,26 +213,37 @@ class GameTimer:
         Args:
             delta_time: Temps écoulé depuis la dernière frame (fourni par Arcade)
         """
-        if self.state != TimerState.RUNNING:
+        if self.state is not _RUNNING:
             return
         
         current_real_time = time.time()
         
-        # Mise à jour du temps de jeu (affecté par la vitesse)
-        game_delta = delta_time * self.speed_multiplier
-        self.game_time += game_delta
+        # Accumulation du temps de jeu (affecté par la vitesse, borné par frame)
+        self._accumulator += min(delta_time * self.speed_multiplier, MAX_FRAME_TIME)
+        
+        # Avance par ticks fixes: les événements sont traités de façon déterministe
+        fixed_dt = self.fixed_dt
+        scheduled = self.scheduled_events
+        self._event_budget = MAX_EVENTS_PER_FRAME
+        while self._accumulator >= fixed_dt:
+            self.game_time += fixed_dt
+            # Test O(1) sur la tête du tas: aucun appel si rien n'est dû
+            if scheduled and scheduled[0][0] <= self.game_time:
+                self._process_scheduled_events()
+            self._accumulator -= fixed_dt
+        
+        # Fraction de tick restante, utilisable pour interpoler le rendu
+        self.interpolation = self._accumulator / fixed_dt
         
         # Mise à jour du temps réel total
         self.total_real_time = current_real_time - self.real_start_time
         
         # Mise à jour des statistiques FPS
-        self._update_fps_stats(delta_time)
-        
-        # Traitement des événements programmés
-        self._process_scheduled_events()
+        if delta_time > 0.0:
+            self._update_fps_stats(delta_time)
         
         self.last_update_time = current_real_time
-        self.stats['total_frames'] += 1
+        self.total_frames += 1
     
     def set_speed(self, multiplier: float):
         """
@@ -191,11 +264,11 @@ class GameTimer:
     
     def is_running(self) -> bool:
         """Vérifie si le timer est en cours d'exécution"""
-        return self.state == TimerState.RUNNING
+        return self.state is _RUNNING
     
     def is_paused(self) -> bool:
         """Vérifie si le timer est en pause"""
-        return self.state == TimerState.PAUSED
+        return self.state is _PAUSED
     
     def get_game_time(self) -> float:
         """Retourne le temps de jeu actuel"""
@@ -203,11 +276,11 @@ class GameTimer:
     
     def get_real_time(self) -> float:
         """Retourne le temps réel écoulé"""
-        if self.state == TimerState.STOPPED:
+        if self.state is _STOPPED:
             return 0.0
         
         current_time = time.time()
-        if self.state == TimerState.PAUSED:
+        if self.state is _PAUSED:
             return self.pause_start_time - self.real_start_time - self.paused_time
         else:
             return current_time - self.real_start_time - self.paused_time
@@ -244,7 +317,7 @@ class GameTimer:
             data=data
         )
         
-        self.scheduled_events.append(event)
+        self._push_event(event)
         self.logger.debug(f"Événement programmé: {name} dans {delay:.2f}s")
         
         return event
@@ -277,7 +350,7 @@ class GameTimer:
             Nombre d'événements annulés
         """
         cancelled_count = 0
-        for event in self.scheduled_events:
+        for _, _, event in self.scheduled_events:
             if event.name == name and event.is_active:
                 event.is_active = False
                 cancelled_count += 1
@@ -287,47 +360,97 @@ class GameTimer:
     
     def get_scheduled_events(self) -> List[ScheduledEvent]:
         """Retourne la liste des événements programmés actifs"""
-        return [event for event in self.scheduled_events if event.is_active]
+        return [event for _, _, event in self.scheduled_events if event.is_active]
+    
+    def _push_event(self, event: ScheduledEvent):
+        """Insère un événement dans le tas selon son échéance"""
+        heapq.heappush(self.scheduled_events, (event.target_time, next(self._event_sequence), event))
     
     def _process_scheduled_events(self):
-        """Traite les événements programmés"""
-        current_time = self.game_time
+        """Traite les événements programmés arrivés à échéance"""
+        now = self.game_time
+        heap = self.scheduled_events
         
-        # Traitement des événements
-        for event in self.scheduled_events[:]:  # Copie pour éviter les modifications concurrentes
-            if event.should_execute(current_time):
-                event.execute(current_time)
+        # Seuls les événements dus sont dépilés, dans l'ordre de leur échéance
+        due = drain_due(heap, now, self._event_budget)
+        self._event_budget -= len(due)
+        
+        for event in due:
+            event.execute(now)
+            
+            if event.is_active:
+                # Événement répétitif: reprogrammé à sa nouvelle échéance
+                self._push_event(event)
+            else:
+                # Événement terminé ou annulé: déplacé vers l'historique
+                self.completed_events.append(event)
                 
-                # Si l'événement n'est plus actif, le déplacer vers les événements terminés
-                if not event.is_active:
-                    self.scheduled_events.remove(event)
-                    self.completed_events.append(event)
-                    
-                    # Limitation de l'historique
-                    if len(self.completed_events) > 1000:
-                        self.completed_events.pop(0)
+                # Limitation de l'historique
+                if len(self.completed_events) > 1000:
+                    self.completed_events.pop(0)
+        
+        # Budget épuisé avec des événements encore dus: différés à la frame suivante
+        if self._event_budget <= 0 and heap and heap[0][0] <= now:
+            if not self._event_backlog_warned:
+                self.logger.warning(f"Plus de {MAX_EVENTS_PER_FRAME} événements dus en une frame, "
+                                    f"le reste est reporté à la frame suivante")
+                self._event_backlog_warned = True
+        else:
+            self._event_backlog_warned = False
     
     def _update_fps_stats(self, delta_time: float):
-        """Met à jour les statistiques de FPS"""
-        if delta_time > 0:
-            current_fps = 1.0 / delta_time
-            self.fps_history.append(current_fps)
-            
-            # Mise à jour des statistiques
-            self.stats['min_fps'] = min(self.stats['min_fps'], current_fps)
-            self.stats['max_fps'] = max(self.stats['max_fps'], current_fps)
-            
-            # Calcul de la moyenne sur l'historique
-            if self.fps_history:
-                self.stats['average_fps'] = sum(self.fps_history) / len(self.fps_history)
+        """Met à jour les statistiques de FPS (delta_time > 0 garanti par l'appelant)"""
+        current_fps = 1.0 / delta_time
+        fps_history = self.fps_history
+        
+        # Historique plein: la valeur la plus ancienne va être évincée
+        if self._fps_warm:
+            old_fps = fps_history[0]
+        else:
+            old_fps = 0.0
+            if len(fps_history) == FPS_HISTORY_SIZE - 1:
+                self._fps_warm = True
+        fps_history.append(current_fps)
+        self._fps_sum += current_fps - old_fps
+        
+        # Mise à jour des statistiques
+        self.min_fps = min(self.min_fps, current_fps)
+        self.max_fps = max(self.max_fps, current_fps)
+        
+        # Moyenne sur l'historique à partir de la somme courante
+        if self._fps_warm:
+            self.average_fps = self._fps_sum * _INV_FPS_HISTORY_SIZE
+        else:
+            self.average_fps = self._fps_sum / len(fps_history)
+    
+    def _reset_stats(self):
+        """Remet à zéro les statistiques de performance"""
+        self.total_frames = 0
+        self.average_fps = 0.0
+        self.min_fps = float('inf')
+        self.max_fps = 0.0
+        self.total_pause_time = 0.0
+        self.pause_count = 0
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Instantané des statistiques de performance"""
+        return {
+            'total_frames': self.total_frames,
+            'average_fps': self.average_fps,
+            'min_fps': self.min_fps,
+            'max_fps': self.max_fps,
+            'total_pause_time': self.total_pause_time,
+            'pause_count': self.pause_count
+        }
     
     def get_fps_stats(self) -> Dict[str, float]:
         """Retourne les statistiques de FPS"""
         return {
             'current_fps': self.fps_history[-1] if self.fps_history else 0.0,
-            'average_fps': self.stats['average_fps'],
-            'min_fps': self.stats['min_fps'] if self.stats['min_fps'] != float('inf') else 0.0,
-            'max_fps': self.stats['max_fps']
+            'average_fps': self.average_fps,
+            'min_fps': self.min_fps if self.min_fps != float('inf') else 0.0,
+            'max_fps': self.max_fps
         }
     
     def get_detailed_stats(self) -> Dict[str, Any]:
@@ -340,9 +463,9 @@ class GameTimer:
             'total_real_time': self.total_real_time,
             'speed_multiplier': self.speed_multiplier,
             'state': self.state.value,
-            'total_pause_time': self.stats['total_pause_time'],
-            'pause_count': self.stats['pause_count'],
-            'total_frames': self.stats['total_frames'],
+            'total_pause_time': self.total_pause_time,
+            'pause_count': self.pause_count,
+            'total_frames': self.total_frames,
             'scheduled_events_count': len(self.get_scheduled_events()),
             'completed_events_count': len(self.completed_events),
             **fps_stats
@@ -358,6 +481,8 @@ class GameTimer:
         self.total_real_time = 0.0
         self.paused_time = 0.0
         self.pause_start_time = 0.0
+        self._accumulator = 0.0
+        self.interpolation = 0.0
         
         # Nettoyage des événements
         self.scheduled_events.clear()
@@ -365,14 +490,9 @@ class GameTimer:
         
         # Réinitialisation des statistiques
         self.fps_history.clear()
-        self.stats = {
-            'total_frames': 0,
-            'average_fps': 0.0,
-            'min_fps': float('inf'),
-            'max_fps': 0.0,
-            'total_pause_time': 0.0,
-            'pause_count': 0
-        }
+        self._fps_sum = 0.0
+        self._fps_warm = False
+        self._reset_stats()
         
         self.logger.info("Timer remis à zéro")
     
@@ -387,13 +507,9 @@ class GameTimer:
         Returns:
             Temps formaté (ex: "1:23.45" ou "1:23")
         """
-        minutes = int(time_seconds // 60)
-        seconds = time_seconds % 60
-        
         if show_milliseconds:
-            return f"{minutes}:{seconds:06.3f}"
-        else:
-            return f"{minutes}:{int(seconds):02d}"
+            return _format_time_ms(time_seconds)
+        return _format_time_s(time_seconds)
     
     def get_formatted_game_time(self, show_milliseconds: bool = False) -> str:
         """Retourne le temps de jeu formaté"""
@@ -429,88 +545,100 @@ class PerformanceProfiler:
     
     def __init__(self, timer: GameTimer):
         self.timer = timer
-        self.measurements: Dict[str, List[float]] = {}
+        # Fenêtres glissantes de taille fixe (éviction O(1) à l'ajout)
+        self.measurements: Dict[str, deque] = defaultdict(lambda: deque(maxlen=PROFILER_WINDOW))
+        # Somme courante de chaque fenêtre pour une moyenne en O(1)
+        self._sums: Dict[str, float] = defaultdict(float)
+        self._start_times: Dict[str, float] = {}
         self.logger = logging.getLogger('PerformanceProfiler')
     
     def start_measurement(self, name: str):
         """Démarre une mesure"""
-        if not hasattr(self, '_start_times'):
-            self._start_times = {}
-        self._start_times[name] = time.time()
+        self._start_times[name] = _PERF()
     
     def end_measurement(self, name: str):
         """Termine une mesure"""
-        if not hasattr(self, '_start_times') or name not in self._start_times:
+        start = self._start_times.pop(name, None)
+        if start is None:
             self.logger.warning(f"Mesure '{name}' non démarrée")
             return
         
-        duration = time.time() - self._start_times[name]
-        
-        if name not in self.measurements:
-            self.measurements[name] = []
-        
-        self.measurements[name].append(duration)
+        duration = _PERF() - start
         
-        # Limitation de l'historique
-        if len(self.measurements[name]) > 100:
-            self.measurements[name].pop(0)
-        
-        del self._start_times[name]
+        # La valeur la plus ancienne sort de la fenêtre: on la retire de la somme
+        window = self.measurements[name]
+        if len(window) == window.maxlen:
+            self._sums[name] -= window[0]
+        window.append(duration)
+        self._sums[name] += duration
     
     def get_average_time(self, name: str) -> float:
         """Retourne le temps d'exécution moyen pour une mesure"""
-        if name not in self.measurements or not self.measurements[name]:
+        window = self.measurements.get(name)
+        if not window:
             return 0.0
         
-        return sum(self.measurements[name]) / len(self.measurements[name])
+        return self._sums[name] / len(window)
     
     def get_stats(self, name: str) -> Dict[str, float]:
         """Retourne les statistiques détaillées pour une mesure"""
-        if name not in self.measurements or not self.measurements[name]:
+        times = self.measurements.get(name)
+        if not times:
             return {'min': 0.0, 'max': 0.0, 'average': 0.0, 'count': 0}
         
-        times = self.measurements[name]
         return {
             'min': min(times),
             'max': max(times),
-            'average': sum(times) / len(times),
+            'average': self._sums[name] / len(times),
             'count': len(times)
         }
     
     def clear_measurements(self, name: Optional[str] = None):
         """Efface les mesures"""
         if name:
-            if name in self.measurements:
-                del self.measurements[name]
+            self.measurements.pop(name, None)
+            self._sums.pop(name, None)
         else:
             self.measurements.clear()
+            self._sums.clear()
 
 
 class Countdown:
-    """Compteur à rebours simple"""
+    """
+    Compteur à rebours simple
+    L'échéance est programmée sur le GameTimer: aucun update par frame n'est nécessaire
+    """
     
     def __init__(self, timer: GameTimer, duration: float, callback: Optional[Callable] = None):
         self.timer = timer
         self.duration = duration
-        self.remaining_time = duration
         self.callback = callback
         self.is_active = True
         self.is_completed = False
-    
-    def update(self, delta_time: float):
-        """Met à jour le countdown"""
-        if not self.is_active or self.is_completed:
-            return
         
-        self.remaining_time -= delta_time
+        # Temps restant figé lorsque le countdown n'est pas actif
+        self._frozen_remaining = duration
+        self._event = timer.schedule_event('countdown', self._fire, duration)
+    
+    @property
+    def remaining_time(self) -> float:
+        """Temps restant, calculé à partir de l'échéance programmée"""
+        if self.is_active:
+            return max(0.0, self._event.target_time - self.timer.game_time)
+        return self._frozen_remaining
+    
+    def _fire(self):
+        """Appelé par le GameTimer à l'échéance"""
+        self._frozen_remaining = 0.0
+        self.is_completed = True
+        self.is_active = False
         
-        if self.remaining_time <= 0:
-            self.remaining_time = 0
-            self.is_completed = True
-            self.is_active = False
-            
-            if self.callback:
-                self.callback()
+        if self.callback:
+            self.callback()
+    
+    def update(self, delta_time: float):
+        """Conservé pour compatibilité: l'échéance est gérée par le GameTimer"""
+        pass
     
     def get_progress(self) -> float:
         """Retourne le progrès (0.0 à 1.0)"""
@@ -520,25 +648,34 @@ class Countdown:
     
     def get_remaining_time(self) -> float:
         """Retourne le temps restant"""
-        return max(0.0, self.remaining_time)
+        return self.remaining_time
     
     def reset(self):
         """Remet le countdown à zéro"""
-        self.remaining_time = self.duration
+        self.timer.cancel_event(self._event)
+        self._frozen_remaining = self.duration
         self.is_active = True
         self.is_completed = False
+        self._event = self.timer.schedule_event('countdown', self._fire, self.duration)
     
     def pause(self):
         """Met en pause le countdown"""
-        self.is_active = False
+        if self.is_active:
+            self._frozen_remaining = self.remaining_time
+            self.timer.cancel_event(self._event)
+            self.is_active = False
     
     def resume(self):
         """Reprend le countdown"""
-        if not self.is_completed:
+        if not self.is_completed and not self.is_active:
             self.is_active = True
+            self._event = self.timer.schedule_event('countdown', self._fire, self._frozen_remaining)
     
     def stop(self):
         """Arrête le countdown"""
+        if self.is_active:
+            self._frozen_remaining = self.remaining_time
+            self.timer.cancel_event(self._event)
         self.is_active = False
         self.is_completed = True
 
@@ -6,10 +6,11 @@ Définit tous les types d'ennemis et leurs comportements
 
 import arcade
 import math
-import random
-from typing import List, Tuple, Optional, Dict, Any
-from enum import Enum
-from dataclasses import dataclass
+import numpy as np
+from typing import List, Tuple, Optional, Dict, Any, Union
+from enum import IntEnum
+from dataclasses import dataclass, field, replace
+from collections import deque
 import logging
 
 from gameplay.entities.entity import Entity, EntityComponent
@@ -18,41 +19,107 @@ from config.settings import SteampunkColors, GAMEPLAY_BALANCE
 from world.pathfinding import PathfindingResult
 
 
-class EnemyType(Enum):
-    """Types d'ennemis disponibles"""
-    STEAM_SOLDIER = "steam_soldier"
-    SKY_ZEPPELIN = "sky_zeppelin"
-    STEAM_TANK = "steam_tank"
-    LIGHTNING_DRONE = "lightning_drone"
-    STEEL_SPIDER = "steel_spider"
-    IRON_GOLEM = "iron_golem"
-    CYBER_SURVIVOR = "cyber_survivor"
+class EnemyType(IntEnum):
+    """Types d'ennemis disponibles (entiers: comparaisons rapides et colonne type_id)"""
+    STEAM_SOLDIER = 0
+    SKY_ZEPPELIN = 1
+    STEAM_TANK = 2
+    LIGHTNING_DRONE = 3
+    STEEL_SPIDER = 4
+    IRON_GOLEM = 5
+    CYBER_SURVIVOR = 6
+    
+    @property
+    def key(self) -> str:
+        """Identifiant textuel du type (configurations de vagues, logs)"""
+        return self.name.lower()
+    
+    @classmethod
+    def from_key(cls, key: str) -> 'EnemyType':
+        """Retrouve un type depuis son identifiant textuel (ex: "steam_soldier")"""
+        return cls[key.upper()]
 
 
-class EnemyState(Enum):
+class EnemyState(IntEnum):
     """États possibles d'un ennemi"""
-    SPAWNING = "spawning"
-    MOVING = "moving"
-    ATTACKING = "attacking"
-    STUNNED = "stunned"
-    SLOWED = "slowed"
-    DYING = "dying"
-    DEAD = "dead"
+    SPAWNING = 0
+    MOVING = 1
+    ATTACKING = 2
+    STUNNED = 3
+    SLOWED = 4
+    DYING = 5
+    DEAD = 6
+
+
+# Sprite associé à chaque type d'ennemi
+_SPRITE_TYPE_MAP = {
+    EnemyType.STEAM_SOLDIER: SpriteType.STEAM_SOLDIER,
+    EnemyType.SKY_ZEPPELIN: SpriteType.SKY_ZEPPELIN,
+    EnemyType.STEAM_TANK: SpriteType.STEAM_TANK,
+    EnemyType.LIGHTNING_DRONE: SpriteType.LIGHTNING_DRONE,
+    EnemyType.STEEL_SPIDER: SpriteType.STEEL_SPIDER,
+    EnemyType.IRON_GOLEM: SpriteType.IRON_GOLEM,
+    EnemyType.CYBER_SURVIVOR: SpriteType.CYBER_SURVIVOR
+}
+
+
+# Loggers par type d'ennemi, créés une seule fois
+_LOGGERS = {enemy_type: logging.getLogger(f'Enemy.{enemy_type.key}') for enemy_type in EnemyType}
+
+
+# Bits des effets de statut (StatusEffectComponent.effect_bits)
+EFFECT_SLOW = 1 << 0
+EFFECT_BURN = 1 << 1
+EFFECT_STUN = 1 << 2
+EFFECT_FREEZE = 1 << 3
+
+_EFFECT_BITS = {
+    'slow': EFFECT_SLOW,
+    'burn': EFFECT_BURN,
+    'stun': EFFECT_STUN,
+    'freeze': EFFECT_FREEZE
+}
+
+# Indicateurs affichés sous l'ennemi, dans l'ordre d'affichage
+_INDICATOR_TABLE = (
+    (EFFECT_SLOW, SteampunkColors.ELECTRIC_BLUE),
+    (EFFECT_BURN, SteampunkColors.FIRE_ORANGE),
+    (EFFECT_STUN, SteampunkColors.GOLD)
+)
 
 
-@dataclass
+class DamageType(IntEnum):
+    """Types de dégâts (servent aussi d'index dans le tableau des résistances)"""
+    PHYSICAL = 0
+    FIRE = 1
+    ELECTRIC = 2
+    ICE = 3
+
+
+# Correspondance nom → type pour les appelants qui passent encore une chaîne
+_DAMAGE_TYPES_BY_NAME = {damage_type.name.lower(): damage_type for damage_type in DamageType}
+_DAMAGE_TYPES = tuple(DamageType)
+
+
+def _resistances(physical: float = 0.0, fire: float = 0.0,
+                 electric: float = 0.0, ice: float = 0.0) -> np.ndarray:
+    """Construit le tableau des résistances indexé par DamageType"""
+    return np.array([physical, fire, electric, ice], dtype=np.float32)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class EnemyStats:
-    """Statistiques de base d'un ennemi"""
+    """
+    Statistiques de base d'un ennemi (immuables, partagées par type)
+    eq=False: comparaison et hachage par identité, le champ ndarray n'étant pas hachable
+    """
     max_health: int
     speed: float              # Pixels par seconde
     armor: int               # Réduction de dégâts
     reward: int              # Or donné à la mort
     
-    # Résistances (0.0 = pas de résistance, 1.0 = immunité totale)
-    physical_resistance: float = 0.0
-    fire_resistance: float = 0.0
-    electric_resistance: float = 0.0
-    ice_resistance: float = 0.0
+    # Résistances indexées par DamageType (0.0 = pas de résistance, 1.0 = immunité totale)
+    resistances: np.ndarray = field(default_factory=_resistances)
     
     # Propriétés spéciales
     is_flying: bool = False
@@ -61,21 +128,466 @@ class EnemyStats:
     explosion_radius: float = 0.0
 
 
+# Statistiques de chaque type d'ennemi
+_STATS_DB: Dict[EnemyType, EnemyStats] = {
+    EnemyType.STEAM_SOLDIER: EnemyStats(
+        max_health=100,
+        speed=60.0,
+        armor=5,
+        reward=10,
+        resistances=_resistances(physical=0.0, fire=0.2, electric=0.0, ice=0.0)
+    ),
+    
+    EnemyType.SKY_ZEPPELIN: EnemyStats(
+        max_health=150,
+        speed=40.0,
+        armor=10,
+        reward=25,
+        resistances=_resistances(physical=0.3, fire=0.0, electric=0.1, ice=0.0),
+        is_flying=True
+    ),
+    
+    EnemyType.STEAM_TANK: EnemyStats(
+        max_health=400,
+        speed=25.0,
+        armor=20,
+        reward=40,
+        resistances=_resistances(physical=0.4, fire=0.1, electric=0.8, ice=0.2),
+        explosion_damage=80,
+        explosion_radius=64.0
+    ),
+    
+    EnemyType.LIGHTNING_DRONE: EnemyStats(
+        max_health=75,
+        speed=80.0,
+        armor=0,
+        reward=15,
+        resistances=_resistances(physical=0.0, fire=0.0, electric=0.9, ice=0.0),
+        is_flying=True
+    ),
+    
+    EnemyType.STEEL_SPIDER: EnemyStats(
+        max_health=120,
+        speed=90.0,
+        armor=8,
+        reward=12,
+        resistances=_resistances(physical=0.2, fire=0.8, electric=0.0, ice=0.4)
+    ),
+    
+    EnemyType.IRON_GOLEM: EnemyStats(
+        max_health=800,
+        speed=30.0,
+        armor=25,
+        reward=80,
+        resistances=_resistances(physical=0.5, fire=0.3, electric=0.2, ice=0.0),
+        can_regenerate=True
+    ),
+    
+    EnemyType.CYBER_SURVIVOR: EnemyStats(
+        max_health=200,
+        speed=55.0,
+        armor=12,
+        reward=30,
+        resistances=_resistances(physical=0.2, fire=0.2, electric=0.2, ice=0.2)
+    )
+}
+
+# Les tableaux partagés ne doivent pas être modifiés par un ennemi
+for _stats in _STATS_DB.values():
+    _stats.resistances.flags.writeable = False
+
+
+# Nombre maximal d'effets de dégâts sur la durée simultanés par ennemi
+MAX_DOT_EFFECTS = 4
+
+
+# ═══════════════════════════════════════════════════════════
+# NOYAUX DE CALCUL VECTORISÉS
+# ═══════════════════════════════════════════════════════════
+
+def step_enemies(pos_x: np.ndarray, pos_y: np.ndarray, tgt_x: np.ndarray, tgt_y: np.ndarray,
+                 speed: np.ndarray, moving: np.ndarray, delta_time: float) -> np.ndarray:
+    """
+    Avance toutes les positions vers leur cible (modifie pos_x/pos_y en place)
+    
+    Returns:
+        np.ndarray: Masque des lignes arrivées sur leur cible
+    """
+    # Direction et distance au carré vers la cible (pas de racine à ce stade)
+    dx = tgt_x - pos_x
+    dy = tgt_y - pos_y
+    dist_sq = dx * dx + dy * dy
+    
+    arrived = moving & (dist_sq < 4.0)  # Assez proche de la cible (2 pixels)
+    step = speed * delta_time
+    
+    # Les lignes qui atteignent leur cible ce pas-ci s'y alignent sans racine;
+    # seules les autres normalisent leur direction
+    reaching = moving & ~arrived & (step * step >= dist_sq)
+    far = moving & ~(arrived | reaching)
+    
+    ratio = np.zeros(pos_x.shape, dtype=np.float32)
+    np.sqrt(dist_sq, out=ratio, where=far)
+    np.divide(step, ratio, out=ratio, where=far)
+    pos_x += dx * ratio
+    pos_y += dy * ratio
+    
+    # Alignement sur la cible
+    snap = arrived | reaching
+    pos_x[snap] = tgt_x[snap]
+    pos_y[snap] = tgt_y[snap]
+    return arrived
+
+
+def tick_dot(dot_time: np.ndarray, delta_time: float) -> np.ndarray:
+    """
+    Décompte les emplacements de DoT actifs et libère ceux expirés (modifie dot_time en place)
+    
+    Returns:
+        np.ndarray: Masque des emplacements actifs au début de la frame
+    """
+    active = dot_time > 0.0
+    np.subtract(dot_time, delta_time, out=dot_time, where=active)
+    np.maximum(dot_time, 0.0, out=dot_time)
+    return active
+
+
+class EnemySoA:
+    """
+    Stockage en colonnes (Structure of Arrays) des données des ennemis
+    Chaque ennemi occupe une ligne; timers, DoT, étourdissement, vitesse et mouvement
+    de toutes les lignes sont calculés en une seule passe vectorisée (system_update)
+    au lieu d'un appel Python par ennemi
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, capacity)
+        self.size = 0  # Nombre de lignes déjà utilisées (lignes libres incluses)
+        self._free_rows: List[int] = []
+        self.owners: List[Optional['Enemy']] = [None] * self.capacity
+        
+        self.pos_x = np.zeros(self.capacity, dtype=np.float32)
+        self.pos_y = np.zeros(self.capacity, dtype=np.float32)
+        self.tgt_x = np.zeros(self.capacity, dtype=np.float32)
+        self.tgt_y = np.zeros(self.capacity, dtype=np.float32)
+        self.moving = np.zeros(self.capacity, dtype=bool)  # A une cible sur le chemin
+        self.on_screen = np.ones(self.capacity, dtype=bool)  # Visible lors du dernier rendu
+        self.type_id = np.full(self.capacity, -1, dtype=np.int8)  # EnemyType (-1: ligne libre)
+        
+        # Vitesse: base * produit des modificateurs actifs
+        self.base_speed = np.zeros(self.capacity, dtype=np.float32)
+        self.speed_mult = np.ones(self.capacity, dtype=np.float32)
+        self.speed = np.zeros(self.capacity, dtype=np.float32)
+        
+        # Timers
+        self.stun_timer = np.zeros(self.capacity, dtype=np.float32)
+        self.flash_timer = np.zeros(self.capacity, dtype=np.float32)
+        self.spawn_timer = np.zeros(self.capacity, dtype=np.float32)
+        self.behavior_timer = np.zeros(self.capacity, dtype=np.float32)
+        
+        # Données de ciblage des tours, rafraîchies une fois par frame (refresh_soa)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        self.flying = np.zeros(self.capacity, dtype=bool)
+        self.health = np.zeros(self.capacity, dtype=np.float32)
+        self.distance = np.zeros(self.capacity, dtype=np.float32)  # Distance parcourue sur le chemin
+        
+        # Effets de dégâts sur la durée: MAX_DOT_EFFECTS emplacements par ennemi
+        # (un emplacement est libre quand son temps restant est nul)
+        dot_shape = (self.capacity, MAX_DOT_EFFECTS)
+        self.dot_dps = np.zeros(dot_shape, dtype=np.float32)
+        self.dot_time = np.zeros(dot_shape, dtype=np.float32)
+        self.dot_type = np.zeros(dot_shape, dtype=np.int8)
+        
+        # Horloge commune des DoT: tous les effets actifs infligent leurs dégâts
+        # ensemble, une fois par seconde
+        self._dot_accum = 0.0
+    
+    def allocate(self, owner: 'Enemy') -> int:
+        """Réserve une ligne pour un ennemi et retourne son index"""
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow()
+            row = self.size
+            self.size += 1
+        
+        self.owners[row] = owner
+        self.moving[row] = False
+        self.on_screen[row] = True
+        self.speed_mult[row] = 1.0
+        self.stun_timer[row] = 0.0
+        self.flash_timer[row] = 0.0
+        self.spawn_timer[row] = 1.0
+        self.behavior_timer[row] = 0.0
+        return row
+    
+    def release(self, row: int):
+        """Libère la ligne d'un ennemi"""
+        if self.owners[row] is None:
+            return
+        
+        self.owners[row] = None
+        self.type_id[row] = -1
+        self.alive[row] = False
+        self.moving[row] = False
+        self.stun_timer[row] = 0.0
+        self.dot_time[row] = 0.0
+        self._free_rows.append(row)
+    
+    def _grow(self):
+        """Double la capacité de toutes les colonnes"""
+        new_capacity = self.capacity * 2
+        for name in ('pos_x', 'pos_y', 'tgt_x', 'tgt_y', 'moving', 'on_screen', 'type_id',
+                     'base_speed', 'speed_mult', 'speed',
+                     'alive', 'flying', 'health', 'distance',
+                     'stun_timer', 'flash_timer', 'spawn_timer', 'behavior_timer',
+                     'dot_dps', 'dot_time', 'dot_type'):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            if name == 'type_id':
+                new.fill(-1)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        
+        self.owners.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+    
+    def rows_in_radius(self, center_x: float, center_y: float, radius: float) -> np.ndarray:
+        """Lignes des ennemis vivants dans un disque (distances comparées au carré)"""
+        n = self.size
+        dx = self.pos_x[:n] - center_x
+        dy = self.pos_y[:n] - center_y
+        inside = dx * dx + dy * dy <= radius * radius
+        inside &= self.alive[:n]
+        return np.flatnonzero(inside)
+    
+    def rows_in_cone(self, origin_x: float, origin_y: float, dir_x: float, dir_y: float,
+                     radius: float, half_angle: float) -> np.ndarray:
+        """
+        Lignes des ennemis vivants dans un cône (sommet origin, direction unitaire dir,
+        demi-ouverture half_angle en radians, au plus π/2), sans racine carrée:
+        dot >= |d|·cos(half_angle) devient dot >= 0 et dot² >= cos²·|d|²
+        """
+        n = self.size
+        dx = self.pos_x[:n] - origin_x
+        dy = self.pos_y[:n] - origin_y
+        distance_sq = dx * dx + dy * dy
+        dot = dx * dir_x + dy * dir_y
+        cos_half = math.cos(half_angle)
+        inside = distance_sq <= radius * radius
+        inside &= dot >= 0.0
+        inside &= dot * dot >= (cos_half * cos_half) * distance_sq
+        inside &= self.alive[:n]
+        return np.flatnonzero(inside)
+    
+    def system_update(self, delta_time: float):
+        """
+        Passe unique sur toutes les lignes: DoT, timers, étourdissement, vitesse
+        effective puis déplacement
+        """
+        n = self.size
+        if n == 0:
+            return
+        
+        self.tick_damage_over_time(delta_time)
+        
+        # Timers visuels et de comportement
+        flash = self.flash_timer[:n]
+        np.subtract(flash, delta_time, out=flash, where=flash > 0.0)
+        spawn = self.spawn_timer[:n]
+        np.subtract(spawn, delta_time, out=spawn, where=spawn > 0.0)
+        self.behavior_timer[:n] += delta_time
+        
+        # Étourdissement: pas de mouvement pendant la frame où il est actif
+        stun = self.stun_timer[:n]
+        stunned = stun > 0.0
+        if stunned.any():
+            np.subtract(stun, delta_time, out=stun, where=stunned)
+            np.maximum(stun, 0.0, out=stun)
+        
+        # Vitesse effective
+        np.multiply(self.base_speed[:n], self.speed_mult[:n], out=self.speed[:n])
+        
+        self.advance_movement(delta_time, self.moving[:n] & ~stunned)
+        
+        self.update_special_behaviors()
+    
+    def update_special_behaviors(self):
+        """Comportements spéciaux par type d'ennemi, sélectionnés par masque sur type_id"""
+        n = self.size
+        type_id = self.type_id[:n]
+        timer = self.behavior_timer[:n]
+        owners = self.owners
+        
+        # Iron Golem: régénération lente toutes les 2 secondes
+        for row in np.flatnonzero((type_id == EnemyType.IRON_GOLEM) & (timer >= 2.0)):
+            enemy = owners[row]
+            if enemy.stats.can_regenerate:
+                enemy._regenerate()
+                timer[row] = 0.0
+        
+        # Cyber Survivor: changement aléatoire de résistances toutes les 5 secondes
+        for row in np.flatnonzero((type_id == EnemyType.CYBER_SURVIVOR) & (timer >= 5.0)):
+            owners[row]._randomize_cyber_resistances()
+            timer[row] = 0.0
+        
+        # Lightning Drone: comportement d'attaque en chaîne (pour plus tard)
+    
+    def advance_movement(self, delta_time: float, moving: np.ndarray):
+        """Déplace en bloc les lignes du masque vers leur cible"""
+        if not moving.any():
+            return
+        
+        n = moving.shape[0]
+        arrived = step_enemies(self.pos_x[:n], self.pos_y[:n], self.tgt_x[:n], self.tgt_y[:n],
+                               self.speed[:n], moving, delta_time)
+        
+        # Passage à la case suivante pour les ennemis arrivés
+        owners = self.owners
+        for row in np.flatnonzero(arrived):
+            owners[row].movement._advance_path()
+    
+    def add_damage_over_time(self, row: int, damage_per_second: float, duration: float,
+                             damage_type: DamageType):
+        """Place un DoT dans un emplacement libre (ou remplace le plus proche de la fin)"""
+        times = self.dot_time[row]
+        free_slots = np.flatnonzero(times <= 0.0)
+        slot = int(free_slots[0]) if free_slots.size else int(np.argmin(times))
+        
+        self.dot_dps[row, slot] = damage_per_second
+        self.dot_time[row, slot] = duration
+        self.dot_type[row, slot] = damage_type
+    
+    def tick_damage_over_time(self, delta_time: float):
+        """
+        Fait avancer tous les DoT en bloc
+        Les dégâts sont appliqués à chaque seconde de l'horloge commune
+        """
+        self._dot_accum += delta_time
+        tick = self._dot_accum >= 1.0
+        if tick:
+            self._dot_accum -= 1.0
+        
+        n = self.size
+        remaining = self.dot_time[:n]
+        if not remaining.any():
+            return
+        
+        active = tick_dot(remaining, delta_time)
+        if tick:
+            dps = self.dot_dps
+            types = self.dot_type
+            owners = self.owners
+            for row, slot in zip(*np.nonzero(active)):
+                owners[row].health.take_damage(int(dps[row, slot]),
+                                               _DAMAGE_TYPES[types[row, slot]])
+
+
+class SpatialHash:
+    """
+    Hachage spatial des ennemis par cellules de taille fixe
+    Sert à retrouver rapidement les ennemis situés dans une zone (ex: la vue caméra)
+    """
+    
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List['Enemy']] = {}
+        self._cell_of: Dict[int, Tuple[int, int]] = {}
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Cellule contenant un point"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+    
+    def update(self, enemy: 'Enemy'):
+        """Insère un ennemi ou le déplace s'il a changé de cellule"""
+        cell = self._cell(*enemy.movement.position)
+        old_cell = self._cell_of.get(enemy.entity_id)
+        if old_cell == cell:
+            return
+        
+        if old_cell is not None:
+            self._remove_from_cell(enemy, old_cell)
+        
+        self.cells.setdefault(cell, []).append(enemy)
+        self._cell_of[enemy.entity_id] = cell
+    
+    def remove(self, enemy: 'Enemy'):
+        """Retire un ennemi du hachage"""
+        cell = self._cell_of.pop(enemy.entity_id, None)
+        if cell is not None:
+            self._remove_from_cell(enemy, cell)
+    
+    def _remove_from_cell(self, enemy: 'Enemy', cell: Tuple[int, int]):
+        bucket = self.cells[cell]
+        bucket.remove(enemy)
+        if not bucket:
+            del self.cells[cell]
+    
+    def query_rect(self, left: float, bottom: float, right: float, top: float) -> List['Enemy']:
+        """Retourne les ennemis des cellules qui chevauchent un rectangle"""
+        min_cx, min_cy = self._cell(left, bottom)
+        max_cx, max_cy = self._cell(right, top)
+        
+        result = []
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    result.extend(bucket)
+        return result
+    
+    def query_radius(self, center_x: float, center_y: float, radius: float) -> List['Enemy']:
+        """Retourne les ennemis situés dans un disque (cellules chevauchées, puis distance)"""
+        radius_sq = radius * radius
+        result = []
+        for enemy in self.query_rect(center_x - radius, center_y - radius,
+                                     center_x + radius, center_y + radius):
+            x, y = enemy.movement.position
+            dx = x - center_x
+            dy = y - center_y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(enemy)
+        return result
+    
+    def clear(self):
+        """Vide le hachage"""
+        self.cells.clear()
+        self._cell_of.clear()
+
+
 class HealthComponent(EntityComponent):
-    """Composant de santé pour les ennemis"""
+    """
+    Composant de santé pour les ennemis
+    Les DoT sont stockés dans les colonnes de l'EnemySoA
+    """
+    
+    __slots__ = ('_storage', '_row', 'max_health', 'current_health', 'armor', 'is_alive',
+                 'heal_over_time_effects')
     
-    def __init__(self, max_health: int):
+    def __init__(self, max_health: int, storage: EnemySoA, row: int):
         super().__init__()
+        self._storage = storage
+        self._row = row
         self.max_health = max_health
         self.current_health = max_health
         self.armor = 0
         self.is_alive = True
         
-        # Effets temporaires
-        self.damage_over_time_effects: List[Dict] = []
+        # Effets temporaires (les DoT vivent dans le stockage en colonnes)
         self.heal_over_time_effects: List[Dict] = []
     
-    def take_damage(self, damage: int, damage_type: str = "physical") -> bool:
+    def reset(self, max_health: int, row: int):
+        """Réinitialise le composant pour un ennemi recyclé"""
+        self._row = row
+        self.max_health = max_health
+        self.current_health = max_health
+        self.armor = 0
+        self.is_alive = True
+        self.heal_over_time_effects.clear()
+    
+    def take_damage(self, damage: int, damage_type: DamageType = DamageType.PHYSICAL) -> bool:
         """
         Inflige des dégâts à l'ennemi
         
@@ -106,32 +618,24 @@ class HealthComponent(EntityComponent):
         if self.is_alive:
             self.current_health = min(self.max_health, self.current_health + amount)
     
-    def add_damage_over_time(self, damage_per_second: int, duration: float, damage_type: str = "fire"):
+    def add_damage_over_time(self, damage_per_second: int, duration: float,
+                             damage_type: DamageType = DamageType.FIRE):
         """Ajoute un effet de dégâts sur la durée"""
-        effect = {
-            'damage_per_second': damage_per_second,
-            'remaining_time': duration,
-            'damage_type': damage_type,
-            'next_tick': 1.0
-        }
-        self.damage_over_time_effects.append(effect)
+        self._storage.add_damage_over_time(self._row, damage_per_second, duration, damage_type)
     
     def update(self, delta_time: float):
-        """Met à jour les effets temporaires"""
-        # Mise à jour des DoT
-        for effect in self.damage_over_time_effects[:]:
-            effect['remaining_time'] -= delta_time
-            effect['next_tick'] -= delta_time
-            
-            if effect['next_tick'] <= 0:
-                self.take_damage(effect['damage_per_second'], effect['damage_type'])
-                effect['next_tick'] = 1.0
-            
-            if effect['remaining_time'] <= 0:
-                self.damage_over_time_effects.remove(effect)
+        """
+        Met à jour les effets temporaires
+        Les DoT sont mis à jour en bloc par EnemySoA.system_update
+        """
+        # Mise à jour des HoT (parcours inverse, retrait par échange avec le dernier)
+        effects = self.heal_over_time_effects
+        if not effects:
+            return
         
-        # Mise à jour des HoT
-        for effect in self.heal_over_time_effects[:]:
+        i = len(effects) - 1
+        while i >= 0:
+            effect = effects[i]
             effect['remaining_time'] -= delta_time
             effect['next_tick'] -= delta_time
             
@@ -140,7 +644,9 @@ class HealthComponent(EntityComponent):
                 effect['next_tick'] = 1.0
             
             if effect['remaining_time'] <= 0:
-                self.heal_over_time_effects.remove(effect)
+                effects[i] = effects[-1]
+                effects.pop()
+            i -= 1
     
     def get_health_percentage(self) -> float:
         """Retourne le pourcentage de vie restant"""
@@ -148,116 +654,186 @@ class HealthComponent(EntityComponent):
 
 
 class MovementComponent(EntityComponent):
-    """Composant de mouvement pour les ennemis"""
+    """
+    Composant de mouvement pour les ennemis
+    La position et la cible sont stockées dans une ligne de l'EnemySoA
+    """
+    
+    __slots__ = ('_storage', '_row', 'target_position', 'path', 'path_index', 'reached_end',
+                 '_px', '_py', '_cum_dist', 'speed_modifiers', '_free_modifiers')
     
-    def __init__(self, base_speed: float):
+    def __init__(self, base_speed: float, storage: EnemySoA, row: int):
         super().__init__()
+        self._storage = storage
+        self._row = row
         self.base_speed = base_speed
-        self.current_speed = base_speed
-        self.position = (0.0, 0.0)
         self.target_position: Optional[Tuple[float, float]] = None
         self.path: List[Tuple[int, int]] = []
         self.path_index = 0
         self.reached_end = False
         
-        # Effets de mouvement
+        # Tables du chemin en pixels (centres des cases et distance cumulée)
+        self._px = np.zeros(0, dtype=np.float32)
+        self._py = np.zeros(0, dtype=np.float32)
+        self._cum_dist = np.zeros(0, dtype=np.float32)
+        
+        # Effets de mouvement (les dicts expirés sont réutilisés)
         self.speed_modifiers: List[Dict] = []
-        self.is_stunned = False
-        self.stun_duration = 0.0
+        self._free_modifiers: List[Dict] = []
+    
+    def reset(self, base_speed: float, row: int):
+        """Réinitialise le composant pour un ennemi recyclé"""
+        self._row = row
+        self.base_speed = base_speed
+        self.target_position = None
+        self.path = []
+        self.path_index = 0
+        self.reached_end = False
+        
+        self._free_modifiers.extend(self.speed_modifiers)
+        self.speed_modifiers.clear()
+    
+    @property
+    def base_speed(self) -> float:
+        """Vitesse de base (pixels par seconde)"""
+        return float(self._storage.base_speed[self._row])
+    
+    @base_speed.setter
+    def base_speed(self, value: float):
+        self._storage.base_speed[self._row] = value
+    
+    @property
+    def current_speed(self) -> float:
+        """Vitesse effective (base et modificateurs)"""
+        row = self._row
+        return float(self._storage.base_speed[row] * self._storage.speed_mult[row])
+    
+    @property
+    def is_stunned(self) -> bool:
+        """L'ennemi est-il étourdi"""
+        return bool(self._storage.stun_timer[self._row] > 0.0)
+    
+    @property
+    def stun_duration(self) -> float:
+        """Durée d'étourdissement restante"""
+        return float(self._storage.stun_timer[self._row])
+    
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Position actuelle, lue dans le stockage en colonnes"""
+        row = self._row
+        return (float(self._storage.pos_x[row]), float(self._storage.pos_y[row]))
+    
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        row = self._row
+        self._storage.pos_x[row] = value[0]
+        self._storage.pos_y[row] = value[1]
     
     def set_path(self, path: List[Tuple[int, int]]):
         """Définit le chemin à suivre"""
         self.path = path.copy()
         self.path_index = 0
         self.reached_end = False
+        self._storage.moving[self._row] = False
+        
+        # Précalcul des centres de cases et des distances cumulées
+        tiles = np.array(self.path, dtype=np.float32).reshape(-1, 2)
+        self._px = tiles[:, 0] * 32 + 16
+        self._py = tiles[:, 1] * 32 + 16
+        self._cum_dist = np.concatenate((
+            np.zeros(1, dtype=np.float32),
+            np.cumsum(np.hypot(np.diff(self._px), np.diff(self._py)), dtype=np.float32)
+        ))
         
         if self.path:
-            self.position = (float(self.path[0][0] * 32 + 16), 
-                           float(self.path[0][1] * 32 + 16))
+            self.position = (float(self._px[0]), float(self._py[0]))
             self._update_target()
     
     def _update_target(self):
         """Met à jour la position cible suivante"""
-        if self.path_index + 1 < len(self.path):
-            next_tile = self.path[self.path_index + 1]
-            self.target_position = (next_tile[0] * 32 + 16, next_tile[1] * 32 + 16)
+        next_index = self.path_index + 1
+        if next_index < len(self.path):
+            target_x = self._px[next_index]
+            target_y = self._py[next_index]
+            self.target_position = (float(target_x), float(target_y))
+            self._storage.tgt_x[self._row] = target_x
+            self._storage.tgt_y[self._row] = target_y
+            self._storage.moving[self._row] = True
         else:
             self.target_position = None
             self.reached_end = True
+            self._storage.moving[self._row] = False
+    
+    def get_distance_traveled(self) -> float:
+        """Retourne la distance parcourue sur le chemin, en pixels"""
+        if not self.path:
+            return 0.0
+        
+        index = min(self.path_index, len(self.path) - 1)
+        current_x, current_y = self.position
+        return float(self._cum_dist[index]) + math.hypot(current_x - self._px[index],
+                                                         current_y - self._py[index])
+    
+    def _advance_path(self):
+        """Appelé par l'EnemySoA quand la cible courante est atteinte"""
+        self.path_index += 1
+        self._update_target()
     
     def add_speed_modifier(self, multiplier: float, duration: float, source: str):
         """Ajoute un modificateur de vitesse temporaire"""
-        modifier = {
-            'multiplier': multiplier,
-            'remaining_time': duration,
-            'source': source
-        }
+        modifier = self._free_modifiers.pop() if self._free_modifiers else {}
+        modifier['multiplier'] = multiplier
+        modifier['remaining_time'] = duration
+        modifier['source'] = source
         self.speed_modifiers.append(modifier)
+        self._storage.speed_mult[self._row] *= multiplier
     
     def stun(self, duration: float):
         """Étourdit l'ennemi"""
-        self.is_stunned = True
-        self.stun_duration = max(self.stun_duration, duration)
+        stun_timer = self._storage.stun_timer
+        stun_timer[self._row] = max(stun_timer[self._row], duration)
     
     def update(self, delta_time: float):
-        """Met à jour le mouvement"""
-        # Mise à jour de l'étourdissement
-        if self.is_stunned:
-            self.stun_duration -= delta_time
-            if self.stun_duration <= 0:
-                self.is_stunned = False
-                self.stun_duration = 0.0
-            return  # Pas de mouvement si étourdi
-        
-        # Mise à jour des modificateurs de vitesse
-        for modifier in self.speed_modifiers[:]:
-            modifier['remaining_time'] -= delta_time
-            if modifier['remaining_time'] <= 0:
-                self.speed_modifiers.remove(modifier)
+        """
+        Met à jour les modificateurs de vitesse
+        Étourdissement, vitesse effective et déplacement sont calculés en bloc
+        par EnemySoA.system_update
+        """
+        modifiers = self.speed_modifiers
+        if not modifiers or self.is_stunned:
+            return  # Modificateurs figés pendant l'étourdissement
         
-        # Calcul de la vitesse effective
+        # Mise à jour des modificateurs et du multiplicateur de vitesse
+        # (parcours inverse, retrait par échange avec le dernier)
         speed_multiplier = 1.0
-        for modifier in self.speed_modifiers:
-            speed_multiplier *= modifier['multiplier']
-        
-        self.current_speed = self.base_speed * speed_multiplier
-        
-        # Mouvement vers la cible
-        if self.target_position and not self.reached_end:
-            self._move_towards_target(delta_time)
-    
-    def _move_towards_target(self, delta_time: float):
-        """Déplace l'ennemi vers sa cible"""
-        current_x, current_y = self.position
-        target_x, target_y = self.target_position
-        
-        # Calcul de la direction
-        dx = target_x - current_x
-        dy = target_y - current_y
-        distance = math.sqrt(dx * dx + dy * dy)
-        
-        if distance < 2.0:  # Assez proche de la cible
-            self.position = self.target_position
-            self.path_index += 1
-            self._update_target()
-        else:
-            # Mouvement vers la cible
-            move_distance = self.current_speed * delta_time
-            if move_distance > distance:
-                move_distance = distance
-            
-            move_x = (dx / distance) * move_distance
-            move_y = (dy / distance) * move_distance
-            
-            self.position = (current_x + move_x, current_y + move_y)
+        i = len(modifiers) - 1
+        while i >= 0:
+            modifier = modifiers[i]
+            modifier['remaining_time'] -= delta_time
+            if modifier['remaining_time'] <= 0:
+                modifiers[i] = modifiers[-1]
+                modifiers.pop()
+                self._free_modifiers.append(modifier)
+            else:
+                speed_multiplier *= modifier['multiplier']
+            i -= 1
+        
+        self._storage.speed_mult[self._row] = speed_multiplier
 
 
 class StatusEffectComponent(EntityComponent):
-    """Composant pour gérer les effets de statut"""
+    """
+    Composant pour gérer les effets de statut
+    Les effets connus sont aussi reflétés dans un masque de bits (effect_bits)
+    """
+    
+    __slots__ = ('active_effects', 'effect_bits')
     
     def __init__(self):
         super().__init__()
         self.active_effects: Dict[str, Dict] = {}
+        self.effect_bits = 0
     
     def add_effect(self, effect_type: str, duration: float, **params):
         """Ajoute un effet de statut"""
@@ -266,31 +842,43 @@ class StatusEffectComponent(EntityComponent):
             'remaining_time': duration,
             **params
         }
+        self.effect_bits |= _EFFECT_BITS.get(effect_type, 0)
     
     def remove_effect(self, effect_type: str):
         """Supprime un effet de statut"""
         if effect_type in self.active_effects:
             del self.active_effects[effect_type]
+            self.effect_bits &= ~_EFFECT_BITS.get(effect_type, 0)
     
-    def has_effect(self, effect_type: str) -> bool:
-        """Vérifie si un effet est actif"""
-        return effect_type in self.active_effects
+    def has_effect(self, effect: Union[int, str]) -> bool:
+        """Vérifie si un effet est actif (bit EFFECT_* ou nom de l'effet)"""
+        if isinstance(effect, str):
+            return effect in self.active_effects
+        return (self.effect_bits & effect) != 0
     
     def get_effect(self, effect_type: str) -> Optional[Dict]:
         """Récupère les données d'un effet"""
         return self.active_effects.get(effect_type)
     
+    def reset(self):
+        """Réinitialise le composant pour un ennemi recyclé"""
+        self.active_effects.clear()
+        self.effect_bits = 0
+    
     def update(self, delta_time: float):
         """Met à jour les effets"""
-        expired_effects = []
+        expired_effects = None  # Liste créée seulement si un effet expire
         
         for effect_type, effect_data in self.active_effects.items():
             effect_data['remaining_time'] -= delta_time
             if effect_data['remaining_time'] <= 0:
+                if expired_effects is None:
+                    expired_effects = []
                 expired_effects.append(effect_type)
         
-        for effect_type in expired_effects:
-            self.remove_effect(effect_type)
+        if expired_effects:
+            for effect_type in expired_effects:
+                self.remove_effect(effect_type)
 
 
 class Enemy(Entity):
@@ -299,29 +887,51 @@ class Enemy(Entity):
     Utilise un système de composants pour la modularité
     """
     
+    __slots__ = ('logger', 'enemy_type', 'sprite_factory', '_textures', 'stats',
+                 'level_multiplier', '_owns_storage', 'storage', 'soa_index',
+                 'health', 'movement', 'status_effects', 'sprite', 'state',
+                 '_flashing', '_spawn_scaled')
+    
+    # Tirages aléatoires partagés pour les résistances du Cyber Survivor
+    # (tampon circulaire rempli une seule fois, taille puissance de 2)
+    _CYBER_DRAWS_SIZE = 8192
+    _cyber_draws = np.random.default_rng().integers(0, len(DamageType), size=_CYBER_DRAWS_SIZE)
+    _cyber_draw_index = 0
+    
     def __init__(self, enemy_type: EnemyType, position: Tuple[float, float], 
-                 sprite_factory: SteampunkSpriteFactory):
+                 sprite_factory: SteampunkSpriteFactory, storage: Optional[EnemySoA] = None,
+                 textures: Optional[Dict[EnemyType, arcade.Texture]] = None):
+        self.logger = _LOGGERS[enemy_type]  # Défini avant Entity.__init__ qui l'utilise
         super().__init__()
         
-        self.logger = logging.getLogger(f'Enemy.{enemy_type.value}')
         self.enemy_type = enemy_type
         self.sprite_factory = sprite_factory
+        self._textures = textures  # Textures partagées par type (cache de l'EnemyFactory)
         
-        # Chargement des statistiques
+        # Chargement des statistiques (partagées) et multiplicateur de niveau
         self.stats = self._load_enemy_stats(enemy_type)
+        self.level_multiplier = 1.0
+        
+        # Ligne dans le stockage en colonnes (stockage privé si l'ennemi est isolé)
+        self._owns_storage = storage is None
+        self.storage = storage if storage is not None else EnemySoA(capacity=1)
+        self.soa_index = self.storage.allocate(self)
+        self.storage.type_id[self.soa_index] = enemy_type
         
         # Ajout des composants
-        self.health = HealthComponent(self.stats.max_health)
-        self.movement = MovementComponent(self.stats.speed)
+        self.health = HealthComponent(self.stats.max_health, self.storage, self.soa_index)
+        self.movement = MovementComponent(self.stats.speed, self.storage, self.soa_index)
         self.status_effects = StatusEffectComponent()
         
         self.add_component(self.health)
         self.add_component(self.movement)
         self.add_component(self.status_effects)
         
-        # Sprite et visuel
+        # Sprite et visuel (état appliqué au sprite, pour n'écrire que les changements)
         self.sprite = self._create_sprite()
         self.sprite.center_x, self.sprite.center_y = position
+        self._flashing = False
+        self._spawn_scaled = False
         self.movement.position = position
         
         # État et comportement
@@ -332,124 +942,101 @@ class Enemy(Entity):
         self.damage_flash_timer = 0.0
         self.spawn_animation_timer = 1.0
         
-        self.logger.debug(f"Ennemi {enemy_type.value} créé à {position}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Ennemi {enemy_type.key} créé à {position}")
     
-    def _load_enemy_stats(self, enemy_type: EnemyType) -> EnemyStats:
-        """Charge les statistiques selon le type d'ennemi"""
-        stats_database = {
-            EnemyType.STEAM_SOLDIER: EnemyStats(
-                max_health=100,
-                speed=60.0,
-                armor=5,
-                reward=10,
-                physical_resistance=0.0,
-                fire_resistance=0.2,
-                electric_resistance=0.0,
-                ice_resistance=0.0
-            ),
-            
-            EnemyType.SKY_ZEPPELIN: EnemyStats(
-                max_health=150,
-                speed=40.0,
-                armor=10,
-                reward=25,
-                physical_resistance=0.3,
-                fire_resistance=0.0,
-                electric_resistance=0.1,
-                ice_resistance=0.0,
-                is_flying=True
-            ),
-            
-            EnemyType.STEAM_TANK: EnemyStats(
-                max_health=400,
-                speed=25.0,
-                armor=20,
-                reward=40,
-                physical_resistance=0.4,
-                fire_resistance=0.1,
-                electric_resistance=0.8,
-                ice_resistance=0.2,
-                explosion_damage=80,
-                explosion_radius=64.0
-            ),
-            
-            EnemyType.LIGHTNING_DRONE: EnemyStats(
-                max_health=75,
-                speed=80.0,
-                armor=0,
-                reward=15,
-                physical_resistance=0.0,
-                fire_resistance=0.0,
-                electric_resistance=0.9,
-                ice_resistance=0.0,
-                is_flying=True
-            ),
-            
-            EnemyType.STEEL_SPIDER: EnemyStats(
-                max_health=120,
-                speed=90.0,
-                armor=8,
-                reward=12,
-                physical_resistance=0.2,
-                fire_resistance=0.8,
-                electric_resistance=0.0,
-                ice_resistance=0.4
-            ),
-            
-            EnemyType.IRON_GOLEM: EnemyStats(
-                max_health=800,
-                speed=30.0,
-                armor=25,
-                reward=80,
-                physical_resistance=0.5,
-                fire_resistance=0.3,
-                electric_resistance=0.2,
-                ice_resistance=0.0,
-                can_regenerate=True
-            ),
-            
-            EnemyType.CYBER_SURVIVOR: EnemyStats(
-                max_health=200,
-                speed=55.0,
-                armor=12,
-                reward=30,
-                physical_resistance=0.2,
-                fire_resistance=0.2,
-                electric_resistance=0.2,
-                ice_resistance=0.2
-            )
-        }
+    def reset(self, enemy_type: EnemyType, position: Tuple[float, float]):
+        """
+        Réinitialise un ennemi recyclé par l'EnemyPool comme s'il venait d'être créé
+        Les composants et le sprite sont conservés, seul leur état est remis à zéro
+        """
+        self._reset()
+        
+        # État propre à l'ancien ennemi: ses écouteurs ne doivent pas recevoir les événements du nouveau
+        self._local_event_handlers.clear()
+        self.tags.clear()
+        self.children.clear()
+        self.parent = None
+        self._event_system = None
+        
+        self.logger = _LOGGERS[enemy_type]
+        self.enemy_type = enemy_type
+        self.stats = self._load_enemy_stats(enemy_type)
+        self.level_multiplier = 1.0
         
-        return stats_database[enemy_type]
+        # Nouvelle ligne dans le stockage (l'ancienne a été libérée au recyclage)
+        self.soa_index = self.storage.allocate(self)
+        self.storage.type_id[self.soa_index] = enemy_type
+        self.health.reset(self.stats.max_health, self.soa_index)
+        self.movement.reset(self.stats.speed, self.soa_index)
+        self.status_effects.reset()
+        
+        # Sprite et visuel
+        self.sprite.texture = self._get_texture()
+        self.sprite.scale = 1.0
+        self.sprite.color = (255, 255, 255)
+        self.sprite.center_x, self.sprite.center_y = position
+        self._flashing = False
+        self._spawn_scaled = False
+        self.movement.position = position
+        
+        # État et comportement
+        self.state = EnemyState.SPAWNING
+        self.behavior_timer = 0.0
+        
+        # Effets visuels
+        self.damage_flash_timer = 0.0
+        self.spawn_animation_timer = 1.0
+    
+    def apply_level_multiplier(self, level_multiplier: float):
+        """
+        Applique le multiplicateur de niveau sur les composants de l'ennemi
+        Les statistiques partagées du type ne sont pas modifiées
+        """
+        self.level_multiplier = level_multiplier
+        self.health.max_health = int(self.stats.max_health * level_multiplier)
+        self.health.current_health = self.health.max_health
+        self.movement.base_speed = self.stats.speed * min(1.5, 1.0 + (level_multiplier - 1.0) * 0.3)  # Vitesse limitée
+    
+    def release_storage(self):
+        """Libère la ligne de stockage de l'ennemi (sans détruire ses composants)"""
+        if self.storage.owners[self.soa_index] is self:
+            self.storage.release(self.soa_index)
+        self.is_active = False
+    
+    def _load_enemy_stats(self, enemy_type: EnemyType) -> EnemyStats:
+        """
+        Retourne les statistiques du type d'ennemi
+        Instance partagée par tous les ennemis du type, sauf pour le Cyber Survivor
+        dont les résistances changent et qui reçoit sa propre copie
+        """
+        stats = _STATS_DB[enemy_type]
+        if enemy_type == EnemyType.CYBER_SURVIVOR:
+            return replace(stats, resistances=stats.resistances.copy())
+        return stats
     
     def _create_sprite(self) -> arcade.Sprite:
         """Crée le sprite de l'ennemi"""
-        sprite_type_map = {
-            EnemyType.STEAM_SOLDIER: SpriteType.STEAM_SOLDIER,
-            EnemyType.SKY_ZEPPELIN: SpriteType.SKY_ZEPPELIN,
-            EnemyType.STEAM_TANK: SpriteType.STEAM_TANK,
-            EnemyType.LIGHTNING_DRONE: SpriteType.LIGHTNING_DRONE,
-            EnemyType.STEEL_SPIDER: SpriteType.STEEL_SPIDER,
-            EnemyType.IRON_GOLEM: SpriteType.IRON_GOLEM,
-            EnemyType.CYBER_SURVIVOR: SpriteType.CYBER_SURVIVOR
-        }
-        
-        sprite_type = sprite_type_map[self.enemy_type]
-        texture = self.sprite_factory.create_sprite(sprite_type)
-        
         sprite = arcade.Sprite()
-        sprite.texture = texture
+        sprite.texture = self._get_texture()
         sprite.scale = 1.0
         
         return sprite
     
+    def _get_texture(self) -> arcade.Texture:
+        """Texture du type d'ennemi (depuis le cache partagé s'il existe)"""
+        if self._textures is not None:
+            return self._textures[self.enemy_type]
+        
+        return self.sprite_factory.create_sprite(_SPRITE_TYPE_MAP[self.enemy_type])
+    
     def set_path(self, path: List[Tuple[int, int]]):
         """Définit le chemin que l'ennemi doit suivre"""
         self.movement.set_path(path)
         if self.state == EnemyState.SPAWNING:
             self.state = EnemyState.MOVING
     
-    def take_damage(self, damage: int, damage_type: str = "physical", 
+    def take_damage(self, damage: int, damage_type: Union[DamageType, str] = DamageType.PHYSICAL,
                    source_position: Optional[Tuple[float, float]] = None) -> bool:
         """
         Fait subir des dégâts à l'ennemi
@@ -465,12 +1052,16 @@ class Enemy(Entity):
         if not self.health.is_alive:
             return True
         
-        # Application des résistances
-        resistance = getattr(self.stats, f"{damage_type}_resistance", 0.0)
+        # Application des résistances (les noms de type sont encore acceptés)
+        if isinstance(damage_type, str):
+            damage_type = _DAMAGE_TYPES_BY_NAME.get(damage_type)
+        
+        resistance = self.stats.resistances[damage_type] if damage_type is not None else 0.0
         effective_damage = int(damage * (1.0 - resistance))
         
-        # Effet visuel de dégâts
-        self.damage_flash_timer = 0.2
+        # Effet visuel de dégâts (inutile hors écran)
+        if self.is_on_screen():
+            self.damage_flash_timer = 0.2
         
         # Application des dégâts
         is_dead = self.health.take_damage(effective_damage, damage_type)
@@ -495,7 +1086,7 @@ class Enemy(Entity):
         
         elif effect_type == "burn":
             damage_per_second = params.get('damage_per_second', 10)
-            self.health.add_damage_over_time(damage_per_second, duration, "fire")
+            self.health.add_damage_over_time(damage_per_second, duration, DamageType.FIRE)
         
         elif effect_type == "freeze":
             self.movement.add_speed_modifier(0.1, duration, "freeze_effect")
@@ -505,61 +1096,47 @@ class Enemy(Entity):
         if not self.health.is_alive:
             return
         
-        # Mise à jour des timers
-        self.behavior_timer += delta_time
-        
-        if self.damage_flash_timer > 0:
-            self.damage_flash_timer -= delta_time
-        
-        if self.spawn_animation_timer > 0:
-            self.spawn_animation_timer -= delta_time
+        # Ennemi isolé: passe système sur sa propre ligne
+        # (sinon c'est l'EnemyManager qui la fait pour tous les ennemis en bloc)
+        if self._owns_storage:
+            self.storage.system_update(delta_time)
         
+        self._update_entity(delta_time)
+    
+    def _update_entity(self, delta_time: float):
+        """
+        Partie par ennemi de la mise à jour, après EnemySoA.system_update
+        (effets à durée variable, sprite et état)
+        """
         # Mise à jour des composants
         self.health.update(delta_time)
         self.movement.update(delta_time)
         self.status_effects.update(delta_time)
         
-        # Mise à jour de la position du sprite
-        self.sprite.center_x, self.sprite.center_y = self.movement.position
-        
-        # Comportements spéciaux selon le type
-        self._update_special_behavior(delta_time)
+        # Mise à jour de la position du sprite (une seule écriture dans la SpriteList)
+        self.sprite.position = self.movement.position
         
         # Mise à jour de l'état
         self._update_state(delta_time)
     
-    def _update_special_behavior(self, delta_time: float):
-        """Met à jour les comportements spéciaux selon le type d'ennemi"""
-        if self.enemy_type == EnemyType.IRON_GOLEM and self.stats.can_regenerate:
-            # Régénération lente
-            if self.behavior_timer >= 2.0:  # Toutes les 2 secondes
-                if self.health.current_health < self.stats.max_health:
-                    self.health.heal(5)
-                self.behavior_timer = 0.0
-        
-        elif self.enemy_type == EnemyType.CYBER_SURVIVOR:
-            # Changement aléatoire de résistances
-            if self.behavior_timer >= 5.0:
-                self._randomize_cyber_resistances()
-                self.behavior_timer = 0.0
-        
-        elif self.enemy_type == EnemyType.LIGHTNING_DRONE:
-            # Comportement d'attaque en chaîne (pour plus tard)
-            pass
+    def _regenerate(self):
+        """Régénération lente de l'Iron Golem (appelée par EnemySoA.update_special_behaviors)"""
+        if self.health.current_health < self.health.max_health:
+            self.health.heal(5)
     
     def _randomize_cyber_resistances(self):
         """Change les résistances du Cyber Survivor aléatoirement"""
-        resistance_types = ['physical', 'fire', 'electric', 'ice']
-        chosen_type = random.choice(resistance_types)
-        
-        # Reset toutes les résistances
-        for res_type in resistance_types:
-            setattr(self.stats, f"{res_type}_resistance", 0.1)
+        index = Enemy._cyber_draw_index
+        chosen_type = _DAMAGE_TYPES[Enemy._cyber_draws[index]]
+        Enemy._cyber_draw_index = (index + 1) & (Enemy._CYBER_DRAWS_SIZE - 1)
         
-        # Boost une résistance aléatoire
-        setattr(self.stats, f"{chosen_type}_resistance", 0.8)
+        # Reset toutes les résistances puis boost d'une résistance aléatoire
+        resistances = self.stats.resistances
+        resistances[:] = 0.1
+        resistances[chosen_type] = 0.8
         
-        self.logger.debug(f"Cyber Survivor résistance changée vers {chosen_type}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Cyber Survivor résistance changée vers {chosen_type.name.lower()}")
     
     def _update_state(self, delta_time: float):
         """Met à jour l'état de l'ennemi"""
@@ -584,7 +1161,8 @@ class Enemy(Entity):
             self.stats.explosion_damage > 0):
             self._trigger_explosion()
         
-        self.logger.debug(f"Ennemi {self.enemy_type.value} mort")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Ennemi {self.enemy_type.key} mort")
     
     def _trigger_explosion(self):
         """Déclenche l'explosion du Steam Tank"""
@@ -600,85 +1178,113 @@ class Enemy(Entity):
         # Émission d'un événement pour l'explosion
         self.emit_event('enemy_explosion', explosion_data)
     
-    def render(self, renderer):
-        """Rendu personnalisé de l'ennemi"""
-        # Effet de flash quand l'ennemi prend des dégâts
-        if self.damage_flash_timer > 0:
-            # Teinte rouge temporaire
-            self.sprite.color = (255, 200, 200)
-        else:
-            self.sprite.color = (255, 255, 255)
+    def render(self, renderer, overlay: Optional[arcade.ShapeElementList] = None):
+        """
+        Rendu personnalisé de l'ennemi
         
-        # Animation de spawn
-        if self.spawn_animation_timer > 0:
-            scale_factor = 1.0 - (self.spawn_animation_timer * 0.5)
-            self.sprite.scale = max(0.5, scale_factor)
-        else:
-            self.sprite.scale = 1.0
+        Args:
+            renderer: Renderer du jeu
+            overlay: Liste de formes partagée où ajouter barre de vie et indicateurs
+                     (dessinée en un seul appel par l'appelant); si absente, une
+                     liste locale est créée et dessinée immédiatement
+        """
+        self._update_visuals()
         
         # Rendu du sprite principal
         self.sprite.draw()
         
+        draw_overlay = overlay is None
+        if draw_overlay:
+            overlay = arcade.ShapeElementList()
+        
+        self._append_overlays(overlay)
+        
+        if draw_overlay:
+            overlay.draw()
+    
+    def _update_visuals(self):
+        """
+        Met à jour la teinte et l'échelle du sprite (flash de dégâts, apparition)
+        Le sprite n'est modifié que lorsque l'état visuel change
+        """
+        # Effet de flash quand l'ennemi prend des dégâts (teinte rouge temporaire)
+        flashing = self.damage_flash_timer > 0
+        if flashing != self._flashing:
+            self._flashing = flashing
+            self.sprite.color = (255, 200, 200) if flashing else (255, 255, 255)
+        
+        # Animation de spawn
+        spawn_timer = self.spawn_animation_timer
+        if spawn_timer > 0:
+            scale_factor = 1.0 - (spawn_timer * 0.5)
+            self.sprite.scale = max(0.5, scale_factor)
+            self._spawn_scaled = True
+        elif self._spawn_scaled:
+            self.sprite.scale = 1.0
+            self._spawn_scaled = False
+    
+    def _append_overlays(self, overlay: arcade.ShapeElementList):
+        """Ajoute barre de vie et indicateurs de statut à la liste de formes"""
         # Barre de vie si l'ennemi est blessé
-        if self.health.current_health < self.stats.max_health:
-            self._render_health_bar(renderer)
+        if self.health.current_health < self.health.max_health:
+            self._append_health_bar(overlay)
         
         # Indicateurs d'effets de statut
-        self._render_status_indicators(renderer)
+        self._append_status_indicators(overlay)
     
-    def _render_health_bar(self, renderer):
-        """Affiche la barre de vie de l'ennemi"""
+    def _append_health_bar(self, overlay: arcade.ShapeElementList):
+        """Ajoute la barre de vie de l'ennemi à la liste de formes"""
         bar_width = 24
         bar_height = 4
         x = self.sprite.center_x - bar_width // 2
         y = self.sprite.center_y + self.sprite.height // 2 + 8
         
         # Fond de la barre (rouge)
-        arcade.draw_rectangle_filled(x + bar_width//2, y + bar_height//2, 
-                                   bar_width, bar_height, arcade.color.RED)
+        overlay.append(arcade.create_rectangle_filled(
+            x + bar_width//2, y + bar_height//2, bar_width, bar_height, arcade.color.RED
+        ))
         
         # Barre de vie (verte)
         health_percentage = self.health.get_health_percentage()
         health_width = int(bar_width * health_percentage)
         
         if health_width > 0:
-            arcade.draw_rectangle_filled(x + health_width//2, y + bar_height//2,
-                                       health_width, bar_height, arcade.color.GREEN)
+            overlay.append(arcade.create_rectangle_filled(
+                x + health_width//2, y + bar_height//2, health_width, bar_height, arcade.color.GREEN
+            ))
         
         # Contour
-        arcade.draw_rectangle_outline(x + bar_width//2, y + bar_height//2,
-                                    bar_width, bar_height, arcade.color.BLACK, 1)
+        overlay.append(arcade.create_rectangle_outline(
+            x + bar_width//2, y + bar_height//2, bar_width, bar_height, arcade.color.BLACK, 1
+        ))
     
-    def _render_status_indicators(self, renderer):
-        """Affiche les indicateurs d'effets de statut"""
+    def _append_status_indicators(self, overlay: arcade.ShapeElementList):
+        """Ajoute les indicateurs d'effets de statut à la liste de formes"""
+        # Effets actifs (l'étourdissement suit l'état réel du mouvement)
+        effect_bits = self.status_effects.effect_bits & ~EFFECT_STUN
+        if self.movement.is_stunned:
+            effect_bits |= EFFECT_STUN
+        
+        if not effect_bits:
+            return
+        
         indicator_size = 8
         indicator_y = self.sprite.center_y - self.sprite.height // 2 - 12
         indicator_x_start = self.sprite.center_x - 16
         
         indicator_index = 0
-        colors = SteampunkColors()
-        
-        # Indicateurs des effets actifs
-        if self.status_effects.has_effect('slow'):
-            arcade.draw_circle_filled(
-                indicator_x_start + indicator_index * (indicator_size + 2),
-                indicator_y, indicator_size // 2, colors.ELECTRIC_BLUE
-            )
-            indicator_index += 1
-        
-        if self.status_effects.has_effect('burn'):
-            arcade.draw_circle_filled(
-                indicator_x_start + indicator_index * (indicator_size + 2),
-                indicator_y, indicator_size // 2, colors.FIRE_ORANGE
-            )
-            indicator_index += 1
-        
-        if self.movement.is_stunned:
-            arcade.draw_circle_filled(
-                indicator_x_start + indicator_index * (indicator_size + 2),
-                indicator_y, indicator_size // 2, colors.GOLD
-            )
-            indicator_index += 1
+        for bit, color in _INDICATOR_TABLE:
+            if effect_bits & bit:
+                overlay.append(arcade.create_ellipse_filled(
+                    indicator_x_start + indicator_index * (indicator_size + 2),
+                    indicator_y, indicator_size, indicator_size, color, num_segments=12
+                ))
+                indicator_index += 1
+    
+    def cleanup(self):
+        """Nettoyage de l'ennemi et libération de sa ligne de stockage"""
+        self.release_storage()
+        super().cleanup()
     
     # ═══════════════════════════════════════════════════════════
     # PROPRIÉTÉS ET ACCESSEURS
@@ -688,6 +1294,37 @@ class Enemy(Entity):
         """Retourne si l'ennemi est vivant"""
         return self.health.is_alive
     
+    @property
+    def behavior_timer(self) -> float:
+        """Temps écoulé depuis le dernier comportement spécial"""
+        return float(self.storage.behavior_timer[self.soa_index])
+    
+    @behavior_timer.setter
+    def behavior_timer(self, value: float):
+        self.storage.behavior_timer[self.soa_index] = value
+    
+    @property
+    def damage_flash_timer(self) -> float:
+        """Durée restante du flash de dégâts"""
+        return float(self.storage.flash_timer[self.soa_index])
+    
+    @damage_flash_timer.setter
+    def damage_flash_timer(self, value: float):
+        self.storage.flash_timer[self.soa_index] = value
+    
+    @property
+    def spawn_animation_timer(self) -> float:
+        """Durée restante de l'animation d'apparition"""
+        return float(self.storage.spawn_timer[self.soa_index])
+    
+    @spawn_animation_timer.setter
+    def spawn_animation_timer(self, value: float):
+        self.storage.spawn_timer[self.soa_index] = value
+    
+    def is_on_screen(self) -> bool:
+        """Retourne si l'ennemi était visible lors du dernier rendu"""
+        return bool(self.storage.on_screen[self.soa_index])
+    
     def is_flying(self) -> bool:
         """Retourne si l'ennemi vole"""
         return self.stats.is_flying
@@ -702,39 +1339,20 @@ class Enemy(Entity):
     
     def get_reward(self) -> int:
         """Retourne la récompense pour tuer cet ennemi"""
-        return self.stats.reward
+        return int(self.stats.reward * self.level_multiplier)
     
     def get_distance_traveled(self) -> float:
         """Retourne la distance parcourue sur le chemin"""
-        if not self.movement.path:
-            return 0.0
-        
-        total_distance = 0.0
-        for i in range(self.movement.path_index):
-            if i + 1 < len(self.movement.path):
-                x1, y1 = self.movement.path[i]
-                x2, y2 = self.movement.path[i + 1]
-                total_distance += math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-        
-        # Distance partielle vers la cible actuelle
-        if self.movement.target_position and self.movement.path_index < len(self.movement.path):
-            current_x, current_y = self.movement.position
-            start_tile = self.movement.path[self.movement.path_index]
-            start_x, start_y = start_tile[0] * 32 + 16, start_tile[1] * 32 + 16
-            
-            partial_distance = math.sqrt((current_x - start_x) ** 2 + (current_y - start_y) ** 2)
-            total_distance += partial_distance
-        
-        return total_distance
+        return self.movement.get_distance_traveled()
     
     def get_debug_info(self) -> List[str]:
         """Retourne des informations de debug"""
         return [
-            f"Type: {self.enemy_type.value}",
-            f"HP: {self.health.current_health}/{self.stats.max_health}",
+            f"Type: {self.enemy_type.key}",
+            f"HP: {self.health.current_health}/{self.health.max_health}",
             f"Speed: {self.movement.current_speed:.1f}",
             f"Position: ({self.movement.position[0]:.1f}, {self.movement.position[1]:.1f})",
-            f"State: {self.state.value}",
+            f"State: {self.state.name.lower()}",
             f"Path: {self.movement.path_index}/{len(self.movement.path)}",
             f"Effects: {list(self.status_effects.active_effects.keys())}"
         ]
@@ -744,11 +1362,59 @@ class Enemy(Entity):
 # FACTORY POUR CRÉER LES ENNEMIS
 # ═══════════════════════════════════════════════════════════
 
+class EnemyPool:
+    """
+    Pool d'ennemis recyclés
+    Un ennemi retiré du jeu est conservé (composants, sprite, dicts d'effets)
+    puis réinitialisé au lieu d'être reconstruit au prochain spawn
+    """
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._free: deque = deque()
+    
+    def acquire(self, enemy_type: EnemyType, position: Tuple[float, float]) -> Optional[Enemy]:
+        """Retourne un ennemi recyclé et réinitialisé, ou None si le pool est vide"""
+        if not self._free:
+            return None
+        
+        enemy = self._free.pop()
+        enemy.reset(enemy_type, position)
+        return enemy
+    
+    def release(self, enemy: Enemy):
+        """Rend un ennemi au pool (ou le détruit si le pool est plein)"""
+        if len(self._free) >= self.max_size:
+            enemy.cleanup()
+            return
+        
+        enemy.release_storage()
+        self._free.append(enemy)
+    
+    def clear(self):
+        """Vide le pool"""
+        for enemy in self._free:
+            enemy.cleanup()
+        self._free.clear()
+    
+    def __len__(self) -> int:
+        return len(self._free)
+
+
 class EnemyFactory:
     """Factory pour créer des ennemis selon leur type"""
     
-    def __init__(self, sprite_factory: SteampunkSpriteFactory):
+    def __init__(self, sprite_factory: SteampunkSpriteFactory, storage: Optional[EnemySoA] = None):
         self.sprite_factory = sprite_factory
+        self.storage = storage  # Stockage partagé des ennemis créés (optionnel)
+        
+        # Une texture par type, créée une seule fois et partagée par tous les ennemis
+        self._textures: Dict[EnemyType, arcade.Texture] = {
+            enemy_type: sprite_factory.create_sprite(sprite_type)
+            for enemy_type, sprite_type in _SPRITE_TYPE_MAP.items()
+        }
+        # Les ennemis recyclés réutilisent leur ligne de stockage: pool seulement si partagé
+        self.pool: Optional[EnemyPool] = EnemyPool() if storage is not None else None
         self.logger = logging.getLogger('EnemyFactory')
     
     def create_enemy(self, enemy_type: EnemyType, position: Tuple[float, float], 
@@ -764,17 +1430,16 @@ class EnemyFactory:
         Returns:
             Enemy: Instance de l'ennemi créé
         """
-        enemy = Enemy(enemy_type, position, self.sprite_factory)
+        enemy = self.pool.acquire(enemy_type, position) if self.pool else None
+        if enemy is None:
+            enemy = Enemy(enemy_type, position, self.sprite_factory, self.storage, self._textures)
         
         # Application du multiplicateur de niveau
         if level_multiplier != 1.0:
-            enemy.stats.max_health = int(enemy.stats.max_health * level_multiplier)
-            enemy.health.max_health = enemy.stats.max_health
-            enemy.health.current_health = enemy.stats.max_health
-            enemy.stats.speed *= min(1.5, 1.0 + (level_multiplier - 1.0) * 0.3)  # Vitesse limitée
-            enemy.stats.reward = int(enemy.stats.reward * level_multiplier)
+            enemy.apply_level_multiplier(level_multiplier)
         
-        self.logger.debug(f"Ennemi créé: {enemy_type.value} (niveau {level_multiplier:.1f})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Ennemi créé: {enemy_type.key} (niveau {level_multiplier:.1f})")
         
         return enemy
     
@@ -794,7 +1459,7 @@ class EnemyFactory:
         level_multiplier = wave_config.get('level_multiplier', 1.0)
         
         for enemy_config in wave_config.get('enemies', []):
-            enemy_type = EnemyType(enemy_config['type'])
+            enemy_type = EnemyType.from_key(enemy_config['type'])
             count = enemy_config.get('count', 1)
             
             for _ in range(count):
@@ -803,4 +1468,144 @@ class EnemyFactory:
         
         self.logger.info(f"Vague créée: {len(enemies)} ennemis")
         
-        return enemies
\ No newline at end of file
+        return enemies
+
+
+# ═══════════════════════════════════════════════════════════
+# SYSTÈME DE GESTION DES ENNEMIS
+# ═══════════════════════════════════════════════════════════
+
+class EnemyManager:
+    """
+    Gestionnaire centralisé pour tous les ennemis
+    Les ennemis partagent un EnemySoA: le mouvement est calculé en une passe par frame
+    """
+    
+    def __init__(self, sprite_factory: SteampunkSpriteFactory, capacity: int = 256):
+        self.storage = EnemySoA(capacity)
+        self.factory = EnemyFactory(sprite_factory, self.storage)
+        self.enemies: List[Enemy] = []
+        self.spatial_hash = SpatialHash(cell_size=128)
+        self.sprite_list = arcade.SpriteList()  # Tous les sprites d'ennemis, dessinés en un appel
+        self.logger = logging.getLogger('EnemyManager')
+    
+    def spawn_enemy(self, enemy_type: EnemyType, position: Tuple[float, float],
+                    path: Optional[List[Tuple[int, int]]] = None,
+                    level_multiplier: float = 1.0) -> Enemy:
+        """Crée un ennemi dans le stockage partagé et l'ajoute au gestionnaire"""
+        enemy = self.factory.create_enemy(enemy_type, position, level_multiplier)
+        if path:
+            enemy.set_path(path)
+        
+        self.enemies.append(enemy)
+        self.spatial_hash.update(enemy)
+        self.sprite_list.append(enemy.sprite)
+        
+        row = enemy.soa_index
+        self.storage.alive[row] = True
+        self.storage.flying[row] = enemy.stats.is_flying
+        self.storage.health[row] = enemy.health.current_health
+        self.storage.distance[row] = enemy.get_distance_traveled()
+        return enemy
+    
+    def remove_enemy(self, enemy: Enemy) -> bool:
+        """Retire un ennemi et libère sa ligne de stockage"""
+        if enemy not in self.enemies:
+            return False
+        
+        self.enemies.remove(enemy)
+        self.spatial_hash.remove(enemy)
+        self.sprite_list.remove(enemy.sprite)
+        self.factory.pool.release(enemy)
+        return True
+    
+    def update(self, delta_time: float):
+        """Met à jour tous les ennemis"""
+        # Passe système groupée: DoT, timers, étourdissement, vitesse et déplacement
+        self.storage.system_update(delta_time)
+        
+        # Partie par ennemi et cellule du hachage spatial
+        spatial_hash = self.spatial_hash
+        for enemy in self.enemies:
+            if enemy.health.is_alive:
+                enemy._update_entity(delta_time)
+                spatial_hash.update(enemy)
+        
+        self._cleanup_dead_enemies()
+        self.refresh_soa()
+    
+    def refresh_soa(self):
+        """
+        Recopie dans le stockage en colonnes les données de ciblage des ennemis
+        (vivant, volant, PV, distance parcourue): une passe par frame, partagée
+        par toutes les tours au lieu d'une lecture d'attributs par tour et par ennemi
+        """
+        storage = self.storage
+        alive = storage.alive
+        flying = storage.flying
+        health = storage.health
+        distance = storage.distance
+        for enemy in self.enemies:
+            row = enemy.soa_index
+            alive[row] = enemy.health.is_alive
+            flying[row] = enemy.stats.is_flying
+            health[row] = enemy.health.current_health
+            distance[row] = enemy.get_distance_traveled()
+    
+    def _cleanup_dead_enemies(self):
+        """Retire les ennemis morts"""
+        dead_enemies = [enemy for enemy in self.enemies if not enemy.health.is_alive]
+        for enemy in dead_enemies:
+            self.remove_enemy(enemy)
+    
+    def render_all(self, renderer):
+        """
+        Rendu de tous les ennemis: sprites via la SpriteList, puis barres de vie et
+        indicateurs en un seul lot
+        Teinte, échelle et indicateurs ne sont calculés que pour les ennemis visibles
+        """
+        visible_enemies = self.get_visible_enemies(renderer)
+        
+        overlay = arcade.ShapeElementList()
+        for enemy in visible_enemies:
+            enemy._update_visuals()
+            enemy._append_overlays(overlay)
+        
+        self.sprite_list.draw()
+        overlay.draw()
+    
+    def get_visible_enemies(self, renderer) -> List[Enemy]:
+        """Détermine les ennemis visibles et met à jour leur indicateur on_screen"""
+        on_screen = self.storage.on_screen
+        
+        if renderer is None or not getattr(renderer, 'enable_culling', False):
+            on_screen[:] = True
+            return self.enemies
+        
+        visible_enemies = self.spatial_hash.query_rect(*renderer.render_bounds)
+        on_screen[:] = False
+        on_screen[[enemy.soa_index for enemy in visible_enemies]] = True
+        return visible_enemies
+    
+    def get_enemies_in_radius(self, center: Tuple[float, float], radius: float) -> List[Enemy]:
+        """Retourne les ennemis dans un rayon donné (via le hachage spatial)"""
+        return self.spatial_hash.query_radius(center[0], center[1], radius)
+    
+    def get_enemies(self) -> List[Enemy]:
+        """Retourne la liste des ennemis actifs"""
+        return self.enemies
+    
+    def get_enemy_count(self) -> int:
+        """Retourne le nombre d'ennemis actifs"""
+        return len(self.enemies)
+    
+    def clear_all(self):
+        """Supprime tous les ennemis"""
+        count = len(self.enemies)
+        for enemy in self.enemies:
+            enemy.cleanup()
+        self.enemies.clear()
+        self.spatial_hash.clear()
+        self.sprite_list = arcade.SpriteList()
+        self.factory.pool.clear()
+        self.logger.info(f"Tous les ennemis supprimés ({count})")
@@ -6,11 +6,15 @@ Architecture Entity-Component-System (ECS) pour la modularité
 
 import logging
 import uuid
-from typing import Dict, List, Optional, Type, Any, Callable, Set
+import itertools
+from typing import Dict, List, Optional, Type, Any, Callable, Set, Tuple, Iterator
 from abc import ABC, abstractmethod
 from enum import Enum
+from collections import deque, defaultdict
 import weakref
 import time
+import copy
+import numpy as np
 
 
 class ComponentType(Enum):
@@ -28,12 +32,86 @@ class ComponentType(Enum):
     ECONOMY = "economy"
 
 
+class ComponentRegistry:
+    """
+    Registre des types de composants
+    Attribue à chaque sous-classe d'EntityComponent un identifiant entier
+    (index dans le tableau de composants d'une entité) et un bit de masque
+    """
+    
+    _next_id = 0
+    _types: List[Type['EntityComponent']] = []
+    
+    @classmethod
+    def register(cls, component_class: Type['EntityComponent']) -> Tuple[int, int]:
+        """
+        Enregistre un type de composant
+        
+        Returns:
+            (TYPE_ID, TYPE_MASK) du type
+        """
+        type_id = cls._next_id
+        cls._next_id += 1
+        cls._types.append(component_class)
+        return type_id, 1 << type_id
+    
+    @classmethod
+    def capacity(cls) -> int:
+        """Nombre de types de composants enregistrés"""
+        return cls._next_id
+
+
+class ComponentMapper:
+    """
+    Accès direct à un type de composant: l'identifiant et le masque du type
+    sont capturés une fois, get(entity) se réduit à un test de bit et un index
+    """
+    
+    __slots__ = ('_index', '_mask')
+    
+    _mappers: Dict[type, 'ComponentMapper'] = {}
+    
+    def __init__(self, component_class: Type['EntityComponent']):
+        self._index = component_class.TYPE_ID
+        self._mask = component_class.TYPE_MASK
+    
+    @classmethod
+    def for_(cls, component_class: Type['EntityComponent']) -> 'ComponentMapper':
+        """Mapper partagé d'un type de composant (créé à la première demande)"""
+        mapper = cls._mappers.get(component_class)
+        if mapper is None:
+            mapper = cls(component_class)
+            cls._mappers[component_class] = mapper
+        return mapper
+    
+    def get(self, entity: 'Entity') -> Optional['EntityComponent']:
+        """Composant de l'entité, ou None"""
+        if entity._component_mask & self._mask:
+            return entity._components[self._index]
+        return None
+    
+    def has(self, entity: 'Entity') -> bool:
+        """Vérifie si l'entité possède le composant"""
+        return bool(entity._component_mask & self._mask)
+
+
 class EntityComponent(ABC):
     """
     Classe de base pour tous les composants d'entité
     Un composant représente un aspect spécifique d'une entité (santé, mouvement, etc.)
     """
     
+    __slots__ = ('entity', 'enabled', 'component_type', 'created_at', 'last_update_frame',
+                 '_event_handlers', '_system_index')
+    
+    # Attribués par ComponentRegistry à chaque sous-classe
+    TYPE_ID = -1
+    TYPE_MASK = 0
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.TYPE_ID, cls.TYPE_MASK = ComponentRegistry.register(cls)
+    
     def __init__(self):
         self.entity: Optional['Entity'] = None
         self.enabled = True
@@ -41,10 +119,13 @@ class EntityComponent(ABC):
         
         # Métadonnées
         self.created_at = time.time()
-        self.last_updated = time.time()
+        self.last_update_frame = EntityManager.current_frame
         
         # Événements
-        self._event_handlers: Dict[str, List[Callable]] = {}
+        self._event_handlers: Dict[str, Tuple[Callable, ...]] = {}
+        
+        # Position dans la liste de système de l'EntityManager (-1: hors système)
+        self._system_index = -1
     
     def _get_component_type(self) -> str:
         """Retourne le type de composant (basé sur le nom de classe par défaut)"""
@@ -62,7 +143,7 @@ class EntityComponent(ABC):
             delta_time: Temps écoulé depuis la dernière mise à jour
         """
         if self.enabled:
-            self.last_updated = time.time()
+            self.last_update_frame = EntityManager.current_frame
     
     def on_attached(self):
         """Appelé quand le composant est attaché à une entité"""
@@ -90,19 +171,30 @@ class EntityComponent(ABC):
                 self.on_disabled()
     
     def subscribe_to_event(self, event_type: str, handler: Callable):
-        """S'abonne à un événement de l'entité"""
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
-        self._event_handlers[event_type].append(handler)
-    
-    def handle_event(self, event_type: str, data: Any = None):
-        """Gère un événement"""
-        if event_type in self._event_handlers:
-            for handler in self._event_handlers[event_type]:
-                try:
-                    handler(data)
-                except Exception as e:
-                    logging.getLogger('EntityComponent').error(f"Erreur dans le gestionnaire d'événement: {e}")
+        """S'abonne à un événement de l'entité (gestionnaires stockés en tuple)"""
+        self._event_handlers[event_type] = self._event_handlers.get(event_type, ()) + (handler,)
+    
+    def handle_event_safe(self, event_type: str, data: Any = None):
+        """Gère un événement (erreurs des gestionnaires journalisées)"""
+        handlers = self._event_handlers.get(event_type)
+        if handlers is None:
+            return
+        for handler in handlers:
+            try:
+                handler(data)
+            except Exception as e:
+                logging.getLogger('EntityComponent').error(f"Erreur dans le gestionnaire d'événement: {e}")
+    
+    def handle_event_fast(self, event_type: str, data: Any = None):
+        """Gère un événement sans protection try/except (exécution optimisée, python -O)"""
+        handlers = self._event_handlers.get(event_type)
+        if handlers is None:
+            return
+        for handler in handlers:
+            handler(data)
+    
+    # Version choisie au chargement du module selon le mode d'exécution
+    handle_event = handle_event_safe if __debug__ else handle_event_fast
     
     def get_debug_info(self) -> Dict[str, Any]:
         """Retourne des informations de debug"""
@@ -110,10 +202,33 @@ class EntityComponent(ABC):
             'type': self.component_type,
             'enabled': self.enabled,
             'created_at': self.created_at,
-            'last_updated': self.last_updated,
+            'last_update_frame': self.last_update_frame,
             'entity_id': self.entity.entity_id if self.entity else None
         }
     
+    def reset(self):
+        """
+        Réinitialise le composant pour sa réutilisation (ComponentPool)
+        Les sous-classes recyclables redéfinissent reset en acceptant les
+        arguments de leur constructeur
+        """
+        self.enabled = True
+        self.created_at = time.time()
+        self.last_update_frame = EntityManager.current_frame
+    
+    def clone(self) -> 'EntityComponent':
+        """
+        Copie superficielle du composant (attributs de slots et __dict__),
+        détachée de toute entité et sans gestionnaires d'événements
+        """
+        new_component = copy.copy(self)
+        new_component.entity = None
+        new_component._event_handlers = {}
+        new_component._system_index = -1
+        new_component.created_at = time.time()
+        new_component.last_update_frame = EntityManager.current_frame
+        return new_component
+    
     def cleanup(self):
         """Nettoyage du composant"""
         self._event_handlers.clear()
@@ -126,35 +241,79 @@ class Entity:
     Une entité est un conteneur pour des composants
     """
     
-    def __init__(self, entity_id: Optional[str] = None):
+    __slots__ = ('entity_id', '_uuid', '_components', '_component_mask', '_component_list', 'tags',
+                 'created_at', 'last_update_frame', 'is_active', 'is_destroyed',
+                 '_parent_ref', 'children', '_event_system', '_local_event_handlers',
+                 '_manager', '_archetype', '_archetype_row', '_position_slot', '__weakref__')
+    
+    # Un logger par classe (les sous-classes peuvent le redéfinir par instance)
+    logger = logging.getLogger('Entity.Entity')
+    
+    # Identifiants entiers croissants (hachage immédiat, clés compactes)
+    _id_counter = itertools.count(1)
+    
+    # Vrai si update() n'est pas redéfini: les composants sont alors mis à jour
+    # par les systèmes de l'EntityManager (voir EntityManager.run_system)
+    _system_updated = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'logger' not in cls.__dict__:
+            cls.logger = logging.getLogger(f'Entity.{cls.__name__}')
+        cls._system_updated = cls.update is Entity.update
+    
+    def __init__(self, entity_id: Optional[int] = None):
         """
         Initialise une entité
         
         Args:
             entity_id: Identifiant unique (généré automatiquement si None)
         """
-        self.entity_id = entity_id or str(uuid.uuid4())
-        self.components: Dict[Type[EntityComponent], EntityComponent] = {}
+        self.entity_id = entity_id if entity_id is not None else Entity._next_id()
+        self._uuid: Optional[str] = None
+        
+        # Composants: tableau indexé par TYPE_ID + masque de bits des types présents
+        # (_component_list garde les composants attachés, denses, pour l'itération)
+        self._components: List[Optional[EntityComponent]] = [None] * ComponentRegistry.capacity()
+        self._component_mask = 0
+        self._component_list: List[EntityComponent] = []
         self.tags: Set[str] = set()
         
         # Métadonnées
         self.created_at = time.time()
-        self.last_updated = time.time()
+        self.last_update_frame = EntityManager.current_frame
         self.is_active = True
         self.is_destroyed = False
         
         # Hiérarchie d'entités
-        self.parent: Optional['Entity'] = None
-        self.children: List['Entity'] = []
+        # (références faibles: un enfant ou un parent abandonné peut être collecté)
+        self._parent_ref: Optional[weakref.ReferenceType] = None
+        self.children: weakref.WeakSet = weakref.WeakSet()
         
         # Événements
         self._event_system: Optional[Any] = None  # Référence au système d'événements global
-        self._local_event_handlers: Dict[str, List[Callable]] = {}
+        self._local_event_handlers: Dict[str, Tuple[Callable, ...]] = {}
         
-        # Logger
-        self.logger = logging.getLogger(f'Entity.{self.__class__.__name__}')
+        # Rangement dans l'EntityManager (table d'archétype et ligne)
+        self._manager: Optional[weakref.ReferenceType] = None
+        self._archetype: Optional['Archetype'] = None
+        self._archetype_row = -1
+        self._position_slot = -1
         
-        self.logger.debug(f"Entité créée: {self.entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité créée: {self.entity_id}")
+    
+    @staticmethod
+    def _next_id() -> int:
+        """Prochain identifiant d'entité"""
+        return next(Entity._id_counter)
+    
+    @property
+    def uuid(self) -> str:
+        """UUID textuel, généré à la première demande (identifiant externe)"""
+        if self._uuid is None:
+            self._uuid = str(uuid.uuid4())
+        return self._uuid
     
     def add_component(self, component: EntityComponent) -> EntityComponent:
         """
@@ -168,15 +327,24 @@ class Entity:
         """
         component_type = type(component)
         
-        if component_type in self.components:
+        if self._component_mask & component_type.TYPE_MASK:
             self.logger.warning(f"Remplacement du composant {component_type.__name__}")
             self.remove_component(component_type)
         
-        self.components[component_type] = component
+        # Types enregistrés après la création de l'entité
+        type_id = component_type.TYPE_ID
+        if type_id >= len(self._components):
+            self._components.extend([None] * (ComponentRegistry.capacity() - len(self._components)))
+        
+        self._components[type_id] = component
+        self._component_mask |= component_type.TYPE_MASK
+        self._component_list.append(component)
         component.set_entity(self)
         component.on_attached()
+        self._notify_components_changed(component, True)
         
-        self.logger.debug(f"Composant ajouté: {component_type.__name__}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Composant ajouté: {component_type.__name__}")
         
         return component
     
@@ -190,13 +358,17 @@ class Entity:
         Returns:
             True si le composant a été supprimé
         """
-        if component_type in self.components:
-            component = self.components[component_type]
+        if self._component_mask & component_type.TYPE_MASK:
+            component = self._components[component_type.TYPE_ID]
             component.on_detached()
             component.cleanup()
-            del self.components[component_type]
+            self._components[component_type.TYPE_ID] = None
+            self._component_mask &= ~component_type.TYPE_MASK
+            self._component_list.remove(component)
+            self._notify_components_changed(component, False)
             
-            self.logger.debug(f"Composant supprimé: {component_type.__name__}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Composant supprimé: {component_type.__name__}")
             return True
         
         return False
@@ -211,7 +383,9 @@ class Entity:
         Returns:
             Le composant ou None s'il n'existe pas
         """
-        return self.components.get(component_type)
+        if self._component_mask & component_type.TYPE_MASK:
+            return self._components[component_type.TYPE_ID]
+        return None
     
     def has_component(self, component_type: Type[EntityComponent]) -> bool:
         """
@@ -223,7 +397,18 @@ class Entity:
         Returns:
             True si le composant existe
         """
-        return component_type in self.components
+        return bool(self._component_mask & component_type.TYPE_MASK)
+    
+    def _notify_components_changed(self, component: EntityComponent, added: bool):
+        """Signale au gestionnaire l'ajout ou le retrait d'un composant (index, archétype, systèmes)"""
+        manager = self._manager() if self._manager else None
+        if manager is not None:
+            manager._on_component_changed(self, component, added)
+    
+    @property
+    def components(self) -> Dict[Type[EntityComponent], EntityComponent]:
+        """Vue dictionnaire {type: composant} (compatibilité, construite à la demande)"""
+        return {type(component): component for component in self._component_list}
     
     def get_components_of_type(self, base_type: Type[EntityComponent]) -> List[EntityComponent]:
         """
@@ -237,7 +422,7 @@ class Entity:
         """
         matching_components = []
         
-        for component in self.components.values():
+        for component in self._component_list:
             if isinstance(component, base_type):
                 matching_components.append(component)
         
@@ -246,7 +431,8 @@ class Entity:
     def add_tag(self, tag: str):
         """Ajoute un tag à l'entité"""
         self.tags.add(tag)
-        self.logger.debug(f"Tag ajouté: {tag}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Tag ajouté: {tag}")
     
     def remove_tag(self, tag: str) -> bool:
         """
@@ -257,7 +443,8 @@ class Entity:
         """
         if tag in self.tags:
             self.tags.remove(tag)
-            self.logger.debug(f"Tag supprimé: {tag}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Tag supprimé: {tag}")
             return True
         return False
     
@@ -271,9 +458,11 @@ class Entity:
             child.parent.remove_child(child)
         
         child.parent = self
-        self.children.append(child)
+        self.children.add(child)
+        self._notify_hierarchy_changed()
         
-        self.logger.debug(f"Enfant ajouté: {child.entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Enfant ajouté: {child.entity_id}")
     
     def remove_child(self, child: 'Entity') -> bool:
         """
@@ -284,18 +473,41 @@ class Entity:
         """
         if child in self.children:
             child.parent = None
-            self.children.remove(child)
-            self.logger.debug(f"Enfant supprimé: {child.entity_id}")
+            self.children.discard(child)
+            self._notify_hierarchy_changed()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Enfant supprimé: {child.entity_id}")
             return True
         return False
     
-    def get_children_with_tag(self, tag: str) -> List['Entity']:
-        """Récupère tous les enfants avec un tag donné"""
-        return [child for child in self.children if child.has_tag(tag)]
+    def _notify_hierarchy_changed(self):
+        """Invalide l'ordre de mise à jour du gestionnaire (premier ancêtre géré)"""
+        entity = self
+        while entity is not None:
+            manager = entity._manager() if entity._manager else None
+            if manager is not None:
+                manager._hierarchy_dirty = True
+                return
+            entity = entity.parent
+    
+    @property
+    def parent(self) -> Optional['Entity']:
+        """Entité parente (None si aucune ou si elle a été collectée)"""
+        return None if self._parent_ref is None else self._parent_ref()
+    
+    @parent.setter
+    def parent(self, parent: Optional['Entity']):
+        self._parent_ref = None if parent is None else weakref.ref(parent)
+    
+    def get_children_with_tag(self, tag: str) -> Iterator['Entity']:
+        """Parcourt les enfants avec un tag donné"""
+        return (child for child in self.children if child.has_tag(tag))
     
     def update(self, delta_time: float):
         """
         Met à jour l'entité et tous ses composants
+        Les enfants ne sont pas mis à jour ici: l'EntityManager parcourt
+        la hiérarchie à plat, parents avant enfants
         
         Args:
             delta_time: Temps écoulé depuis la dernière mise à jour
@@ -303,19 +515,21 @@ class Entity:
         if not self.is_active or self.is_destroyed:
             return
         
-        self.last_updated = time.time()
-        
-        # Mise à jour des composants
-        for component in self.components.values():
-            if component.enabled:
-                try:
+        self.last_update_frame = EntityManager.current_frame
+        
+        # Mise à jour des composants (erreurs journalisées hors python -O)
+        components = self._component_list
+        if __debug__:
+            for component in components:
+                if component.enabled:
+                    try:
+                        component.update(delta_time)
+                    except Exception as e:
+                        self.logger.error(f"Erreur lors de la mise à jour du composant {type(component).__name__}: {e}")
+        else:
+            for component in components:
+                if component.enabled:
                     component.update(delta_time)
-                except Exception as e:
-                    self.logger.error(f"Erreur lors de la mise à jour du composant {type(component).__name__}: {e}")
-        
-        # Mise à jour des enfants
-        for child in self.children:
-            child.update(delta_time)
     
     def set_active(self, active: bool):
         """Active ou désactive l'entité"""
@@ -340,7 +554,7 @@ class Entity:
         self.is_active = False
         
         # Destruction des enfants
-        for child in self.children[:]:  # Copie pour éviter les modifications pendant l'itération
+        for child in list(self.children):  # Copie pour éviter les modifications pendant l'itération
             child.destroy()
         
         # Détachement du parent
@@ -348,7 +562,8 @@ class Entity:
             self.parent.remove_child(self)
         
         self.on_destroyed()
-        self.logger.debug(f"Entité détruite: {self.entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité détruite: {self.entity_id}")
     
     def set_event_system(self, event_system):
         """Définit le système d'événements global"""
@@ -362,6 +577,10 @@ class Entity:
             event_type: Type d'événement
             data: Données de l'événement
         """
+        # Rien à faire sans gestionnaire local, composant ni système global
+        if not self._local_event_handlers and not self._component_list and self._event_system is None:
+            return
+        
         # Événement local
         self.handle_local_event(event_type, data)
         
@@ -370,25 +589,37 @@ class Entity:
             self._event_system.emit(event_type, data, source=self.entity_id)
     
     def subscribe_to_event(self, event_type: str, handler: Callable):
-        """S'abonne à un événement local"""
-        if event_type not in self._local_event_handlers:
-            self._local_event_handlers[event_type] = []
-        self._local_event_handlers[event_type].append(handler)
+        """S'abonne à un événement local (gestionnaires stockés en tuple)"""
+        self._local_event_handlers[event_type] = self._local_event_handlers.get(event_type, ()) + (handler,)
     
-    def handle_local_event(self, event_type: str, data: Any = None):
-        """Gère un événement local"""
+    def handle_local_event_safe(self, event_type: str, data: Any = None):
+        """Gère un événement local (erreurs des gestionnaires journalisées)"""
         # Gestionnaires locaux
-        if event_type in self._local_event_handlers:
-            for handler in self._local_event_handlers[event_type]:
+        handlers = self._local_event_handlers.get(event_type)
+        if handlers is not None:
+            for handler in handlers:
                 try:
                     handler(data)
                 except Exception as e:
                     self.logger.error(f"Erreur dans le gestionnaire d'événement local: {e}")
         
         # Propagation aux composants
-        for component in self.components.values():
+        for component in self._component_list:
+            component.handle_event(event_type, data)
+    
+    def handle_local_event_fast(self, event_type: str, data: Any = None):
+        """Gère un événement local sans protection try/except (exécution optimisée, python -O)"""
+        handlers = self._local_event_handlers.get(event_type)
+        if handlers is not None:
+            for handler in handlers:
+                handler(data)
+        
+        for component in self._component_list:
             component.handle_event(event_type, data)
     
+    # Version choisie au chargement du module selon le mode d'exécution
+    handle_local_event = handle_local_event_safe if __debug__ else handle_local_event_fast
+    
     def on_activated(self):
         """Appelé quand l'entité est activée"""
         pass
@@ -403,11 +634,20 @@ class Entity:
     
     def cleanup(self):
         """Nettoyage complet de l'entité"""
+        self._reset_for_pool()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité nettoyée: {self.entity_id}")
+    
+    def _reset_for_pool(self):
+        """Vide l'entité (composants, tags, enfants, gestionnaires) sans réallouer ses conteneurs"""
         # Nettoyage des composants
-        for component in list(self.components.values()):
+        components = self._components
+        for component in self._component_list:
             component.cleanup()
+            components[type(component).TYPE_ID] = None
         
-        self.components.clear()
+        self._component_mask = 0
+        self._component_list.clear()
         
         # Nettoyage des références
         self._local_event_handlers.clear()
@@ -415,10 +655,17 @@ class Entity:
         self.children.clear()
         self.parent = None
         self._event_system = None
-        
-        self.logger.debug(f"Entité nettoyée: {self.entity_id}")
     
-    def clone(self, new_id: Optional[str] = None) -> 'Entity':
+    def _reset(self, entity_id: Optional[int] = None):
+        """Réactive une entité sortie d'un EntityPool avec un nouvel identifiant"""
+        self.entity_id = entity_id if entity_id is not None else Entity._next_id()
+        self._uuid = None
+        self.created_at = time.time()
+        self.last_update_frame = EntityManager.current_frame
+        self.is_active = True
+        self.is_destroyed = False
+    
+    def clone(self, new_id: Optional[int] = None) -> 'Entity':
         """
         Crée une copie de l'entité
         
@@ -435,23 +682,11 @@ class Entity:
         cloned_entity.tags = self.tags.copy()
         
         # Copie des composants (attention: copie superficielle)
-        for component_type, component in self.components.items():
-            # Création d'un nouveau composant du même type
-            new_component = component_type()
-            
-            # Copie des attributs publics
-            for attr_name in dir(component):
-                if not attr_name.startswith('_') and hasattr(new_component, attr_name):
-                    attr_value = getattr(component, attr_name)
-                    if not callable(attr_value):
-                        try:
-                            setattr(new_component, attr_name, attr_value)
-                        except AttributeError:
-                            pass  # Attribut en lecture seule
-            
-            cloned_entity.add_component(new_component)
+        for component in self._component_list:
+            cloned_entity.add_component(component.clone())
         
-        self.logger.debug(f"Entité clonée: {self.entity_id} -> {cloned_entity.entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité clonée: {self.entity_id} -> {cloned_entity.entity_id}")
         return cloned_entity
     
     def get_debug_info(self) -> Dict[str, Any]:
@@ -469,7 +704,7 @@ class Entity:
             'is_active': self.is_active,
             'is_destroyed': self.is_destroyed,
             'created_at': self.created_at,
-            'last_updated': self.last_updated,
+            'last_update_frame': self.last_update_frame,
             'tags': list(self.tags),
             'components': component_info,
             'children_count': len(self.children),
@@ -478,10 +713,10 @@ class Entity:
     
     def __str__(self) -> str:
         """Représentation textuelle de l'entité"""
-        components_str = ', '.join([comp.__class__.__name__ for comp in self.components.values()])
+        components_str = ', '.join([comp.__class__.__name__ for comp in self._component_list])
         tags_str = ', '.join(self.tags) if self.tags else 'aucun'
         
-        return (f"Entity({self.__class__.__name__}, id={self.entity_id[:8]}..., "
+        return (f"Entity({self.__class__.__name__}, id={self.entity_id}, "
                 f"components=[{components_str}], tags=[{tags_str}], "
                 f"active={self.is_active})")
     
@@ -489,24 +724,275 @@ class Entity:
         return self.__str__()
 
 
+# ═══════════════════════════════════════════════════════════
+# POOLS D'OBJETS
+# ═══════════════════════════════════════════════════════════
+
+class EntityPool:
+    """
+    Pool d'entités d'une classe donnée
+    Les entités libérées gardent leurs conteneurs (tableau de composants, tags,
+    enfants...) et sont réactivées au lieu d'être recréées
+    """
+    
+    def __init__(self, entity_class: Type[Entity], max_size: int = 256):
+        self.entity_class = entity_class
+        self.max_size = max_size
+        self._free: List[Entity] = []
+    
+    def acquire(self, entity_id: Optional[int] = None) -> Entity:
+        """Retourne une entité recyclée, ou une nouvelle si le pool est vide"""
+        if self._free:
+            entity = self._free.pop()
+            entity._reset(entity_id)
+            return entity
+        return self.entity_class(entity_id)
+    
+    def release(self, entity: Entity):
+        """Vide une entité et la rend au pool (abandonnée si le pool est plein)"""
+        entity._reset_for_pool()
+        if len(self._free) < self.max_size:
+            self._free.append(entity)
+    
+    def clear(self):
+        """Vide le pool"""
+        self._free.clear()
+
+
+class ComponentPool:
+    """
+    Pool de composants d'une classe donnée
+    Un composant recyclé est réinitialisé par reset(*args, **kwargs), qui doit
+    accepter les mêmes arguments que le constructeur
+    """
+    
+    def __init__(self, component_class: Type[EntityComponent], max_size: int = 256):
+        self.component_class = component_class
+        self.max_size = max_size
+        self._free: List[EntityComponent] = []
+    
+    def acquire(self, *args, **kwargs) -> EntityComponent:
+        """Retourne un composant recyclé, ou un nouveau si le pool est vide"""
+        if self._free:
+            component = self._free.pop()
+            component.reset(*args, **kwargs)
+            return component
+        return self.component_class(*args, **kwargs)
+    
+    def release(self, component: EntityComponent):
+        """Rend un composant détaché au pool (abandonné si le pool est plein)"""
+        component.cleanup()
+        if len(self._free) < self.max_size:
+            self._free.append(component)
+    
+    def clear(self):
+        """Vide le pool"""
+        self._free.clear()
+
+
 # ═══════════════════════════════════════════════════════════
 # SYSTÈME DE GESTION DES ENTITÉS
 # ═══════════════════════════════════════════════════════════
 
+class Archetype:
+    """
+    Table des entités partageant exactement le même ensemble de composants
+    Stockage SoA: un tableau par type de composant, aligné sur la liste des entités
+    (la ligne i de chaque tableau appartient à entities[i])
+    """
+    
+    __slots__ = ('mask', 'type_ids', 'component_arrays', 'entities', 'run')
+    
+    def __init__(self, mask: int):
+        self.mask = mask
+        self.type_ids = [type_id for type_id in range(mask.bit_length()) if mask >> type_id & 1]
+        self.component_arrays: Dict[int, List[EntityComponent]] = {type_id: [] for type_id in self.type_ids}
+        self.entities: List[Entity] = []
+        self.run: Optional[Callable[['Archetype', float], None]] = None  # Boucle générée (compile)
+    
+    def compile(self):
+        """
+        Génère la boucle de mise à jour spécialisée de l'archétype: les tableaux
+        de composants sont liés une fois et les appels update() sont déroulés
+        """
+        lines = ["def _run(archetype, delta_time):",
+                 "    entities = archetype.entities"]
+        for index, type_id in enumerate(self.type_ids):
+            lines.append(f"    a{index} = archetype.component_arrays[{type_id}]"
+                         f"  # {ComponentRegistry._types[type_id].__name__}")
+        lines += ["    for i in range(len(entities)):",
+                  "        entity = entities[i]",
+                  "        if not entity._system_updated or not entity.is_active or entity.is_destroyed:",
+                  "            continue"]
+        for index in range(len(self.type_ids)):
+            lines += [f"        c = a{index}[i]",
+                      "        if c.enabled:",
+                      "            c.update(delta_time)"]
+        
+        namespace: Dict[str, Any] = {}
+        exec(compile("\n".join(lines), f"<archetype {self.mask:#x}>", "exec"), namespace)
+        self.run = namespace['_run']
+    
+    def add(self, entity: Entity) -> int:
+        """Ajoute une entité en fin de table et retourne sa ligne"""
+        row = len(self.entities)
+        self.entities.append(entity)
+        for type_id in self.type_ids:
+            self.component_arrays[type_id].append(entity._components[type_id])
+        return row
+    
+    def remove(self, row: int):
+        """Retire une ligne (la dernière ligne prend sa place)"""
+        last = len(self.entities) - 1
+        moved = self.entities[last]
+        self.entities[row] = moved
+        self.entities.pop()
+        for type_id in self.type_ids:
+            array = self.component_arrays[type_id]
+            array[row] = array[last]
+            array.pop()
+        moved._archetype_row = row
+    
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
+# ═══════════════════════════════════════════════════════════
+# NOYAUX DE CALCUL VECTORISÉS
+# ═══════════════════════════════════════════════════════════
+
+def radius_filter(pos_x: np.ndarray, pos_y: np.ndarray, slots: np.ndarray,
+                  center_x: float, center_y: float, radius_squared: float,
+                  dx: np.ndarray, dy: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Teste si les positions d'indices slots sont dans le cercle
+    Les calculs se font dans les tampons dx/dy/out fournis (taille len(slots)),
+    sans tableau temporaire
+    
+    Returns:
+        np.ndarray: out, masque des positions dans le rayon
+    """
+    np.take(pos_x, slots, out=dx)
+    np.take(pos_y, slots, out=dy)
+    dx -= center_x
+    dy -= center_y
+    dx *= dx
+    dy *= dy
+    dx += dy
+    return np.less_equal(dx, radius_squared, out=out)
+
+
+class SpatialGrid:
+    """
+    Grille spatiale uniforme des entités positionnées
+    La taille de cellule doit être de l'ordre du rayon de recherche typique
+    """
+    
+    def __init__(self, cell_size: float = 128.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[Entity]] = {}
+        self._cell_of: Dict[int, Tuple[int, int]] = {}
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Cellule contenant un point"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+    
+    def update(self, entity: Entity, x: float, y: float):
+        """Insère une entité ou la déplace si elle a changé de cellule"""
+        cell = self._cell(x, y)
+        old_cell = self._cell_of.get(entity.entity_id)
+        if old_cell == cell:
+            return
+        
+        if old_cell is not None:
+            self._remove_from_cell(entity, old_cell)
+        
+        self.cells.setdefault(cell, set()).add(entity)
+        self._cell_of[entity.entity_id] = cell
+    
+    def remove(self, entity: Entity):
+        """Retire une entité de la grille"""
+        cell = self._cell_of.pop(entity.entity_id, None)
+        if cell is not None:
+            self._remove_from_cell(entity, cell)
+    
+    def _remove_from_cell(self, entity: Entity, cell: Tuple[int, int]):
+        bucket = self.cells[cell]
+        bucket.discard(entity)
+        if not bucket:
+            del self.cells[cell]
+    
+    def query_radius(self, center_x: float, center_y: float, radius: float) -> List[Entity]:
+        """Retourne les entités des cellules qui chevauchent le carré englobant du cercle"""
+        min_cx, min_cy = self._cell(center_x - radius, center_y - radius)
+        max_cx, max_cy = self._cell(center_x + radius, center_y + radius)
+        
+        result = []
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    result.extend(bucket)
+        return result
+    
+    def clear(self):
+        """Vide la grille"""
+        self.cells.clear()
+        self._cell_of.clear()
+
+
 class EntityManager:
     """
     Gestionnaire centralisé pour toutes les entités du jeu
     Implémente le pattern Entity Manager pour optimiser les opérations
     """
     
-    def __init__(self):
-        self.entities: Dict[str, Entity] = {}
+    # Numéro de frame, incrémenté à chaque update_all (horodatage des mises à jour)
+    current_frame = 0
+    
+    def __init__(self, cell_size: float = 128.0, capacity: int = 256, codegen: bool = False):
+        self.entities: Dict[int, Entity] = {}
         self.entities_by_tag: Dict[str, Set[Entity]] = {}
         self.entities_by_type: Dict[Type[Entity], Set[Entity]] = {}
         
+        # Tables d'archétypes, indexées par masque de composants
+        self.archetypes: Dict[int, Archetype] = {}
+        
+        # Index inverse par type de composant (+ cache des requêtes, vidé à chaque ajout/retrait)
+        self.entities_by_component: Dict[Type[EntityComponent], Set[Entity]] = {}
+        self._query_cache: Dict[frozenset, Tuple[Entity, ...]] = {}
+        
+        # Grille spatiale des entités positionnées (get_position)
+        self.spatial_grid = SpatialGrid(cell_size)
+        
+        # Positions contiguës des entités positionnées (une case par entité, cases libres recyclées)
+        self._pos_x = np.zeros(capacity, dtype=np.float32)
+        self._pos_y = np.zeros(capacity, dtype=np.float32)
+        self._pos_entities: List[Optional[Entity]] = []
+        self._pos_free: List[int] = []
+        
+        # Tampons réutilisés par radius_filter (agrandis au besoin)
+        self._scratch_x = np.empty(capacity, dtype=np.float32)
+        self._scratch_y = np.empty(capacity, dtype=np.float32)
+        self._scratch_mask = np.empty(capacity, dtype=bool)
+        
+        # Pools des entités marquées 'poolable', par classe (voir register_pool)
+        self.entity_pools: Dict[Type[Entity], EntityPool] = {}
+        
+        # Systèmes: une liste de composants par type (entités à update() non redéfini)
+        self.systems: Dict[Type[EntityComponent], List[EntityComponent]] = defaultdict(list)
+        
+        # Boucles générées par archétype à la place des systèmes (moins lisible en debug)
+        self.enable_codegen = codegen
+        
+        # Ordre de mise à jour à plat (parents avant enfants), reconstruit si la hiérarchie change
+        self._active_ordered: List[Entity] = []
+        self._hierarchy_dirty = False
+        
         # Files d'attente pour les opérations différées
-        self.entities_to_add: List[Entity] = []
-        self.entities_to_remove: List[str] = []
+        self.entities_to_add: deque = deque()  # Entités
+        self.entities_to_remove: deque = deque()  # Identifiants
         
         # Statistiques
         self.stats = {
@@ -539,6 +1025,22 @@ class EntityManager:
         
         self.entities[entity.entity_id] = entity
         
+        # Rangement dans la table d'archétype
+        entity._manager = weakref.ref(self)
+        self._move_to_archetype(entity)
+        self._hierarchy_dirty = True
+        
+        # Indexation par composant
+        for component in entity._component_list:
+            self.entities_by_component.setdefault(type(component), set()).add(entity)
+            if entity._system_updated:
+                self._add_to_system(component)
+        self._query_cache.clear()
+        
+        # Indexation spatiale
+        if hasattr(entity, 'get_position'):
+            self._write_position(entity)
+        
         # Indexation par tag
         for tag in entity.tags:
             if tag not in self.entities_by_tag:
@@ -554,9 +1056,10 @@ class EntityManager:
         self.stats['total_created'] += 1
         self.stats['active_entities'] += 1
         
-        self.logger.debug(f"Entité ajoutée: {entity.entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité ajoutée: {entity.entity_id}")
     
-    def remove_entity(self, entity_id: str, immediate: bool = False) -> bool:
+    def remove_entity(self, entity_id: int, immediate: bool = False) -> bool:
         """
         Supprime une entité du gestionnaire
         
@@ -576,7 +1079,7 @@ class EntityManager:
             self.entities_to_remove.append(entity_id)
             return True
     
-    def _remove_entity_immediate(self, entity_id: str) -> bool:
+    def _remove_entity_immediate(self, entity_id: int) -> bool:
         """Supprime immédiatement une entité"""
         if entity_id not in self.entities:
             return False
@@ -596,8 +1099,24 @@ class EntityManager:
             if not self.entities_by_type[entity_type]:
                 del self.entities_by_type[entity_type]
         
-        # Nettoyage de l'entité
-        entity.cleanup()
+        # Retrait de la table d'archétype
+        self._detach_from_archetype(entity)
+        entity._manager = None
+        self._hierarchy_dirty = True
+        
+        for component in entity._component_list:
+            self._unindex_component(entity, type(component))
+            self._remove_from_system(component)
+        self._query_cache.clear()
+        self.spatial_grid.remove(entity)
+        self._release_position(entity)
+        
+        # Nettoyage de l'entité (ou retour au pool de sa classe)
+        pool = self.entity_pools.get(entity_type) if 'poolable' in entity.tags else None
+        if pool is not None:
+            pool.release(entity)
+        else:
+            entity.cleanup()
         
         # Suppression de la collection principale
         del self.entities[entity_id]
@@ -605,10 +1124,141 @@ class EntityManager:
         self.stats['total_destroyed'] += 1
         self.stats['active_entities'] -= 1
         
-        self.logger.debug(f"Entité supprimée: {entity_id}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Entité supprimée: {entity_id}")
         return True
     
-    def get_entity(self, entity_id: str) -> Optional[Entity]:
+    def _move_to_archetype(self, entity: Entity):
+        """Range l'entité dans la table correspondant à son masque de composants"""
+        self._detach_from_archetype(entity)
+        
+        mask = entity._component_mask
+        archetype = self.archetypes.get(mask)
+        if archetype is None:
+            archetype = Archetype(mask)
+            self.archetypes[mask] = archetype
+            if self.enable_codegen:
+                archetype.compile()
+        
+        entity._archetype = archetype
+        entity._archetype_row = archetype.add(entity)
+    
+    def _on_component_changed(self, entity: Entity, component: EntityComponent, added: bool):
+        """Mise à jour de l'index inverse, des systèmes et de l'archétype après un ajout/retrait de composant"""
+        component_type = type(component)
+        if added:
+            self.entities_by_component.setdefault(component_type, set()).add(entity)
+            if entity._system_updated:
+                self._add_to_system(component)
+        else:
+            self._unindex_component(entity, component_type)
+            self._remove_from_system(component)
+        self._query_cache.clear()
+        self._move_to_archetype(entity)
+    
+    def _add_to_system(self, component: EntityComponent):
+        """Ajoute un composant en fin de la liste de son système"""
+        system = self.systems[type(component)]
+        component._system_index = len(system)
+        system.append(component)
+    
+    def _remove_from_system(self, component: EntityComponent):
+        """Retire un composant de son système (le dernier prend sa place)"""
+        index = component._system_index
+        if index < 0:
+            return
+        system = self.systems[type(component)]
+        last = system.pop()
+        if last is not component:
+            system[index] = last
+            last._system_index = index
+        component._system_index = -1
+    
+    def compile_systems(self):
+        """Active la génération de code et compile la boucle de chaque archétype existant"""
+        self.enable_codegen = True
+        for archetype in self.archetypes.values():
+            archetype.compile()
+    
+    def run_system(self, component_type: Type[EntityComponent], delta_time: float):
+        """Met à jour tous les composants d'un type, en une boucle sur sa liste"""
+        # Liste homogène: la méthode update est résolue une seule fois
+        update = component_type.update
+        for component in self.systems.get(component_type, ()):
+            entity = component.entity
+            if component.enabled and entity.is_active and not entity.is_destroyed:
+                if __debug__:
+                    try:
+                        update(component, delta_time)
+                    except Exception as e:
+                        self.logger.error(f"Erreur lors de la mise à jour du composant {component_type.__name__}: {e}")
+                else:
+                    update(component, delta_time)
+    
+    def _unindex_component(self, entity: Entity, component_type: Type[EntityComponent]):
+        """Retire une entité de l'index inverse d'un type de composant"""
+        entities_set = self.entities_by_component.get(component_type)
+        if entities_set is not None:
+            entities_set.discard(entity)
+            if not entities_set:
+                del self.entities_by_component[component_type]
+    
+    def _detach_from_archetype(self, entity: Entity):
+        """Retire l'entité de sa table d'archétype actuelle"""
+        archetype = entity._archetype
+        if archetype is not None:
+            archetype.remove(entity._archetype_row)
+            entity._archetype = None
+            entity._archetype_row = -1
+    
+    def for_each(self, mask: int):
+        """
+        Parcourt les archétypes possédant au moins les composants du masque
+        
+        Exemple:
+            for archetype in manager.for_each(HealthComponent.TYPE_MASK):
+                for component in archetype.component_arrays[HealthComponent.TYPE_ID]:
+                    component.update(delta_time)
+        """
+        for archetype in self.archetypes.values():
+            if archetype.mask & mask == mask and archetype.entities:
+                yield archetype
+    
+    def _write_position(self, entity: Entity):
+        """Enregistre la position d'une entité (case des tableaux de positions et grille)"""
+        x, y = entity.get_position()
+        slot = entity._position_slot
+        if slot < 0:
+            slot = self._pos_free.pop() if self._pos_free else self._allocate_position_slot()
+            entity._position_slot = slot
+            self._pos_entities[slot] = entity
+        
+        self._pos_x[slot] = x
+        self._pos_y[slot] = y
+        self.spatial_grid.update(entity, x, y)
+    
+    def _allocate_position_slot(self) -> int:
+        """Nouvelle case en fin de tableau (capacité doublée si nécessaire)"""
+        slot = len(self._pos_entities)
+        if slot == len(self._pos_x):
+            self._pos_x = np.concatenate((self._pos_x, np.zeros_like(self._pos_x)))
+            self._pos_y = np.concatenate((self._pos_y, np.zeros_like(self._pos_y)))
+        self._pos_entities.append(None)
+        return slot
+    
+    def _release_position(self, entity: Entity):
+        """Libère la case de position d'une entité"""
+        slot = entity._position_slot
+        if slot >= 0:
+            self._pos_entities[slot] = None
+            self._pos_free.append(slot)
+            entity._position_slot = -1
+    
+    def register_pool(self, pool: EntityPool):
+        """Les entités de la classe du pool taguées 'poolable' y retourneront à leur suppression"""
+        self.entity_pools[pool.entity_class] = pool
+    
+    def get_entity(self, entity_id: int) -> Optional[Entity]:
         """Récupère une entité par son ID"""
         return self.entities.get(entity_id)
     
@@ -622,40 +1272,116 @@ class EntityManager:
         entities_set = self.entities_by_type.get(entity_type, set())
         return list(entities_set)
     
+    def iter_entities_by_tag(self, tag: str) -> Iterator[Entity]:
+        """Parcourt les entités avec un tag donné (sans copie en liste)"""
+        return iter(self.entities_by_tag.get(tag, ()))
+    
+    def iter_entities_by_type(self, entity_type: Type[Entity]) -> Iterator[Entity]:
+        """Parcourt les entités d'un type donné (sans copie en liste)"""
+        return iter(self.entities_by_type.get(entity_type, ()))
+    
+    def get_entities_with_tags(self, *tags: str) -> Set[Entity]:
+        """Entités possédant tous les tags donnés (intersection en partant du plus petit ensemble)"""
+        sets = sorted((self.entities_by_tag.get(tag, set()) for tag in tags), key=len)
+        if not sets:
+            return set()
+        return sets[0].intersection(*sets[1:])
+    
     def get_entities_with_component(self, component_type: Type[EntityComponent]) -> List[Entity]:
         """Récupère toutes les entités possédant un composant donné"""
-        matching_entities = []
-        
-        for entity in self.entities.values():
-            if entity.has_component(component_type):
-                matching_entities.append(entity)
-        
-        return matching_entities
+        return list(self.entities_by_component.get(component_type, ()))
+    
+    def get_entities_with_components(self, *component_types: Type[EntityComponent]) -> List[Entity]:
+        """Récupère toutes les entités possédant tous les composants donnés (résultat mis en cache)"""
+        key = frozenset(component_types)
+        result = self._query_cache.get(key)
+        if result is None:
+            result = self._query_cache[key] = self._query_components(key)
+        return list(result)
+    
+    def _query_components(self, component_types: frozenset) -> Tuple[Entity, ...]:
+        """
+        Intersection des index inverses
+        Le cache est propre au gestionnaire et vidé à tout ajout/retrait: aucun résultat
+        périmé ne garde en vie des entités détruites
+        """
+        sets = sorted((self.entities_by_component.get(component_type, set())
+                       for component_type in component_types), key=len)
+        if not sets:
+            return ()
+        return tuple(sets[0].intersection(*sets[1:]))
     
     def update_all(self, delta_time: float):
         """Met à jour toutes les entités actives"""
+        EntityManager.current_frame += 1
+        
         # Traitement des ajouts et suppressions différés
         self._process_pending_operations()
         
-        # Mise à jour des entités actives
-        for entity in self.entities.values():
+        if self._hierarchy_dirty:
+            self._rebuild_update_order()
+        
+        # Composants des entités à update() standard: boucles générées par archétype,
+        # sinon un système par type dans l'ordre d'enregistrement
+        if self.enable_codegen:
+            for archetype in self.archetypes.values():
+                archetype.run(archetype, delta_time)
+        else:
+            for component_type in list(self.systems):
+                self.run_system(component_type, delta_time)
+        
+        # Entités à update() spécifique, ou enfants non gérés dont les composants
+        # ne sont pas dans les systèmes (et position dans la grille spatiale)
+        current_frame = EntityManager.current_frame
+        write_position = self._write_position
+        for entity in self._active_ordered:
             if entity.is_active and not entity.is_destroyed:
-                entity.update(delta_time)
+                manager = entity._manager
+                if entity._system_updated and manager is not None and manager() is self:
+                    entity.last_update_frame = current_frame
+                else:
+                    entity.update(delta_time)
+                if entity._position_slot >= 0:
+                    write_position(entity)
         
         # Nettoyage des entités détruites
         self._cleanup_destroyed_entities()
     
+    def _rebuild_update_order(self):
+        """Parcours en profondeur (préfixe) depuis les racines: chaque parent précède ses enfants"""
+        ordered = self._active_ordered
+        ordered.clear()
+        
+        stack = [entity for entity in self.entities.values() if self._is_update_root(entity)]
+        stack.reverse()
+        while stack:
+            entity = stack.pop()
+            ordered.append(entity)
+            stack.extend(entity.children)
+        
+        self._hierarchy_dirty = False
+    
+    def _is_update_root(self, entity: Entity) -> bool:
+        """Une racine n'a aucun ancêtre géré par ce gestionnaire"""
+        entities = self.entities
+        parent = entity.parent
+        while parent is not None:
+            if entities.get(parent.entity_id) is parent:
+                return False
+            parent = parent.parent
+        return True
+    
     def _process_pending_operations(self):
         """Traite les opérations en attente"""
-        # Ajouts
-        for entity in self.entities_to_add:
-            self._add_entity_immediate(entity)
-        self.entities_to_add.clear()
+        # Ajouts (les entités mises en file pendant le traitement sont traitées aussi)
+        entities_to_add = self.entities_to_add
+        while entities_to_add:
+            self._add_entity_immediate(entities_to_add.popleft())
         
         # Suppressions
-        for entity_id in self.entities_to_remove:
-            self._remove_entity_immediate(entity_id)
-        self.entities_to_remove.clear()
+        entities_to_remove = self.entities_to_remove
+        while entities_to_remove:
+            self._remove_entity_immediate(entities_to_remove.popleft())
     
     def _cleanup_destroyed_entities(self):
         """Nettoie les entités marquées comme détruites"""
@@ -710,22 +1436,25 @@ class EntityManager:
         Returns:
             Liste des entités dans le rayon
         """
-        matching_entities = []
-        radius_squared = radius * radius
-        
-        entities_to_check = (self.get_entities_by_type(entity_type) 
-                           if entity_type else self.entities.values())
-        
-        for entity in entities_to_check:
-            # Supposons que l'entité a une position (composant de mouvement ou autre)
-            if hasattr(entity, 'get_position'):
-                entity_x, entity_y = entity.get_position()
-                distance_squared = (center_x - entity_x) ** 2 + (center_y - entity_y) ** 2
-                
-                if distance_squared <= radius_squared:
-                    matching_entities.append(entity)
-        
-        return matching_entities
+        # Seules les cellules qui chevauchent le cercle sont examinées
+        candidates = self.spatial_grid.query_radius(center_x, center_y, radius)
+        if entity_type is not None:
+            candidates = [entity for entity in candidates if type(entity) is entity_type]
+        if not candidates:
+            return []
+        
+        # Test de distance vectorisé sur les positions des candidats
+        n = len(candidates)
+        if n > len(self._scratch_mask):
+            self._scratch_x = np.empty(n * 2, dtype=np.float32)
+            self._scratch_y = np.empty(n * 2, dtype=np.float32)
+            self._scratch_mask = np.empty(n * 2, dtype=bool)
+        
+        slots = np.fromiter((entity._position_slot for entity in candidates), dtype=np.intp, count=n)
+        inside = radius_filter(self._pos_x, self._pos_y, slots, center_x, center_y, radius * radius,
+                               self._scratch_x[:n], self._scratch_y[:n], self._scratch_mask[:n])
+        
+        return [candidates[i] for i in np.flatnonzero(inside)]
     
     def cleanup(self):
         """Nettoyage complet du gestionnaire"""
@@ -735,6 +1464,14 @@ class EntityManager:
         # Nettoyage des structures de données
         self.entities_by_tag.clear()
         self.entities_by_type.clear()
+        self.archetypes.clear()
+        self._active_ordered.clear()
+        self.systems.clear()
+        self.entities_by_component.clear()
+        self._query_cache.clear()
+        self.spatial_grid.clear()
+        self._pos_entities.clear()
+        self._pos_free.clear()
         
         self.stats = {
             'total_created': 0,
@@ -5,10 +5,12 @@ Gère tous les types de projectiles tirés par les tours
 """
 
 import arcade
-import math
-import random
-from typing import Tuple, List, Optional, Dict, Any
-from enum import Enum
+from math import atan2, cos, degrees, hypot, radians, sin, sqrt, tau
+import numpy as np
+from typing import Tuple, List, Optional, Dict, Any, Deque
+from collections import deque
+from heapq import heappop, heappush
+from enum import IntEnum
 from dataclasses import dataclass
 import logging
 
@@ -18,30 +20,40 @@ from config.settings import SteampunkColors
 from gameplay.entities.tower import TowerStats
 
 
-class ProjectileType(Enum):
-    """Types de projectiles disponibles"""
-    CANNONBALL = "cannonball"
-    LIGHTNING_BOLT = "lightning_bolt"
-    FLAME_BURST = "flame_burst"
-    BULLET = "bullet"
-    MORTAR_SHELL = "mortar_shell"
-    ICE_CRYSTAL = "ice_crystal"
-    SNIPER_BULLET = "sniper_bullet"
-    MINE = "mine"
+class ProjectileType(IntEnum):
+    """Types de projectiles disponibles (entiers: comparaisons rapides et colonne type_id)"""
+    CANNONBALL = 0
+    LIGHTNING_BOLT = 1
+    FLAME_BURST = 2
+    BULLET = 3
+    MORTAR_SHELL = 4
+    ICE_CRYSTAL = 5
+    SNIPER_BULLET = 6
+    MINE = 7
+    
+    @property
+    def key(self) -> str:
+        """Identifiant textuel du type (logs, statistiques)"""
+        return self.name.lower()
+    
+    @classmethod
+    def from_key(cls, key: str) -> 'ProjectileType':
+        """Retrouve un type depuis son identifiant textuel (ex: "cannonball")"""
+        return cls[key.upper()]
 
 
-class ProjectileMovementType(Enum):
-    """Types de mouvement des projectiles"""
-    LINEAR = "linear"           # Mouvement linéaire direct
-    BALLISTIC = "ballistic"     # Trajectoire parabolique
-    HOMING = "homing"          # Poursuite de cible
-    INSTANT = "instant"        # Impact immédiat
-    STATIC = "static"          # Immobile (mines)
+class ProjectileMovementType(IntEnum):
+    """Types de mouvement des projectiles (entiers: colonne movement_type du ProjectileSoA)"""
+    LINEAR = 0          # Mouvement linéaire direct
+    BALLISTIC = 1       # Trajectoire parabolique
+    HOMING = 2          # Poursuite de cible
+    INSTANT = 3         # Impact immédiat
+    STATIC = 4          # Immobile (mines)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProjectileTrail:
-    """Configuration de traînée visuelle"""
+    """Configuration de traînée visuelle (immuable, une instance partagée par type)"""
     enabled: bool = False
     length: int = 5
     fade_rate: float = 0.8
@@ -49,34 +61,700 @@ class ProjectileTrail:
     particles: bool = False
 
 
+# Type de mouvement de chaque type de projectile
+_MOVEMENT_MAP = {
+    ProjectileType.CANNONBALL: ProjectileMovementType.LINEAR,
+    ProjectileType.LIGHTNING_BOLT: ProjectileMovementType.INSTANT,
+    ProjectileType.FLAME_BURST: ProjectileMovementType.LINEAR,
+    ProjectileType.BULLET: ProjectileMovementType.LINEAR,
+    ProjectileType.MORTAR_SHELL: ProjectileMovementType.BALLISTIC,
+    ProjectileType.ICE_CRYSTAL: ProjectileMovementType.HOMING,
+    ProjectileType.SNIPER_BULLET: ProjectileMovementType.LINEAR,
+    ProjectileType.MINE: ProjectileMovementType.STATIC,
+}
+
+
+# Sprite et taille associés à chaque type de projectile
+_SPRITE_TYPE_MAP = {
+    ProjectileType.CANNONBALL: SpriteType.CANNONBALL,
+    ProjectileType.LIGHTNING_BOLT: SpriteType.LIGHTNING_BOLT,
+    ProjectileType.FLAME_BURST: SpriteType.FLAME_BURST,
+    ProjectileType.BULLET: SpriteType.BULLET,
+    ProjectileType.MORTAR_SHELL: SpriteType.MORTAR_SHELL,
+    ProjectileType.ICE_CRYSTAL: SpriteType.ICE_CRYSTAL,
+    ProjectileType.SNIPER_BULLET: SpriteType.SNIPER_BULLET,
+}
+
+_SIZE_MAP = {
+    ProjectileType.CANNONBALL: (16, 16),
+    ProjectileType.LIGHTNING_BOLT: (32, 8),
+    ProjectileType.FLAME_BURST: (12, 12),
+    ProjectileType.BULLET: (8, 4),
+    ProjectileType.MORTAR_SHELL: (20, 20),
+    ProjectileType.ICE_CRYSTAL: (14, 14),
+    ProjectileType.SNIPER_BULLET: (12, 3),
+}
+
+
+# Traînée de chaque type de projectile (instances partagées, immuables)
+_DEFAULT_TRAIL = ProjectileTrail()
+
+_TRAIL_CONFIGS = {
+    ProjectileType.CANNONBALL: ProjectileTrail(
+        enabled=True, length=3, fade_rate=0.9,
+        color=SteampunkColors.STEAM_WHITE, particles=True
+    ),
+    ProjectileType.LIGHTNING_BOLT: ProjectileTrail(
+        enabled=True, length=8, fade_rate=0.7,
+        color=SteampunkColors.ELECTRIC_BLUE, particles=True
+    ),
+    ProjectileType.FLAME_BURST: ProjectileTrail(
+        enabled=True, length=5, fade_rate=0.8,
+        color=SteampunkColors.FIRE_ORANGE, particles=True
+    ),
+    ProjectileType.BULLET: ProjectileTrail(
+        enabled=True, length=2, fade_rate=0.95,
+        color=SteampunkColors.STEEL
+    ),
+    ProjectileType.MORTAR_SHELL: ProjectileTrail(
+        enabled=True, length=4, fade_rate=0.85,
+        color=SteampunkColors.STEAM_WHITE, particles=True
+    ),
+    ProjectileType.ICE_CRYSTAL: ProjectileTrail(
+        enabled=True, length=6, fade_rate=0.75,
+        color=(173, 216, 230), particles=True  # Bleu glace
+    ),
+    ProjectileType.SNIPER_BULLET: ProjectileTrail(
+        enabled=True, length=12, fade_rate=0.5,  # Balle perforante ultra-rapide
+        color=SteampunkColors.GOLD
+    ),
+}
+
+
+# Effet visuel d'impact de chaque type de projectile
+_IMPACT_EFFECTS = {
+    ProjectileType.CANNONBALL: 'cannon_explosion',
+    ProjectileType.LIGHTNING_BOLT: 'lightning_strike',
+    ProjectileType.FLAME_BURST: 'flame_explosion',
+    ProjectileType.BULLET: 'bullet_impact',
+    ProjectileType.MORTAR_SHELL: 'mortar_explosion',
+    ProjectileType.ICE_CRYSTAL: 'ice_shatter',
+    ProjectileType.SNIPER_BULLET: 'sniper_impact',
+}
+
+
+# Dégradé de couleur des particules de feu
+_FLAME_COLORS = (
+    SteampunkColors.FIRE_ORANGE,
+    (255, 69, 0),  # Rouge orangé
+    (255, 255, 0)  # Jaune
+)
+
+
+def _create_circle(center_x: float, center_y: float, radius: float,
+                   color: Tuple[int, ...]) -> arcade.Shape:
+    """Cercle plein à ajouter à une ShapeElementList (équivalent de draw_circle_filled)"""
+    return arcade.create_ellipse_filled(center_x, center_y, radius * 2, radius * 2,
+                                        color, num_segments=12)
+
+
+# Aura lumineuse: dégradé radial blanc partagé, teinté et mis à l'échelle par projectile
+_GLOW_TEXTURE_DIAMETER = 64
+_glow_texture: Optional[arcade.Texture] = None
+
+
+def _get_glow_texture() -> arcade.Texture:
+    """Texture d'aura partagée (créée au premier usage)"""
+    global _glow_texture
+    if _glow_texture is None:
+        _glow_texture = arcade.make_soft_circle_texture(
+            _GLOW_TEXTURE_DIAMETER, (255, 255, 255), center_alpha=80, outer_alpha=0
+        )
+    return _glow_texture
+
+
+# Loggers par type de projectile, créés une seule fois
+_LOGGERS = {projectile_type: logging.getLogger(f'Projectile.{projectile_type.key}')
+            for projectile_type in ProjectileType}
+
+
+# ═══════════════════════════════════════════════════════════
+# NOYAUX DE CALCUL VECTORISÉS
+# ═══════════════════════════════════════════════════════════
+
+def homing_step(pos_x: np.ndarray, pos_y: np.ndarray, vel_x: np.ndarray, vel_y: np.ndarray,
+                tgt_x: np.ndarray, tgt_y: np.ndarray, speed: np.ndarray,
+                homing_strength: np.ndarray, max_turn_rate: np.ndarray,
+                rows: np.ndarray, delta_time: float) -> np.ndarray:
+    """
+    Avance d'un pas les projectiles à poursuite d'indices rows
+    La direction tourne vers la cible, limitée par max_turn_rate; la différence
+    d'angle est ramenée dans [-π, π[ par un modulo, sans boucle
+    
+    Returns:
+        np.ndarray: Masque (aligné sur rows) des projectiles arrivés sur la cible
+    """
+    x = pos_x[rows]
+    y = pos_y[rows]
+    dx = tgt_x[rows] - x
+    dy = tgt_y[rows] - y
+    
+    current_angle = np.arctan2(vel_y[rows], vel_x[rows])
+    angle_diff = np.arctan2(dy, dx) - current_angle
+    angle_diff = np.mod(angle_diff + np.pi, tau) - np.pi
+    
+    # Limitation de la vitesse de rotation
+    max_rotation = max_turn_rate[rows] * delta_time
+    np.clip(angle_diff, -max_rotation, max_rotation, out=angle_diff)
+    new_angle = current_angle + angle_diff * homing_strength[rows] * delta_time
+    
+    # Nouvelle vélocité et mouvement
+    row_speed = speed[rows]
+    new_vx = row_speed * np.cos(new_angle)
+    new_vy = row_speed * np.sin(new_angle)
+    vel_x[rows] = new_vx
+    vel_y[rows] = new_vy
+    pos_x[rows] = x + new_vx * delta_time
+    pos_y[rows] = y + new_vy * delta_time
+    
+    # Atteinte de la cible (distance avant le pas, moins de 8 pixels)
+    return dx * dx + dy * dy < 64.0
+
+
+def lifetime_step(travel_time: np.ndarray, max_travel_time: np.ndarray, has_hit: np.ndarray,
+                  delta_time: float, live: np.ndarray, tmp: np.ndarray) -> np.ndarray:
+    """
+    Avance la durée de vol des projectiles en vol et termine ceux qui l'ont dépassée
+    
+    Returns:
+        np.ndarray: live, masque des projectiles encore en vol
+    """
+    np.logical_not(has_hit, out=live)
+    np.add(travel_time, delta_time, out=travel_time, where=live)
+    np.greater_equal(travel_time, max_travel_time, out=tmp)
+    tmp &= live
+    has_hit |= tmp
+    live ^= tmp
+    return live
+
+
+def linear_step(pos_x: np.ndarray, pos_y: np.ndarray, vel_x: np.ndarray, vel_y: np.ndarray,
+                tgt_x: np.ndarray, tgt_y: np.ndarray, has_target: np.ndarray, has_hit: np.ndarray,
+                delta_time: float, linear: np.ndarray, a: np.ndarray, b: np.ndarray,
+                arrived: np.ndarray):
+    """
+    Pas d'intégration des projectiles en ligne droite (masque linear), arrivés
+    à moins de 5 pixels de leur cible
+    Calculs en place ou dans les tampons fournis (a, b: flottants; arrived: booléen)
+    """
+    np.multiply(vel_x, delta_time, out=a)
+    np.add(pos_x, a, out=pos_x, where=linear)
+    np.multiply(vel_y, delta_time, out=a)
+    np.add(pos_y, a, out=pos_y, where=linear)
+    
+    np.subtract(pos_x, tgt_x, out=a)
+    a *= a
+    np.subtract(pos_y, tgt_y, out=b)
+    b *= b
+    b += a
+    np.less(b, 25.0, out=arrived)
+    arrived &= linear
+    arrived &= has_target
+    
+    np.copyto(pos_x, tgt_x, where=arrived)
+    np.copyto(pos_y, tgt_y, where=arrived)
+    has_hit |= arrived
+
+
+def ballistic_step(pos_x: np.ndarray, pos_y: np.ndarray, vel_x: np.ndarray, vel_y: np.ndarray,
+                   tgt_x: np.ndarray, tgt_y: np.ndarray, gravity: np.ndarray, has_hit: np.ndarray,
+                   delta_time: float, ballistic: np.ndarray, a: np.ndarray, b: np.ndarray,
+                   arrived: np.ndarray, tmp: np.ndarray):
+    """
+    Pas d'intégration des projectiles balistiques (masque ballistic), gravité comprise,
+    arrivés en passant sous la cible dans une fenêtre horizontale de 20 pixels
+    Calculs en place ou dans les tampons fournis (a, b: flottants; arrived, tmp: booléens)
+    """
+    np.multiply(vel_x, delta_time, out=a)
+    np.add(pos_x, a, out=pos_x, where=ballistic)
+    np.multiply(vel_y, delta_time, out=a)
+    np.add(pos_y, a, out=pos_y, where=ballistic)
+    np.multiply(gravity, delta_time, out=a)
+    np.subtract(vel_y, a, out=vel_y, where=ballistic)
+    
+    np.subtract(pos_x, tgt_x, out=a)
+    a *= a
+    np.subtract(pos_y, tgt_y, out=b)
+    np.less_equal(b, 0.0, out=arrived)
+    np.less(a, 400.0, out=tmp)
+    arrived &= tmp
+    arrived &= ballistic
+    
+    np.copyto(pos_x, tgt_x, where=arrived)
+    np.copyto(pos_y, tgt_y, where=arrived)
+    has_hit |= arrived
+
+
+# ═══════════════════════════════════════════════════════════
+# STOCKAGE EN COLONNES DES PROJECTILES
+# ═══════════════════════════════════════════════════════════
+
+class ProjectileSoA:
+    """
+    Stockage en colonnes (Structure of Arrays) des données de mouvement des projectiles
+    Chaque projectile occupe une ligne; durée de vie et mouvements linéaires de toutes
+    les lignes sont calculés en une seule passe vectorisée (system_update)
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, capacity)
+        self.size = 0  # Nombre de lignes déjà utilisées (lignes libres incluses)
+        self._free_rows: List[int] = []  # Tas: la plus petite ligne libre est réutilisée d'abord
+        self.owners: List[Optional['Projectile']] = [None] * self.capacity
+        
+        self.pos_x = np.zeros(self.capacity, dtype=np.float32)
+        self.pos_y = np.zeros(self.capacity, dtype=np.float32)
+        self.vel_x = np.zeros(self.capacity, dtype=np.float32)
+        self.vel_y = np.zeros(self.capacity, dtype=np.float32)
+        self.tgt_x = np.zeros(self.capacity, dtype=np.float32)
+        self.tgt_y = np.zeros(self.capacity, dtype=np.float32)
+        self.has_target = np.zeros(self.capacity, dtype=bool)
+        
+        self.speed = np.zeros(self.capacity, dtype=np.float32)
+        self.gravity = np.zeros(self.capacity, dtype=np.float32)  # Projectiles balistiques
+        self.homing_strength = np.zeros(self.capacity, dtype=np.float32)  # Force de poursuite
+        self.max_turn_rate = np.zeros(self.capacity, dtype=np.float32)  # Rotation max (rad/s)
+        
+        # État (une ligne libre est marquée comme ayant touché: elle n'est plus simulée)
+        self.has_hit = np.ones(self.capacity, dtype=bool)
+        self.travel_time = np.zeros(self.capacity, dtype=np.float32)
+        self.max_travel_time = np.zeros(self.capacity, dtype=np.float32)
+        self.exploded = np.ones(self.capacity, dtype=bool)  # Impact déclenché (plus de mise à jour)
+        self.on_screen = np.ones(self.capacity, dtype=bool)  # Visible lors du dernier rendu
+        self.movement_type = np.zeros(self.capacity, dtype=np.int8)  # ProjectileMovementType
+        self.type_id = np.full(self.capacity, -1, dtype=np.int8)  # ProjectileType (-1: ligne libre)
+        
+        # Animation des effets visuels (EffectsComponent)
+        self.anim_timer = np.zeros(self.capacity, dtype=np.float32)
+        self.anim_speed = np.zeros(self.capacity, dtype=np.float32)
+        self.rotation = np.zeros(self.capacity, dtype=np.float32)
+        self.rotation_speed = np.zeros(self.capacity, dtype=np.float32)
+        self.alpha = np.zeros(self.capacity, dtype=np.float32)
+        self.scale = np.zeros(self.capacity, dtype=np.float32)
+        self.glow_radius = np.zeros(self.capacity, dtype=np.float32)
+        
+        self._allocate_scratch()
+    
+    def _allocate_scratch(self):
+        """Tampons de travail de la passe de mouvement (taille de la capacité)"""
+        self._scratch_a = np.empty(self.capacity, dtype=np.float32)
+        self._scratch_b = np.empty(self.capacity, dtype=np.float32)
+        self._mask_live = np.empty(self.capacity, dtype=bool)
+        self._mask_linear = np.empty(self.capacity, dtype=bool)
+        self._mask_ballistic = np.empty(self.capacity, dtype=bool)
+        self._mask_arrived = np.empty(self.capacity, dtype=bool)
+        self._mask_tmp = np.empty(self.capacity, dtype=bool)
+    
+    def allocate(self, owner: 'Projectile') -> int:
+        """Réserve une ligne pour un projectile et retourne son index"""
+        row = -1
+        free_rows = self._free_rows
+        while free_rows:
+            candidate = heappop(free_rows)
+            # Entrées périmées: ligne coupée de la fin du tableau, ou déjà réattribuée
+            if candidate < self.size and self.owners[candidate] is None:
+                row = candidate
+                break
+        
+        if row < 0:
+            if self.size == self.capacity:
+                self._grow()
+            row = self.size
+            self.size += 1
+        
+        self.owners[row] = owner
+        self.has_target[row] = False
+        self.has_hit[row] = False
+        self.exploded[row] = False
+        self.on_screen[row] = True
+        self.travel_time[row] = 0.0
+        self.max_travel_time[row] = 10.0  # Durée de vie maximale
+        self.vel_x[row] = 0.0
+        self.vel_y[row] = 0.0
+        self.gravity[row] = 500.0
+        self.homing_strength[row] = 3.0
+        self.max_turn_rate[row] = radians(180)
+        return row
+    
+    def release(self, row: int):
+        """Libère la ligne d'un projectile"""
+        if self.owners[row] is None:
+            return
+        
+        self.owners[row] = None
+        self.type_id[row] = -1
+        self.has_hit[row] = True
+        self.exploded[row] = True
+        heappush(self._free_rows, row)
+        
+        # Lignes libres en fin de tableau: les passes vectorisées ([:size]) les ignorent
+        owners = self.owners
+        size = self.size
+        while size and owners[size - 1] is None:
+            size -= 1
+        self.size = size
+    
+    def _grow(self):
+        """Double la capacité de toutes les colonnes"""
+        new_capacity = self.capacity * 2
+        for name in ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'tgt_x', 'tgt_y', 'has_target',
+                     'speed', 'gravity', 'homing_strength', 'max_turn_rate',
+                     'has_hit', 'exploded', 'on_screen', 'travel_time', 'max_travel_time',
+                     'movement_type', 'type_id', 'anim_timer', 'anim_speed', 'rotation',
+                     'rotation_speed', 'alpha', 'scale', 'glow_radius'):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            if name == 'type_id':
+                new.fill(-1)
+            elif name in ('has_hit', 'exploded', 'on_screen'):
+                new.fill(True)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        
+        self.owners.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+        self._allocate_scratch()
+    
+    def pending_rows(self) -> np.ndarray:
+        """Lignes dont l'impact n'a pas encore été déclenché (mise à jour par projectile requise)"""
+        return np.flatnonzero(~self.exploded[:self.size])
+    
+    def expired_rows(self) -> np.ndarray:
+        """Lignes allouées à libérer (impact déclenché hors mines, ou durée de vol dépassée)"""
+        n = self.size
+        expired = self._mask_tmp[:n]
+        scratch = self._mask_arrived[:n]
+        np.greater_equal(self.travel_time[:n], self.max_travel_time[:n], out=expired)
+        np.not_equal(self.type_id[:n], ProjectileType.MINE, out=scratch)
+        scratch &= self.exploded[:n]
+        expired |= scratch
+        np.greater_equal(self.type_id[:n], 0, out=scratch)
+        expired &= scratch
+        return np.flatnonzero(expired)
+    
+    def visible_rows(self, min_alpha: float = 5.0) -> np.ndarray:
+        """Lignes allouées, visibles lors du dernier rendu et assez opaques pour être dessinées"""
+        n = self.size
+        visible = self._mask_tmp[:n]
+        scratch = self._mask_arrived[:n]
+        np.greater_equal(self.alpha[:n], min_alpha, out=visible)
+        visible &= self.on_screen[:n]
+        np.greater_equal(self.type_id[:n], 0, out=scratch)
+        visible &= scratch
+        return np.flatnonzero(visible)
+    
+    def update_on_screen(self, bounds: Tuple[float, float, float, float], margin: float = 32.0):
+        """Marque les lignes dont la position est dans les bornes (gauche, bas, droite, haut)"""
+        n = self.size
+        left, bottom, right, top = bounds
+        pos_x = self.pos_x[:n]
+        pos_y = self.pos_y[:n]
+        self.on_screen[:n] = ((pos_x >= left - margin) & (pos_x <= right + margin) &
+                              (pos_y >= bottom - margin) & (pos_y <= top + margin))
+    
+    def system_update(self, delta_time: float):
+        """
+        Met à jour toutes les lignes en une passe: durée de vie, mouvements
+        linéaire, balistique et de poursuite vectorisés, puis animation des effets
+        """
+        n = self.size
+        if n == 0:
+            return
+        
+        self._update_movement(delta_time)
+        self._update_animation(delta_time)
+    
+    def _update_animation(self, delta_time: float):
+        """
+        Animation des effets de toutes les lignes dont l'impact n'est pas déclenché:
+        minuterie, rotation, scintillement des éclairs et fluctuation des flammes
+        """
+        n = self.size
+        pending = ~self.exploded[:n]
+        
+        anim_timer = self.anim_timer[:n]
+        np.add(anim_timer, self.anim_speed[:n] * delta_time, out=anim_timer, where=pending)
+        
+        # Rotation automatique pour certains projectiles
+        rotation = self.rotation[:n]
+        np.add(rotation, self.rotation_speed[:n] * delta_time, out=rotation, where=pending)
+        np.mod(rotation, tau, out=rotation)
+        
+        type_id = self.type_id[:n]
+        
+        # Scintillement électrique
+        lightning_rows = np.flatnonzero(pending & (type_id == ProjectileType.LIGHTNING_BOLT))
+        if lightning_rows.size:
+            timer = anim_timer[lightning_rows]
+            self.alpha[lightning_rows] = np.floor(255.0 * (0.8 + 0.2 * np.sin(timer * 10.0)))
+            self.glow_radius[lightning_rows] = 8.0 + 4.0 * np.sin(timer * 8.0)
+        
+        # Fluctuation de flamme
+        flame_rows = np.flatnonzero(pending & (type_id == ProjectileType.FLAME_BURST))
+        if flame_rows.size:
+            self.scale[flame_rows] = 1.0 + 0.2 * np.sin(anim_timer[flame_rows] * 6.0)
+    
+    def _update_movement(self, delta_time: float):
+        """
+        Durée de vie, puis un noyau spécialisé par type de mouvement,
+        appelé seulement si des lignes de ce type sont en vol
+        """
+        n = self.size
+        tmp = self._mask_tmp[:n]
+        scratch_a = self._scratch_a[:n]
+        scratch_b = self._scratch_b[:n]
+        arrived = self._mask_arrived[:n]
+        has_target = self.has_target[:n]
+        has_hit = self.has_hit[:n]
+        movement_type = self.movement_type[:n]
+        
+        live = lifetime_step(self.travel_time[:n], self.max_travel_time[:n], has_hit,
+                             delta_time, self._mask_live[:n], tmp)
+        
+        # Ligne droite (une poursuite sans cible avance en ligne droite)
+        linear = self._mask_linear[:n]
+        np.equal(movement_type, ProjectileMovementType.HOMING, out=tmp)
+        np.greater(tmp, has_target, out=tmp)
+        np.equal(movement_type, ProjectileMovementType.LINEAR, out=linear)
+        linear |= tmp
+        linear &= live
+        if linear.any():
+            linear_step(self.pos_x[:n], self.pos_y[:n], self.vel_x[:n], self.vel_y[:n],
+                        self.tgt_x[:n], self.tgt_y[:n], has_target, has_hit,
+                        delta_time, linear, scratch_a, scratch_b, arrived)
+        
+        # Balistique
+        ballistic = self._mask_ballistic[:n]
+        np.equal(movement_type, ProjectileMovementType.BALLISTIC, out=ballistic)
+        ballistic &= live
+        if ballistic.any():
+            ballistic_step(self.pos_x[:n], self.pos_y[:n], self.vel_x[:n], self.vel_y[:n],
+                           self.tgt_x[:n], self.tgt_y[:n], self.gravity[:n], has_hit,
+                           delta_time, ballistic, scratch_a, scratch_b, arrived, tmp)
+        
+        # Poursuite de cible
+        np.equal(movement_type, ProjectileMovementType.HOMING, out=tmp)
+        tmp &= has_target
+        tmp &= live
+        homing_rows = np.flatnonzero(tmp)
+        if homing_rows.size:
+            arrived_rows = homing_rows[homing_step(
+                self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+                self.tgt_x, self.tgt_y, self.speed,
+                self.homing_strength, self.max_turn_rate,
+                homing_rows, delta_time
+            )]
+            self.pos_x[arrived_rows] = self.tgt_x[arrived_rows]
+            self.pos_y[arrived_rows] = self.tgt_y[arrived_rows]
+            self.has_hit[arrived_rows] = True
+
+
+class ProjectileGrid:
+    """
+    Grille uniforme des lignes d'un ProjectileSoA, au format CSR
+    Les lignes sont triées par clé de cellule: une colonne de cellules
+    correspond à une plage contiguë, retrouvée par recherche dichotomique
+    """
+    
+    _OFFSET = 1 << 20  # Décalage des coordonnées de cellule (positions négatives)
+    _STRIDE = 1 << 21  # Nombre de cellules par colonne dans l'espace des clés
+    
+    def __init__(self, cell_size: float = 64.0):
+        self.cell_size = cell_size
+        self._inv_cell = 1.0 / cell_size
+        self.keys = np.empty(0, dtype=np.int64)  # Clés de cellule triées
+        self.rows = np.empty(0, dtype=np.intp)  # Lignes du stockage, dans l'ordre des clés
+        self.dirty = True
+    
+    def rebuild(self, storage: ProjectileSoA):
+        """Reconstruit l'index sur les lignes allouées (une passe, tri des clés)"""
+        n = storage.size
+        rows = np.flatnonzero(storage.type_id[:n] >= 0)
+        cell_x = np.floor(storage.pos_x[rows] * self._inv_cell).astype(np.int64)
+        cell_y = np.floor(storage.pos_y[rows] * self._inv_cell).astype(np.int64)
+        keys = (cell_x + self._OFFSET) * self._STRIDE + (cell_y + self._OFFSET)
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.rows = rows[order]
+        self.dirty = False
+    
+    def candidates(self, center_x: float, center_y: float, radius: float) -> np.ndarray:
+        """Lignes des cellules qui chevauchent le carré englobant du disque"""
+        if self.rows.size == 0:
+            return self.rows
+        
+        inv = self._inv_cell
+        min_cx = int(np.floor((center_x - radius) * inv))
+        max_cx = int(np.floor((center_x + radius) * inv))
+        min_cy = int(np.floor((center_y - radius) * inv))
+        max_cy = int(np.floor((center_y + radius) * inv))
+        
+        columns = np.arange(min_cx, max_cx + 1, dtype=np.int64)
+        low = (columns + self._OFFSET) * self._STRIDE + (min_cy + self._OFFSET)
+        starts = np.searchsorted(self.keys, low)
+        ends = np.searchsorted(self.keys, low + (max_cy - min_cy + 1))
+        
+        rows = self.rows
+        if starts.size == 1:
+            return rows[starts[0]:ends[0]]
+        return np.concatenate([rows[start:end] for start, end in zip(starts.tolist(), ends.tolist())])
+
+
 class MovementComponent(EntityComponent):
-    """Composant de mouvement pour projectiles"""
+    """
+    Composant de mouvement pour projectiles
+    Position, vélocité, cible et état sont stockés dans une ligne du ProjectileSoA
+    """
+    
+    __slots__ = ('_storage', '_row', 'movement_type', 'start_position',
+                 'position_history', 'max_history_length', 'sprite_angle', 'angle_dirty')
     
-    def __init__(self, movement_type: ProjectileMovementType, speed: float):
+    def __init__(self, movement_type: ProjectileMovementType, speed: float,
+                 storage: ProjectileSoA, row: int):
         super().__init__()
+        self._storage = storage
+        self._row = row
         self.movement_type = movement_type
-        self.speed = speed
-        self.position = (0.0, 0.0)
-        self.velocity = (0.0, 0.0)
-        self.target_position: Optional[Tuple[float, float]] = None
+        storage.movement_type[row] = movement_type
+        storage.speed[row] = speed
         self.start_position = (0.0, 0.0)
         
-        # Paramètres spécifiques au mouvement
-        self.gravity = 500.0  # Pour les projectiles balistiques
-        self.homing_strength = 3.0  # Force de poursuite
-        self.max_turn_rate = math.radians(180)  # Vitesse de rotation max
-        
-        # État du mouvement
-        self.has_hit = False
-        self.travel_time = 0.0
-        self.max_travel_time = 10.0  # Durée de vie maximale
-        
-        # Historique des positions pour la traînée
-        self.position_history: List[Tuple[float, float]] = []
+        # Historique des positions pour la traînée (les plus anciennes sont évincées)
         self.max_history_length = 10
+        self.position_history: Deque[Tuple[float, float]] = deque(maxlen=self.max_history_length)
+        
+        # Orientation du sprite: calculée une fois si la direction est constante
+        self.sprite_angle: Optional[float] = None
+        self.angle_dirty = movement_type in (ProjectileMovementType.BALLISTIC, ProjectileMovementType.HOMING)
+    
+    def reset(self, speed: float, row: int):
+        """Réinitialise le composant pour un projectile recyclé"""
+        self._row = row
+        self._storage.movement_type[row] = self.movement_type
+        self._storage.speed[row] = speed
+        self.start_position = (0.0, 0.0)
+        self.position_history.clear()
+        self.sprite_angle = None
+    
+    # ═══════════════════════════════════════════════════════════
+    # ACCÈS AUX COLONNES
+    # ═══════════════════════════════════════════════════════════
+    
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Position actuelle, lue dans le stockage en colonnes (item: flottants Python directs)"""
+        row = self._row
+        return (self._storage.pos_x.item(row), self._storage.pos_y.item(row))
+    
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        row = self._row
+        self._storage.pos_x[row] = value[0]
+        self._storage.pos_y[row] = value[1]
+    
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        """Vélocité actuelle (pixels par seconde)"""
+        row = self._row
+        return (self._storage.vel_x.item(row), self._storage.vel_y.item(row))
+    
+    @velocity.setter
+    def velocity(self, value: Tuple[float, float]):
+        row = self._row
+        self._storage.vel_x[row] = value[0]
+        self._storage.vel_y[row] = value[1]
+    
+    @property
+    def target_position(self) -> Optional[Tuple[float, float]]:
+        """Position cible (None si aucune)"""
+        row = self._row
+        if not self._storage.has_target[row]:
+            return None
+        return (self._storage.tgt_x.item(row), self._storage.tgt_y.item(row))
+    
+    @target_position.setter
+    def target_position(self, value: Optional[Tuple[float, float]]):
+        row = self._row
+        self._storage.has_target[row] = value is not None
+        if value is not None:
+            self._storage.tgt_x[row] = value[0]
+            self._storage.tgt_y[row] = value[1]
+    
+    @property
+    def speed(self) -> float:
+        return self._storage.speed.item(self._row)
+    
+    @speed.setter
+    def speed(self, value: float):
+        self._storage.speed[self._row] = value
+    
+    @property
+    def gravity(self) -> float:
+        return self._storage.gravity.item(self._row)
+    
+    @gravity.setter
+    def gravity(self, value: float):
+        self._storage.gravity[self._row] = value
+    
+    @property
+    def homing_strength(self) -> float:
+        return self._storage.homing_strength.item(self._row)
+    
+    @homing_strength.setter
+    def homing_strength(self, value: float):
+        self._storage.homing_strength[self._row] = value
+    
+    @property
+    def max_turn_rate(self) -> float:
+        return self._storage.max_turn_rate.item(self._row)
+    
+    @max_turn_rate.setter
+    def max_turn_rate(self, value: float):
+        self._storage.max_turn_rate[self._row] = value
+    
+    @property
+    def has_hit(self) -> bool:
+        return self._storage.has_hit.item(self._row)
+    
+    @has_hit.setter
+    def has_hit(self, value: bool):
+        self._storage.has_hit[self._row] = value
+    
+    @property
+    def travel_time(self) -> float:
+        return self._storage.travel_time.item(self._row)
+    
+    @travel_time.setter
+    def travel_time(self, value: float):
+        self._storage.travel_time[self._row] = value
+    
+    @property
+    def max_travel_time(self) -> float:
+        return self._storage.max_travel_time.item(self._row)
+    
+    @max_travel_time.setter
+    def max_travel_time(self, value: float):
+        self._storage.max_travel_time[self._row] = value
+    
+    # ═══════════════════════════════════════════════════════════
+    # TRAJECTOIRE
+    # ═══════════════════════════════════════════════════════════
     
     def set_target(self, start_pos: Tuple[float, float], target_pos: Tuple[float, float]):
-        """Configure la trajectoire du projectile"""
+        """Configure la trajectoire du projectile (la cible est obligatoire)"""
+        if target_pos is None:
+            raise ValueError("Un projectile doit avoir une position cible")
+        
         self.start_position = start_pos
         self.position = start_pos
         self.target_position = target_pos
@@ -89,30 +767,36 @@ class MovementComponent(EntityComponent):
             self._setup_homing_movement()
         elif self.movement_type == ProjectileMovementType.INSTANT:
             self._setup_instant_movement()
+        
+        # Orientation initiale selon la vélocité (inchangée si elle est nulle)
+        vx, vy = self.velocity
+        if vx != 0 or vy != 0:
+            self.sprite_angle = degrees(atan2(vy, vx))
     
     def _setup_linear_movement(self):
         """Configure le mouvement linéaire"""
-        if not self.target_position:
+        target_position = self.target_position
+        if not target_position:
             return
         
-        dx = self.target_position[0] - self.start_position[0]
-        dy = self.target_position[1] - self.start_position[1]
-        distance = math.sqrt(dx * dx + dy * dy)
+        dx = target_position[0] - self.start_position[0]
+        dy = target_position[1] - self.start_position[1]
+        distance = hypot(dx, dy)
         
+        # Vélocité fixée une fois pour toutes: l'intégrateur ne fait plus que pos += vel * dt
         if distance > 0:
-            self.velocity = (
-                (dx / distance) * self.speed,
-                (dy / distance) * self.speed
-            )
+            scale = self.speed / distance
+            self.velocity = (dx * scale, dy * scale)
     
     def _setup_ballistic_movement(self):
         """Configure le mouvement balistique (parabolique)"""
-        if not self.target_position:
+        target_position = self.target_position
+        if not target_position:
             return
         
-        dx = self.target_position[0] - self.start_position[0]
-        dy = self.target_position[1] - self.start_position[1]
-        distance = math.sqrt(dx * dx + dy * dy)
+        dx = target_position[0] - self.start_position[0]
+        dy = target_position[1] - self.start_position[1]
+        distance = sqrt(dx * dx + dy * dy)
         
         if distance > 0:
             # Calcul de l'angle optimal pour atteindre la cible
@@ -134,126 +818,39 @@ class MovementComponent(EntityComponent):
     def _setup_instant_movement(self):
         """Configure l'impact instantané"""
         self.has_hit = True
-        if self.target_position:
-            self.position = self.target_position
+        target_position = self.target_position
+        if target_position:
+            self.position = target_position
     
     def update(self, delta_time: float):
-        """Met à jour le mouvement du projectile"""
+        """
+        Sans effet sur le mouvement, calculé par ProjectileSoA.system_update;
+        seul l'historique des positions (traînée) est tenu ici
+        """
         if self.has_hit:
             return
         
-        self.travel_time += delta_time
-        
-        # Vérification de la durée de vie
-        if self.travel_time >= self.max_travel_time:
-            self.has_hit = True
-            return
-        
-        # Sauvegarde de la position pour la traînée
         self.position_history.append(self.position)
-        if len(self.position_history) > self.max_history_length:
-            self.position_history.pop(0)
-        
-        # Mise à jour selon le type de mouvement
-        if self.movement_type == ProjectileMovementType.LINEAR:
-            self._update_linear_movement(delta_time)
-        elif self.movement_type == ProjectileMovementType.BALLISTIC:
-            self._update_ballistic_movement(delta_time)
-        elif self.movement_type == ProjectileMovementType.HOMING:
-            self._update_homing_movement(delta_time)
-        elif self.movement_type == ProjectileMovementType.STATIC:
-            pass  # Pas de mouvement pour les mines
-    
-    def _update_linear_movement(self, delta_time: float):
-        """Met à jour le mouvement linéaire"""
-        new_x = self.position[0] + self.velocity[0] * delta_time
-        new_y = self.position[1] + self.velocity[1] * delta_time
-        self.position = (new_x, new_y)
-        
-        # Vérification de l'atteinte de la cible
-        if self.target_position:
-            distance_to_target = math.sqrt(
-                (self.position[0] - self.target_position[0]) ** 2 +
-                (self.position[1] - self.target_position[1]) ** 2
-            )
-            
-            if distance_to_target < 5.0:  # Proche de la cible
-                self.position = self.target_position
-                self.has_hit = True
-    
-    def _update_ballistic_movement(self, delta_time: float):
-        """Met à jour le mouvement balistique"""
-        # Mouvement horizontal constant
-        new_x = self.position[0] + self.velocity[0] * delta_time
-        
-        # Mouvement vertical avec gravité
-        new_y = self.position[1] + self.velocity[1] * delta_time
-        self.velocity = (self.velocity[0], self.velocity[1] - self.gravity * delta_time)
-        
-        self.position = (new_x, new_y)
-        
-        # Vérification si le projectile est passé sous la cible
-        if (self.target_position and 
-            self.position[1] <= self.target_position[1] and
-            abs(self.position[0] - self.target_position[0]) < 20.0):
-            self.position = self.target_position
-            self.has_hit = True
-    
-    def _update_homing_movement(self, delta_time: float):
-        """Met à jour le mouvement de poursuite"""
-        if not self.target_position:
-            self._update_linear_movement(delta_time)
-            return
-        
-        # Direction actuelle
-        current_angle = math.atan2(self.velocity[1], self.velocity[0])
-        
-        # Direction vers la cible
-        dx = self.target_position[0] - self.position[0]
-        dy = self.target_position[1] - self.position[1]
-        target_angle = math.atan2(dy, dx)
-        
-        # Calcul de l'angle de rotation nécessaire
-        angle_diff = target_angle - current_angle
-        
-        # Normalisation de l'angle entre -π et π
-        while angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        while angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Limitation de la vitesse de rotation
-        max_rotation = self.max_turn_rate * delta_time
-        if abs(angle_diff) > max_rotation:
-            angle_diff = math.copysign(max_rotation, angle_diff)
-        
-        # Nouvelle direction
-        new_angle = current_angle + angle_diff * self.homing_strength * delta_time
-        
-        # Mise à jour de la vélocité
-        self.velocity = (
-            self.speed * math.cos(new_angle),
-            self.speed * math.sin(new_angle)
-        )
-        
-        # Mouvement
-        new_x = self.position[0] + self.velocity[0] * delta_time
-        new_y = self.position[1] + self.velocity[1] * delta_time
-        self.position = (new_x, new_y)
-        
-        # Vérification de l'atteinte de la cible
-        distance_to_target = math.sqrt(dx * dx + dy * dy)
-        if distance_to_target < 8.0:
-            self.position = self.target_position
-            self.has_hit = True
 
 
 class EffectsComponent(EntityComponent):
-    """Composant pour les effets visuels des projectiles"""
+    """
+    Composant pour les effets visuels des projectiles
+    Minuterie, rotation, opacité, échelle et rayon d'aura sont stockés dans une
+    ligne du ProjectileSoA et animés par ProjectileSoA.system_update
+    """
     
-    def __init__(self, projectile_type: ProjectileType):
+    __slots__ = ('_storage', '_row', 'projectile_type', 'trail', 'glow_enabled', 'glow_color')
+    
+    def __init__(self, projectile_type: ProjectileType, storage: ProjectileSoA, row: int):
         super().__init__()
         self.projectile_type = projectile_type
+        self._storage = storage
+        self.reset(row)
+    
+    def reset(self, row: int):
+        """Remet les effets dans leur état initial (création ou recyclage)"""
+        self._row = row
         self.trail = self._setup_trail()
         self.rotation = 0.0
         self.rotation_speed = 0.0
@@ -268,96 +865,134 @@ class EffectsComponent(EntityComponent):
         # Animation
         self.animation_timer = 0.0
         self.animation_speed = 1.0
-    
-    def _setup_trail(self) -> ProjectileTrail:
-        """Configure la traînée selon le type de projectile"""
-        trail_configs = {
-            ProjectileType.CANNONBALL: ProjectileTrail(
-                enabled=True, length=3, fade_rate=0.9,
-                color=SteampunkColors.STEAM_WHITE, particles=True
-            ),
-            ProjectileType.LIGHTNING_BOLT: ProjectileTrail(
-                enabled=True, length=8, fade_rate=0.7,
-                color=SteampunkColors.ELECTRIC_BLUE, particles=True
-            ),
-            ProjectileType.FLAME_BURST: ProjectileTrail(
-                enabled=True, length=5, fade_rate=0.8,
-                color=SteampunkColors.FIRE_ORANGE, particles=True
-            ),
-            ProjectileType.BULLET: ProjectileTrail(
-                enabled=True, length=2, fade_rate=0.95,
-                color=SteampunkColors.STEEL
-            ),
-            ProjectileType.MORTAR_SHELL: ProjectileTrail(
-                enabled=True, length=4, fade_rate=0.85,
-                color=SteampunkColors.STEAM_WHITE, particles=True
-            ),
-            ProjectileType.ICE_CRYSTAL: ProjectileTrail(
-                enabled=True, length=6, fade_rate=0.75,
-                color=(173, 216, 230), particles=True  # Bleu glace
-            ),
-            ProjectileType.SNIPER_BULLET: ProjectileTrail(
-                enabled=True, length=8, fade_rate=0.6,
-                color=SteampunkColors.GOLD
-            ),
-        }
-        
-        return trail_configs.get(projectile_type, ProjectileTrail())
-    
-    def update(self, delta_time: float):
-        """Met à jour les effets visuels"""
-        self.animation_timer += delta_time * self.animation_speed
-        
-        # Rotation automatique pour certains projectiles
-        if self.rotation_speed != 0:
-            self.rotation += self.rotation_speed * delta_time
-            self.rotation = self.rotation % (2 * math.pi)
         
-        # Effets spéciaux selon le type
+        # Aura et rotation constantes selon le type (le rayon des éclairs est animé)
         if self.projectile_type == ProjectileType.LIGHTNING_BOLT:
-            # Scintillement électrique
-            self.alpha = int(255 * (0.8 + 0.2 * math.sin(self.animation_timer * 10)))
             self.glow_enabled = True
-            self.glow_radius = 8 + 4 * math.sin(self.animation_timer * 8)
+            self.glow_radius = 8.0
             self.glow_color = SteampunkColors.ELECTRIC_BLUE
         
         elif self.projectile_type == ProjectileType.FLAME_BURST:
-            # Fluctuation de flamme
-            self.scale = 1.0 + 0.2 * math.sin(self.animation_timer * 6)
             self.glow_enabled = True
-            self.glow_radius = 6
+            self.glow_radius = 6.0
             self.glow_color = SteampunkColors.FIRE_ORANGE
         
         elif self.projectile_type == ProjectileType.ICE_CRYSTAL:
             # Rotation cristalline
-            self.rotation_speed = math.radians(180)
+            self.rotation_speed = radians(180)
             self.glow_enabled = True
-            self.glow_radius = 4
+            self.glow_radius = 4.0
             self.glow_color = (173, 216, 230)
+    
+    def _setup_trail(self) -> ProjectileTrail:
+        """Configure la traînée selon le type de projectile (instance partagée)"""
+        return _TRAIL_CONFIGS.get(self.projectile_type, _DEFAULT_TRAIL)
+    
+    # ═══════════════════════════════════════════════════════════
+    # ACCÈS AUX COLONNES
+    # ═══════════════════════════════════════════════════════════
+    
+    @property
+    def animation_timer(self) -> float:
+        return self._storage.anim_timer.item(self._row)
+    
+    @animation_timer.setter
+    def animation_timer(self, value: float):
+        self._storage.anim_timer[self._row] = value
+    
+    @property
+    def animation_speed(self) -> float:
+        return self._storage.anim_speed.item(self._row)
+    
+    @animation_speed.setter
+    def animation_speed(self, value: float):
+        self._storage.anim_speed[self._row] = value
+    
+    @property
+    def rotation(self) -> float:
+        return self._storage.rotation.item(self._row)
+    
+    @rotation.setter
+    def rotation(self, value: float):
+        self._storage.rotation[self._row] = value
+    
+    @property
+    def rotation_speed(self) -> float:
+        return self._storage.rotation_speed.item(self._row)
+    
+    @rotation_speed.setter
+    def rotation_speed(self, value: float):
+        self._storage.rotation_speed[self._row] = value
+    
+    @property
+    def alpha(self) -> int:
+        return int(self._storage.alpha.item(self._row))
+    
+    @alpha.setter
+    def alpha(self, value: int):
+        self._storage.alpha[self._row] = value
+    
+    @property
+    def scale(self) -> float:
+        return self._storage.scale.item(self._row)
+    
+    @scale.setter
+    def scale(self, value: float):
+        self._storage.scale[self._row] = value
+    
+    @property
+    def glow_radius(self) -> float:
+        return self._storage.glow_radius.item(self._row)
+    
+    @glow_radius.setter
+    def glow_radius(self, value: float):
+        self._storage.glow_radius[self._row] = value
+    
+    def update(self, delta_time: float):
+        """L'animation est calculée par ProjectileSoA.system_update"""
+        pass
 
 
 class Projectile(Entity):
     """
     Classe principale pour tous les projectiles
+    Les données de mouvement vivent dans une ligne d'un ProjectileSoA: celui du
+    ProjectileManager, ou un stockage propre pour un projectile autonome
     """
     
+    # Tirages aléatoires uniformes [0, 1) partagés par les effets visuels
+    # (tampon circulaire rempli une seule fois, taille puissance de 2)
+    _NOISE_SIZE = 65536
+    _noise = np.random.default_rng().random(_NOISE_SIZE, dtype=np.float32)
+    _noise_index = 0
+    
     def __init__(self, projectile_type: ProjectileType, start_position: Tuple[float, float],
                  target_position: Tuple[float, float], damage: int, speed: float,
-                 tower_stats: TowerStats, sprite_factory: SteampunkSpriteFactory):
+                 tower_stats: TowerStats, sprite_factory: SteampunkSpriteFactory,
+                 storage: Optional[ProjectileSoA] = None,
+                 textures: Optional[Dict[ProjectileType, arcade.Texture]] = None):
         super().__init__()
         
-        self.logger = logging.getLogger(f'Projectile.{projectile_type.value}')
+        self.logger = _LOGGERS[projectile_type]
         self.projectile_type = projectile_type
         self.damage = damage
         self.tower_stats = tower_stats
         self.sprite_factory = sprite_factory
+        self._textures = textures  # Textures partagées par type (cache du ProjectileManager)
+        
+        # Stockage en colonnes (partagé par le gestionnaire ou propre au projectile)
+        self._owns_storage = storage is None
+        self.storage = storage if storage is not None else ProjectileSoA(capacity=1)
+        self.soa_index = self.storage.allocate(self)
+        self.storage.type_id[self.soa_index] = projectile_type
+        self.list_index = -1  # Position dans la liste active du gestionnaire
         
         # Configuration du mouvement selon le type
         movement_type = self._get_movement_type(projectile_type)
         
         # Ajout des composants
-        self.movement = MovementComponent(movement_type, speed)
-        self.effects = EffectsComponent(projectile_type)
+        self.movement = MovementComponent(movement_type, speed, self.storage, self.soa_index)
+        self.effects = EffectsComponent(projectile_type, self.storage, self.soa_index)
         
         self.add_component(self.movement)
         self.add_component(self.effects)
@@ -368,6 +1003,9 @@ class Projectile(Entity):
         # Sprite et visuel
         self.sprite = self._create_sprite()
         self.sprite.center_x, self.sprite.center_y = start_position
+        if self.movement.sprite_angle is not None:
+            self.sprite.angle = self.movement.sprite_angle
+        self.glow_sprite = self._create_glow_sprite() if self.effects.glow_enabled else None
         
         # État
         self.is_active = True
@@ -376,68 +1014,110 @@ class Projectile(Entity):
         # Effets spéciaux selon le type
         self._setup_special_properties()
         
-        self.logger.debug(f"Projectile {projectile_type.value} créé: {start_position} -> {target_position}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Projectile {projectile_type.key} créé: {start_position} -> {target_position}")
+    
+    def reset(self, start_position: Tuple[float, float], target_position: Tuple[float, float],
+              damage: int, speed: float, tower_stats: TowerStats):
+        """
+        Réinitialise un projectile recyclé par le ProjectileManager comme s'il venait d'être créé
+        Le type, les composants et le sprite (texture du type) sont conservés
+        """
+        self._reset()
+        
+        # État propre à l'ancien tir: ses écouteurs ne doivent pas recevoir les événements du nouveau
+        self._local_event_handlers.clear()
+        self.tags.clear()
+        self.children.clear()
+        self.parent = None
+        self._event_system = None
+        
+        self.damage = damage
+        self.tower_stats = tower_stats
+        
+        # Nouvelle ligne dans le stockage (l'ancienne a été libérée au recyclage)
+        self.soa_index = self.storage.allocate(self)
+        self.storage.type_id[self.soa_index] = self.projectile_type
+        self.movement.reset(speed, self.soa_index)
+        self.effects.reset(self.soa_index)
+        
+        # Configuration de la trajectoire
+        self.movement.set_target(start_position, target_position)
+        
+        # Sprite et visuel
+        self.sprite.center_x, self.sprite.center_y = start_position
+        self.sprite.angle = self.movement.sprite_angle if self.movement.sprite_angle is not None else 0
+        self.sprite.alpha = 255
+        self.sprite.scale = 1.0
+        self._update_glow_sprite(start_position)
+        
+        # État
+        self.is_active = True
+        self.has_exploded = False
+        
+        # Effets spéciaux selon le type
+        self._setup_special_properties()
+    
+    @property
+    def has_exploded(self) -> bool:
+        """Impact déclenché (colonne exploded du stockage)"""
+        return self.storage.exploded.item(self.soa_index)
+    
+    @has_exploded.setter
+    def has_exploded(self, value: bool):
+        self.storage.exploded[self.soa_index] = value
+    
+    def is_on_screen(self) -> bool:
+        """Retourne si le projectile était visible lors du dernier rendu"""
+        return self.storage.on_screen.item(self.soa_index)
     
     def _get_movement_type(self, projectile_type: ProjectileType) -> ProjectileMovementType:
         """Détermine le type de mouvement selon le projectile"""
-        movement_map = {
-            ProjectileType.CANNONBALL: ProjectileMovementType.LINEAR,
-            ProjectileType.LIGHTNING_BOLT: ProjectileMovementType.INSTANT,
-            ProjectileType.FLAME_BURST: ProjectileMovementType.LINEAR,
-            ProjectileType.BULLET: ProjectileMovementType.LINEAR,
-            ProjectileType.MORTAR_SHELL: ProjectileMovementType.BALLISTIC,
-            ProjectileType.ICE_CRYSTAL: ProjectileMovementType.HOMING,
-            ProjectileType.SNIPER_BULLET: ProjectileMovementType.LINEAR,
-            ProjectileType.MINE: ProjectileMovementType.STATIC,
-        }
-        
-        return movement_map.get(projectile_type, ProjectileMovementType.LINEAR)
+        return _MOVEMENT_MAP.get(projectile_type, ProjectileMovementType.LINEAR)
     
     def _create_sprite(self) -> arcade.Sprite:
         """Crée le sprite du projectile"""
-        sprite_type_map = {
-            ProjectileType.CANNONBALL: SpriteType.CANNONBALL,
-            ProjectileType.LIGHTNING_BOLT: SpriteType.LIGHTNING_BOLT,
-            ProjectileType.FLAME_BURST: SpriteType.FLAME_BURST,
-            ProjectileType.BULLET: SpriteType.BULLET,
-            ProjectileType.MORTAR_SHELL: SpriteType.MORTAR_SHELL,
-            ProjectileType.ICE_CRYSTAL: SpriteType.ICE_CRYSTAL,
-            ProjectileType.SNIPER_BULLET: SpriteType.SNIPER_BULLET,
-        }
-        
-        sprite_type = sprite_type_map.get(self.projectile_type, SpriteType.BULLET)
+        sprite = arcade.Sprite()
+        sprite.texture = self._get_texture()
+        sprite.scale = 1.0
         
-        # Taille personnalisée selon le type
-        size_map = {
-            ProjectileType.CANNONBALL: (16, 16),
-            ProjectileType.LIGHTNING_BOLT: (32, 8),
-            ProjectileType.FLAME_BURST: (12, 12),
-            ProjectileType.BULLET: (8, 4),
-            ProjectileType.MORTAR_SHELL: (20, 20),
-            ProjectileType.ICE_CRYSTAL: (14, 14),
-            ProjectileType.SNIPER_BULLET: (12, 3),
-        }
+        return sprite
+    
+    def _get_texture(self) -> arcade.Texture:
+        """Texture du type de projectile (depuis le cache partagé s'il existe)"""
+        if self._textures is not None and self.projectile_type in self._textures:
+            return self._textures[self.projectile_type]
         
-        size = size_map.get(self.projectile_type, (8, 8))
-        texture = self.sprite_factory.create_sprite(sprite_type, size)
+        sprite_type = _SPRITE_TYPE_MAP.get(self.projectile_type, SpriteType.BULLET)
         
+        # Taille personnalisée selon le type
+        size = _SIZE_MAP.get(self.projectile_type, (8, 8))
+        return self.sprite_factory.create_sprite(sprite_type, size)
+    
+    def _create_glow_sprite(self) -> arcade.Sprite:
+        """Crée le sprite d'aura lumineuse (teinte constante selon le type)"""
         sprite = arcade.Sprite()
-        sprite.texture = texture
-        sprite.scale = 1.0
-        
+        sprite.texture = _get_glow_texture()
+        sprite.color = self.effects.glow_color
+        self._update_glow_sprite(self.movement.position, sprite)
         return sprite
     
+    def _update_glow_sprite(self, position: Tuple[float, float],
+                            glow_sprite: Optional[arcade.Sprite] = None):
+        """Place l'aura sur le projectile, à l'échelle de son rayon animé"""
+        if glow_sprite is None:
+            glow_sprite = self.glow_sprite
+            if glow_sprite is None:
+                return
+        
+        glow_sprite.center_x, glow_sprite.center_y = position
+        glow_sprite.scale = self.effects.glow_radius * 2 / _GLOW_TEXTURE_DIAMETER
+    
     def _setup_special_properties(self):
         """Configure les propriétés spéciales selon le type"""
         if self.projectile_type == ProjectileType.CANNONBALL:
-            # Traînée de vapeur
-            self.effects.trail.particles = True
-            self.effects.rotation_speed = math.radians(90)
-        
-        elif self.projectile_type == ProjectileType.LIGHTNING_BOLT:
-            # Effet électrique instantané
-            self.effects.glow_enabled = True
-            self.effects.glow_radius = 12
+            # Boulet en rotation (traînée de vapeur dans sa configuration)
+            self.effects.rotation_speed = radians(90)
         
         elif self.projectile_type == ProjectileType.FLAME_BURST:
             # Flamme ondulante
@@ -450,55 +1130,61 @@ class Projectile(Entity):
         elif self.projectile_type == ProjectileType.ICE_CRYSTAL:
             # Cristal qui cherche sa cible
             self.movement.homing_strength = 5.0
-            self.effects.rotation_speed = math.radians(360)
-        
-        elif self.projectile_type == ProjectileType.SNIPER_BULLET:
-            # Balle perforante ultra-rapide
-            self.effects.trail.length = 12
-            self.effects.trail.fade_rate = 0.5
     
     def update(self, delta_time: float):
         """Met à jour le projectile"""
         if not self.is_active:
             return
         
-        # Mise à jour des composants
+        # Un projectile autonome fait lui-même la passe de mouvement
+        if self._owns_storage:
+            self.storage.system_update(delta_time)
+        
+        self._update_entity(delta_time)
+    
+    def _update_entity(self, delta_time: float):
+        """
+        Mise à jour par projectile, après la passe de mouvement du ProjectileSoA
+        Traînée, effets et sprite ne sont tenus à jour que pour les projectiles visibles
+        """
+        if not self.is_active:
+            return
+        
+        if self.is_on_screen():
+            self._update_visuals(delta_time)
+        
+        # Vérification de l'état
+        if self.movement.has_hit and not self.has_exploded:
+            self._trigger_impact()
+    
+    def _update_visuals(self, delta_time: float):
+        """Met à jour traînée, effets et sprite du projectile"""
+        # Mise à jour de la traînée (les effets sont animés par le ProjectileSoA)
         self.movement.update(delta_time)
-        self.effects.update(delta_time)
         
         # Mise à jour de la position du sprite
-        self.sprite.center_x, self.sprite.center_y = self.movement.position
+        position = self.movement.position
+        self.sprite.center_x, self.sprite.center_y = position
         
-        # Mise à jour de la rotation du sprite
-        if self.movement.velocity[0] != 0 or self.movement.velocity[1] != 0:
-            # Orientation selon la vélocité
-            angle = math.atan2(self.movement.velocity[1], self.movement.velocity[0])
-            self.sprite.angle = math.degrees(angle)
+        # Mise à jour de la rotation du sprite (direction variable seulement)
+        if self.movement.angle_dirty:
+            velocity = self.movement.velocity
+            if velocity[0] != 0 or velocity[1] != 0:
+                # Orientation selon la vélocité
+                angle = atan2(velocity[1], velocity[0])
+                self.sprite.angle = degrees(angle)
         
         # Application des effets visuels
         self.sprite.alpha = self.effects.alpha
         self.sprite.scale = self.effects.scale
-        
-        # Vérification de l'état
-        if self.movement.has_hit and not self.has_exploded:
-            self._trigger_impact()
+        self._update_glow_sprite(position)
     
     def _trigger_impact(self):
         """Déclenche l'impact du projectile"""
         self.has_exploded = True
         
         # Effet visuel d'impact selon le type
-        impact_effects = {
-            ProjectileType.CANNONBALL: 'cannon_explosion',
-            ProjectileType.LIGHTNING_BOLT: 'lightning_strike',
-            ProjectileType.FLAME_BURST: 'flame_explosion',
-            ProjectileType.BULLET: 'bullet_impact',
-            ProjectileType.MORTAR_SHELL: 'mortar_explosion',
-            ProjectileType.ICE_CRYSTAL: 'ice_shatter',
-            ProjectileType.SNIPER_BULLET: 'sniper_impact',
-        }
-        
-        effect_type = impact_effects.get(self.projectile_type, 'generic_impact')
+        effect_type = _IMPACT_EFFECTS.get(self.projectile_type, 'generic_impact')
         
         # Émission de l'événement d'impact
         self.emit_event('projectile_impact', {
@@ -509,38 +1195,77 @@ class Projectile(Entity):
             'area_radius': self.tower_stats.area_radius if self.tower_stats.area_damage else 0
         })
         
-        self.logger.debug(f"Projectile {self.projectile_type.value} impact à {self.movement.position}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Projectile {self.projectile_type.key} impact à {self.movement.position}")
     
-    def render(self, renderer):
-        """Rendu personnalisé du projectile"""
-        if not self.is_active:
+    def render(self, renderer, underlay: Optional[arcade.ShapeElementList] = None,
+               overlay: Optional[arcade.ShapeElementList] = None):
+        """
+        Rendu personnalisé du projectile
+        
+        Args:
+            renderer: Renderer du jeu
+            underlay: Liste de formes partagée, dessinée sous les sprites (traînée, aura)
+            overlay: Liste de formes partagée, dessinée sur les sprites (effets spéciaux)
+                     Si absentes, des listes locales sont créées et dessinées immédiatement
+        """
+        # Projectile invisible (transparent ou hors des bornes de rendu)
+        if not self.is_active or self.effects.alpha < 5:
             return
         
-        # Rendu de la traînée
-        if self.effects.trail.enabled and len(self.movement.position_history) > 1:
-            self._render_trail(renderer)
+        if renderer is not None and getattr(renderer, 'enable_culling', False):
+            left, bottom, right, top = renderer.render_bounds
+            x, y = self.movement.position
+            if x < left - 32 or x > right + 32 or y < bottom - 32 or y > top + 32:
+                return
+        
+        draw_lists = underlay is None or overlay is None
+        if draw_lists:
+            underlay = arcade.ShapeElementList()
+            overlay = arcade.ShapeElementList()
         
-        # Rendu de l'aura/glow
-        if self.effects.glow_enabled:
-            self._render_glow(renderer)
+        self._append_underlay(underlay)
+        self._append_special_effects(overlay)
         
-        # Rendu du sprite principal
+        if draw_lists:
+            underlay.draw()
+        
+        # Aura puis sprite principal
+        if self.glow_sprite is not None:
+            self.glow_sprite.draw()
         self.sprite.draw()
         
-        # Effets spéciaux selon le type
-        self._render_special_effects(renderer)
+        if draw_lists:
+            overlay.draw()
     
-    def _render_trail(self, renderer):
-        """Affiche la traînée du projectile"""
-        if len(self.movement.position_history) < 2:
+    @staticmethod
+    def _draw_noise(count: int) -> List[float]:
+        """Retourne count tirages uniformes [0, 1) consécutifs du tampon partagé"""
+        index = Projectile._noise_index
+        if index + count > Projectile._NOISE_SIZE:
+            index = 0
+        Projectile._noise_index = index + count
+        return Projectile._noise[index:index + count].tolist()
+    
+    def _append_underlay(self, underlay: arcade.ShapeElementList):
+        """Ajoute la traînée à la liste de formes (l'aura est un sprite, glow_sprite)"""
+        if self.effects.trail.enabled and len(self.movement.position_history) > 1:
+            self._append_trail(underlay)
+    
+    def _append_trail(self, underlay: arcade.ShapeElementList):
+        """Ajoute la traînée du projectile à la liste de formes"""
+        position_history = self.movement.position_history
+        history_length = len(position_history)
+        if history_length < 2:
             return
         
         trail = self.effects.trail
+        noise = self._draw_noise(4 * history_length) if trail.particles else None
         
-        for i, pos in enumerate(self.movement.position_history):
+        for i, pos in enumerate(position_history):
             # Calcul de l'opacité selon la position dans la traînée
-            alpha_factor = (i + 1) / len(self.movement.position_history)
-            alpha_factor *= trail.fade_rate ** (len(self.movement.position_history) - i - 1)
+            alpha_factor = (i + 1) / history_length
+            alpha_factor *= trail.fade_rate ** (history_length - i - 1)
             
             alpha = int(255 * alpha_factor)
             if alpha < 10:
@@ -552,61 +1277,45 @@ class Projectile(Entity):
             # Couleur avec transparence
             color = (*trail.color, alpha)
             
-            arcade.draw_circle_filled(pos[0], pos[1], size, color)
+            underlay.append(_create_circle(pos[0], pos[1], size, color))
             
             # Particules additionnelles
-            if trail.particles and random.random() < 0.3:
-                particle_offset_x = random.uniform(-3, 3)
-                particle_offset_y = random.uniform(-3, 3)
-                particle_size = random.uniform(1, 3) * alpha_factor
+            if noise is not None and noise[4 * i] < 0.3:
+                particle_offset_x = noise[4 * i + 1] * 6 - 3
+                particle_offset_y = noise[4 * i + 2] * 6 - 3
+                particle_size = (1 + noise[4 * i + 3] * 2) * alpha_factor
                 
-                arcade.draw_circle_filled(
+                underlay.append(_create_circle(
                     pos[0] + particle_offset_x,
                     pos[1] + particle_offset_y,
                     particle_size,
                     (*trail.color, alpha // 2)
-                )
+                ))
     
-    def _render_glow(self, renderer):
-        """Affiche l'aura lumineuse"""
-        if self.effects.glow_radius <= 0:
-            return
-        
-        # Plusieurs cercles concentriques pour un effet de dégradé
-        for i in range(3):
-            radius = self.effects.glow_radius * (1.0 - i * 0.3)
-            alpha = int(50 * (1.0 - i * 0.4))
-            
-            color = (*self.effects.glow_color, alpha)
-            
-            arcade.draw_circle_filled(
-                self.movement.position[0],
-                self.movement.position[1],
-                radius,
-                color
-            )
-    
-    def _render_special_effects(self, renderer):
-        """Affiche les effets spéciaux selon le type"""
+    def _append_special_effects(self, overlay: arcade.ShapeElementList):
+        """Ajoute les effets spéciaux selon le type à la liste de formes"""
         if self.projectile_type == ProjectileType.LIGHTNING_BOLT:
-            self._render_lightning_effects()
+            self._append_lightning_effects(overlay)
         elif self.projectile_type == ProjectileType.FLAME_BURST:
-            self._render_flame_effects()
+            self._append_flame_effects(overlay)
         elif self.projectile_type == ProjectileType.ICE_CRYSTAL:
-            self._render_ice_effects()
+            self._append_ice_effects(overlay)
     
-    def _render_lightning_effects(self):
+    def _append_lightning_effects(self, overlay: arcade.ShapeElementList):
         """Effets spéciaux pour les éclairs"""
         # Arcs électriques aléatoires autour du projectile
         center_x, center_y = self.movement.position
+        noise = self._draw_noise(12)
         
-        for _ in range(2):
+        for arc in range(2):
+            arc_noise = noise[6 * arc:6 * arc + 6]
+            
             # Points aléatoires autour du projectile
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(5, 15)
+            angle = arc_noise[0] * tau
+            distance = 5 + arc_noise[1] * 10
             
-            end_x = center_x + math.cos(angle) * distance
-            end_y = center_y + math.sin(angle) * distance
+            end_x = center_x + cos(angle) * distance
+            end_y = center_y + sin(angle) * distance
             
             # Arc électrique en zigzag
             segments = 3
@@ -618,66 +1327,52 @@ class Projectile(Entity):
                 mid_y = center_y + (end_y - center_y) * t
                 
                 # Zigzag aléatoire
-                offset_x = random.uniform(-3, 3)
-                offset_y = random.uniform(-3, 3)
+                offset_x = arc_noise[2 * i] * 6 - 3
+                offset_y = arc_noise[2 * i + 1] * 6 - 3
                 
                 points.append((mid_x + offset_x, mid_y + offset_y))
             
             points.append((end_x, end_y))
             
-            # Dessin des segments
-            for i in range(len(points) - 1):
-                arcade.draw_line(
-                    points[i][0], points[i][1],
-                    points[i + 1][0], points[i + 1][1],
-                    SteampunkColors.ELECTRIC_BLUE, 2
-                )
-    
-    def _render_flame_effects(self):
+            # Segments de l'arc en une seule forme
+            overlay.append(arcade.create_line_strip(points, SteampunkColors.ELECTRIC_BLUE, 2))
+    
+    def _append_flame_effects(self, overlay: arcade.ShapeElementList):
         """Effets spéciaux pour les flammes"""
         # Particules de feu autour du projectile
         center_x, center_y = self.movement.position
+        noise = self._draw_noise(20)
         
-        for _ in range(4):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(2, 8)
-            size = random.uniform(2, 5)
+        for particle in range(4):
+            angle, distance_noise, size_noise, color_noise, alpha_noise = noise[5 * particle:5 * particle + 5]
+            angle *= tau
+            distance = 2 + distance_noise * 6
+            size = 2 + size_noise * 3
             
-            particle_x = center_x + math.cos(angle) * distance
-            particle_y = center_y + math.sin(angle) * distance
+            particle_x = center_x + cos(angle) * distance
+            particle_y = center_y + sin(angle) * distance
             
             # Dégradé de couleur du feu
-            colors = [
-                SteampunkColors.FIRE_ORANGE,
-                (255, 69, 0),  # Rouge orangé
-                (255, 255, 0)  # Jaune
-            ]
+            color = _FLAME_COLORS[int(color_noise * len(_FLAME_COLORS))]
+            alpha = 100 + int(alpha_noise * 101)
             
-            color = random.choice(colors)
-            alpha = random.randint(100, 200)
-            
-            arcade.draw_circle_filled(
-                particle_x, particle_y, size,
-                (*color, alpha)
-            )
+            overlay.append(_create_circle(particle_x, particle_y, size, (*color, alpha)))
     
-    def _render_ice_effects(self):
+    def _append_ice_effects(self, overlay: arcade.ShapeElementList):
         """Effets spéciaux pour la glace"""
         # Cristaux de glace qui scintillent
         center_x, center_y = self.movement.position
         
         # Effet de scintillement
-        if random.random() < 0.4:
-            sparkle_angle = random.uniform(0, 2 * math.pi)
-            sparkle_distance = random.uniform(8, 16)
+        sparkle_noise, angle_noise, distance_noise = self._draw_noise(3)
+        if sparkle_noise < 0.4:
+            sparkle_angle = angle_noise * tau
+            sparkle_distance = 8 + distance_noise * 8
             
-            sparkle_x = center_x + math.cos(sparkle_angle) * sparkle_distance
-            sparkle_y = center_y + math.sin(sparkle_angle) * sparkle_distance
+            sparkle_x = center_x + cos(sparkle_angle) * sparkle_distance
+            sparkle_y = center_y + sin(sparkle_angle) * sparkle_distance
             
-            arcade.draw_circle_filled(
-                sparkle_x, sparkle_y, 2,
-                (255, 255, 255, 180)
-            )
+            overlay.append(_create_circle(sparkle_x, sparkle_y, 2, (255, 255, 255, 180)))
         
         # Traînée cristalline
         if len(self.movement.position_history) > 2:
@@ -694,10 +1389,7 @@ class Projectile(Entity):
                 crystal_size = 3 * (1 - t)
                 alpha = int(150 * (1 - t))
                 
-                arcade.draw_circle_filled(
-                    crystal_x, crystal_y, crystal_size,
-                    (173, 216, 230, alpha)
-                )
+                overlay.append(_create_circle(crystal_x, crystal_y, crystal_size, (173, 216, 230, alpha)))
     
     # ═══════════════════════════════════════════════════════════
     # PROPRIÉTÉS ET ACCESSEURS
@@ -725,7 +1417,7 @@ class Projectile(Entity):
         start_pos = self.movement.start_position
         current_pos = self.movement.position
         
-        return math.sqrt(
+        return sqrt(
             (current_pos[0] - start_pos[0]) ** 2 +
             (current_pos[1] - start_pos[1]) ** 2
         )
@@ -740,22 +1432,75 @@ class Projectile(Entity):
         self.is_active = False
         self.movement.has_hit = True
         self.has_exploded = True
+        self.sprite.remove_from_sprite_lists()  # Plus dessiné par la SpriteList du gestionnaire
+        if self.glow_sprite is not None:
+            self.glow_sprite.remove_from_sprite_lists()
+    
+    def release_storage(self):
+        """Libère la ligne de stockage du projectile (sans détruire ses composants)"""
+        if self.storage.owners[self.soa_index] is self:
+            self.storage.release(self.soa_index)
+        self.is_active = False
     
     def get_debug_info(self) -> List[str]:
         """Retourne des informations de debug"""
         return [
-            f"Type: {self.projectile_type.value}",
+            f"Type: {self.projectile_type.key}",
             f"Damage: {self.damage}",
             f"Position: ({self.movement.position[0]:.1f}, {self.movement.position[1]:.1f})",
             f"Velocity: ({self.movement.velocity[0]:.1f}, {self.movement.velocity[1]:.1f})",
             f"Travel Time: {self.movement.travel_time:.1f}s",
             f"Hit Target: {self.movement.has_hit}",
             f"Exploded: {self.has_exploded}",
-            f"Movement Type: {self.movement.movement_type.value}",
+            f"Movement Type: {self.movement.movement_type.name.lower()}",
             f"Speed: {self.movement.speed:.1f}"
         ]
 
 
+class ProjectilePool:
+    """
+    Pool de projectiles recyclés, une liste libre par type
+    Un projectile terminé est conservé (composants, sprite, aura) puis
+    réinitialisé au lieu d'être reconstruit au prochain tir du même type
+    """
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._free: Dict[ProjectileType, List[Projectile]] = {}
+        self._count = 0
+    
+    def acquire(self, projectile_type: ProjectileType, start_position: Tuple[float, float],
+                target_position: Tuple[float, float], damage: int, speed: float,
+                tower_stats: TowerStats) -> Optional[Projectile]:
+        """Retourne un projectile recyclé et réinitialisé, ou None si aucun n'est libre pour ce type"""
+        free = self._free.get(projectile_type)
+        if not free:
+            return None
+        
+        projectile = free.pop()
+        self._count -= 1
+        projectile.reset(start_position, target_position, damage, speed, tower_stats)
+        return projectile
+    
+    def release(self, projectile: Projectile):
+        """Rend un projectile au pool (ou le détruit si le pool est plein)"""
+        projectile.release_storage()
+        if self._count >= self.max_size:
+            projectile.destroy()
+            return
+        
+        self._free.setdefault(projectile.projectile_type, []).append(projectile)
+        self._count += 1
+    
+    def clear(self):
+        """Vide le pool"""
+        self._free.clear()
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+
+
 # ═══════════════════════════════════════════════════════════
 # SYSTÈME DE GESTION DES PROJECTILES
 # ═══════════════════════════════════════════════════════════
@@ -766,13 +1511,32 @@ class ProjectileManager:
     def __init__(self, sprite_factory: SteampunkSpriteFactory):
         self.sprite_factory = sprite_factory
         self.active_projectiles: List[Projectile] = []
-        self.projectile_pool: Dict[ProjectileType, List[Projectile]] = {}
+        
+        # Une texture par type, créée une seule fois et partagée par tous les projectiles
+        self._textures: Dict[ProjectileType, arcade.Texture] = {
+            projectile_type: sprite_factory.create_sprite(sprite_type, _SIZE_MAP[projectile_type])
+            for projectile_type, sprite_type in _SPRITE_TYPE_MAP.items()
+        }
+        self.projectile_pool = ProjectilePool()
+        self.type_counts: Dict[ProjectileType, int] = dict.fromkeys(ProjectileType, 0)  # Projectiles actifs par type
         self.logger = logging.getLogger('ProjectileManager')
         
         # Limitations de performance
         self.max_projectiles = 200
-        self.cleanup_interval = 1.0
-        self.cleanup_timer = 0.0
+        self._limit_warned = False
+        
+        # Stockage en colonnes partagé par tous les projectiles du gestionnaire
+        self.storage = ProjectileSoA(capacity=self.max_projectiles)
+        self.sprite_list = arcade.SpriteList()  # Tous les sprites de projectiles, dessinés en un appel
+        self.glow_list = arcade.SpriteList()  # Auras lumineuses, dessinées sous les projectiles
+        
+        # Index spatial des requêtes de rayon, reconstruit à la demande après chaque passe de mouvement
+        self.grid = ProjectileGrid(cell_size=64.0)
+        
+        # Tampons de travail des requêtes de rayon (aucune allocation par appel)
+        self._scratch_dx = np.empty(self.storage.capacity, dtype=np.float32)
+        self._scratch_dy = np.empty(self.storage.capacity, dtype=np.float32)
+        self._scratch_mask = np.empty(self.storage.capacity, dtype=bool)
     
     def create_projectile(self, projectile_type: ProjectileType, start_position: Tuple[float, float],
                          target_position: Tuple[float, float], damage: int, speed: float,
@@ -781,71 +1545,151 @@ class ProjectileManager:
         
         # Vérification de la limite
         if len(self.active_projectiles) >= self.max_projectiles:
-            self.logger.warning("Limite de projectiles atteinte")
+            # Un seul avertissement par saturation (pas un par tir refusé)
+            if not self._limit_warned:
+                self.logger.warning(f"Limite de projectiles atteinte ({self.max_projectiles}), "
+                                    f"nouveaux tirs ignorés")
+                self._limit_warned = True
             return None
+        self._limit_warned = False
+        
+        # Recyclage d'un projectile du même type si possible
+        projectile = self.projectile_pool.acquire(projectile_type, start_position, target_position,
+                                                  damage, speed, tower_stats)
+        if projectile is None:
+            projectile = Projectile(
+                projectile_type, start_position, target_position,
+                damage, speed, tower_stats, self.sprite_factory,
+                storage=self.storage, textures=self._textures
+            )
         
-        projectile = Projectile(
-            projectile_type, start_position, target_position,
-            damage, speed, tower_stats, self.sprite_factory
-        )
-        
+        projectile.list_index = len(self.active_projectiles)
         self.active_projectiles.append(projectile)
-        
-        self.logger.debug(f"Projectile créé: {projectile_type.value}")
+        self.type_counts[projectile_type] += 1
+        self.grid.dirty = True
+        self.sprite_list.append(projectile.sprite)
+        if projectile.glow_sprite is not None:
+            self.glow_list.append(projectile.glow_sprite)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Projectile créé: {projectile_type.key}")
         return projectile
     
     def update(self, delta_time: float):
         """Met à jour tous les projectiles"""
-        self.cleanup_timer += delta_time
-        
-        # Mise à jour des projectiles actifs
-        for projectile in self.active_projectiles:
-            projectile.update(delta_time)
-        
-        # Nettoyage périodique
-        if self.cleanup_timer >= self.cleanup_interval:
-            self._cleanup_expired_projectiles()
-            self.cleanup_timer = 0.0
+        # Passe de mouvement vectorisée, puis mise à jour des seuls projectiles
+        # dont l'impact n'est pas encore déclenché
+        storage = self.storage
+        storage.system_update(delta_time)
+        self.grid.dirty = True
+        owners = storage.owners
+        for row in storage.pending_rows().tolist():
+            owners[row]._update_entity(delta_time)
+        
+        # Libération immédiate des lignes expirées (retour à la liste libre du stockage)
+        expired = storage.expired_rows()
+        if expired.size:
+            for row in expired.tolist():
+                self._remove_active(owners[row])
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Nettoyage: {expired.size} projectiles supprimés")
     
-    def _cleanup_expired_projectiles(self):
-        """Supprime les projectiles expirés"""
-        initial_count = len(self.active_projectiles)
-        
-        self.active_projectiles = [
-            p for p in self.active_projectiles 
-            if not p.is_expired()
-        ]
-        
-        removed_count = initial_count - len(self.active_projectiles)
-        if removed_count > 0:
-            self.logger.debug(f"Nettoyage: {removed_count} projectiles supprimés")
+    def _remove_active(self, projectile: Projectile):
+        """Retire un projectile de la liste active par échange avec le dernier élément"""
+        active = self.active_projectiles
+        index = projectile.list_index
+        last = active.pop()
+        if last is not projectile:
+            active[index] = last
+            last.list_index = index
+        projectile.list_index = -1
+        self.type_counts[projectile.projectile_type] -= 1
+        self._recycle(projectile)
+    
+    def _recycle(self, projectile: Projectile):
+        """Libère la ligne d'un projectile et le rend au pool de son type"""
+        self.grid.dirty = True
+        projectile.sprite.remove_from_sprite_lists()
+        if projectile.glow_sprite is not None:
+            projectile.glow_sprite.remove_from_sprite_lists()
+        self.projectile_pool.release(projectile)
     
     def render_all(self, renderer):
-        """Rendu de tous les projectiles actifs"""
-        for projectile in self.active_projectiles:
-            projectile.render(renderer)
+        """
+        Rendu de tous les projectiles actifs: traînées en un lot, auras puis
+        sprites (SpriteList), effets spéciaux en un lot par-dessus
+        """
+        underlay = arcade.ShapeElementList()
+        overlay = arcade.ShapeElementList()
+        
+        # Sélection vectorisée des lignes à dessiner (visibles et assez opaques)
+        self._update_visibility(renderer)
+        owners = self.storage.owners
+        for row in self.storage.visible_rows().tolist():
+            projectile = owners[row]
+            if projectile.is_active:
+                projectile._append_underlay(underlay)
+                projectile._append_special_effects(overlay)
+        
+        underlay.draw()
+        self.glow_list.draw()
+        self.sprite_list.draw()
+        overlay.draw()
+    
+    def _update_visibility(self, renderer):
+        """Met à jour l'indicateur on_screen des projectiles selon les bornes du renderer"""
+        if renderer is None or not getattr(renderer, 'enable_culling', False):
+            self.storage.on_screen[:] = True
+            return
+        
+        self.storage.update_on_screen(renderer.render_bounds)
     
     def get_projectiles_in_radius(self, center: Tuple[float, float], 
                                  radius: float) -> List[Projectile]:
-        """Retourne les projectiles dans un rayon donné"""
-        result = []
-        
-        for projectile in self.active_projectiles:
-            pos = projectile.get_position()
-            distance = math.sqrt(
-                (pos[0] - center[0]) ** 2 + 
-                (pos[1] - center[1]) ** 2
-            )
-            
-            if distance <= radius:
-                result.append(projectile)
-        
-        return result
+        """
+        Retourne les projectiles dans un rayon donné
+        Seules les cellules de la grille qui chevauchent le disque sont parcourues,
+        puis test de distance au carré vectorisé sur cette présélection
+        """
+        storage = self.storage
+        grid = self.grid
+        if grid.dirty:
+            grid.rebuild(storage)
+        
+        rows = grid.candidates(center[0], center[1], radius)
+        k = rows.size
+        if k == 0:
+            return []
+        
+        if self._scratch_dx.size < k:
+            self._scratch_dx = np.empty(storage.capacity, dtype=np.float32)
+            self._scratch_dy = np.empty(storage.capacity, dtype=np.float32)
+            self._scratch_mask = np.empty(storage.capacity, dtype=bool)
+        
+        dx = np.take(storage.pos_x, rows, out=self._scratch_dx[:k])
+        dy = np.take(storage.pos_y, rows, out=self._scratch_dy[:k])
+        dx -= center[0]
+        dy -= center[1]
+        dx *= dx
+        dy *= dy
+        dx += dy
+        inside = np.less_equal(dx, radius * radius, out=self._scratch_mask[:k])
+        
+        owners = storage.owners
+        return [owners[row] for row in rows[inside].tolist()]
     
     def clear_all(self):
         """Supprime tous les projectiles"""
         count = len(self.active_projectiles)
+        for projectile in self.active_projectiles:
+            projectile.release_storage()
+            projectile.list_index = -1
         self.active_projectiles.clear()
+        self.type_counts = dict.fromkeys(ProjectileType, 0)
+        self.grid.dirty = True
+        self.projectile_pool.clear()
+        self.sprite_list = arcade.SpriteList()
+        self.glow_list = arcade.SpriteList()
         self.logger.info(f"Tous les projectiles supprimés ({count})")
     
     def get_projectile_count(self) -> int:
@@ -854,10 +1698,8 @@ class ProjectileManager:
     
     def get_debug_stats(self) -> Dict[str, Any]:
         """Retourne des statistiques de debug"""
-        projectile_types = {}
-        for projectile in self.active_projectiles:
-            ptype = projectile.projectile_type.value
-            projectile_types[ptype] = projectile_types.get(ptype, 0) + 1
+        projectile_types = {projectile_type.key: count
+                            for projectile_type, count in self.type_counts.items() if count}
         
         return {
             'total_projectiles': len(self.active_projectiles),
@@ -7,14 +7,15 @@ Définit tous les types de tours et leurs mécaniques d'attaque
 import arcade
 import math
 import random
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Any, Set
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 from gameplay.entities.entity import Entity, EntityComponent
-from gameplay.entities.enemy import Enemy, EnemyType
-from gameplay.entities.projectile import Projectile, ProjectileType
+from gameplay.entities.enemy import Enemy, EnemyType, DamageType, EnemySoA, SpatialHash
+from gameplay.entities.projectile import Projectile, ProjectilePool, ProjectileType
 from graphics.sprite_factory import SteampunkSpriteFactory, SpriteType
 from config.settings import SteampunkColors, GAMEPLAY_BALANCE
 
@@ -42,9 +43,9 @@ class TargetingMode(Enum):
     FLYING = "flying"       # Priorité aux volants
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TowerStats:
-    """Statistiques de base d'une tour"""
+    """Statistiques de base d'une tour (immuables: une instance peut être partagée)"""
     cost: int                # Coût de construction
     damage: int              # Dégâts de base
     range: float             # Portée en pixels
@@ -67,11 +68,143 @@ class TowerStats:
     stun_duration: float = 0.0    # Durée d'étourdissement
     burn_damage: int = 0          # Dégâts de brûlure par seconde
     burn_duration: float = 0.0    # Durée de brûlure
+    
+    # Valeurs dérivées, calculées une fois à la création des stats
+    range_sq: float = field(init=False, repr=False)         # Portée au carré
+    attack_cooldown: float = field(init=False, repr=False)  # Délai entre deux attaques
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'range_sq', self.range * self.range)
+        object.__setattr__(self, 'attack_cooldown',
+                           1.0 / self.attack_speed if self.attack_speed > 0 else float('inf'))
+
+
+# Statistiques de base de chaque type de tour (instances immuables partagées)
+_STATS_DB: Dict[TowerType, TowerStats] = {
+    TowerType.STEAM_CANNON: TowerStats(
+        cost=50, damage=120, range=96.0, attack_speed=0.8, projectile_speed=300.0,
+        area_damage=True, area_radius=32.0
+    ),
+    
+    TowerType.LIGHTNING_TOWER: TowerStats(
+        cost=80, damage=80, range=80.0, attack_speed=1.2, projectile_speed=1000.0,
+        chain_count=3, stun_duration=2.0
+    ),
+    
+    TowerType.FLAME_THROWER: TowerStats(
+        cost=60, damage=60, range=64.0, attack_speed=3.0, projectile_speed=0.0,
+        area_damage=True, area_radius=48.0, burn_damage=10, burn_duration=5.0,
+        can_target_air=False
+    ),
+    
+    TowerType.ANTI_AIR_GUN: TowerStats(
+        cost=90, damage=100, range=128.0, attack_speed=2.0, projectile_speed=500.0,
+        can_target_ground=False, can_target_air=True
+    ),
+    
+    TowerType.BRONZE_MORTAR: TowerStats(
+        cost=120, damage=250, range=160.0, attack_speed=0.4, projectile_speed=200.0,
+        area_damage=True, area_radius=48.0
+    ),
+    
+    TowerType.CRYO_STEAM: TowerStats(
+        cost=70, damage=40, range=80.0, attack_speed=1.0, projectile_speed=0.0,
+        area_damage=True, area_radius=64.0, slow_effect=0.5, slow_duration=4.0
+    ),
+    
+    TowerType.MINE_LAYER: TowerStats(
+        cost=40, damage=300, range=0.0, attack_speed=0.0, projectile_speed=0.0,
+        area_damage=True, area_radius=32.0, can_target_air=False
+    ),
+    
+    TowerType.SNIPER_MECHA: TowerStats(
+        cost=150, damage=400, range=200.0, attack_speed=0.6, projectile_speed=800.0,
+        pierce_count=2
+    ),
+    
+    TowerType.SHIELD_GENERATOR: TowerStats(
+        cost=100, damage=0, range=96.0, attack_speed=0.0, projectile_speed=0.0
+    )
+}
+
+# Sprite de chaque type de tour
+_SPRITE_MAP: Dict[TowerType, SpriteType] = {
+    TowerType.STEAM_CANNON: SpriteType.STEAM_CANNON,
+    TowerType.LIGHTNING_TOWER: SpriteType.LIGHTNING_TOWER,
+    TowerType.FLAME_THROWER: SpriteType.FLAME_THROWER,
+    TowerType.ANTI_AIR_GUN: SpriteType.ANTI_AIR_GUN,
+    TowerType.BRONZE_MORTAR: SpriteType.BRONZE_MORTAR,
+    TowerType.CRYO_STEAM: SpriteType.CRYO_STEAM,
+    TowerType.MINE_LAYER: SpriteType.MINE_LAYER,
+    TowerType.SNIPER_MECHA: SpriteType.SNIPER_MECHA,
+    TowerType.SHIELD_GENERATOR: SpriteType.SHIELD_GENERATOR
+}
+
+# Projectile tiré par chaque type de tour (les autres: BULLET)
+_PROJECTILE_TYPE_MAP: Dict[TowerType, ProjectileType] = {
+    TowerType.STEAM_CANNON: ProjectileType.CANNONBALL,
+    TowerType.ANTI_AIR_GUN: ProjectileType.BULLET,
+    TowerType.BRONZE_MORTAR: ProjectileType.MORTAR_SHELL,
+    TowerType.SNIPER_MECHA: ProjectileType.SNIPER_BULLET,
+}
+
+
+# Index entier de chaque mode de ciblage (colonne tower_mode des noyaux)
+_MODE_INDEX = {mode: index for index, mode in enumerate(TargetingMode)}
+_MODE_FIRST = _MODE_INDEX[TargetingMode.FIRST]
+_MODE_LAST = _MODE_INDEX[TargetingMode.LAST]
+_MODE_CLOSEST = _MODE_INDEX[TargetingMode.CLOSEST]
+_MODE_STRONGEST = _MODE_INDEX[TargetingMode.STRONGEST]
+_MODE_WEAKEST = _MODE_INDEX[TargetingMode.WEAKEST]
+_MODE_FLYING = _MODE_INDEX[TargetingMode.FLYING]
+
+# Bonus de score des volants en mode FLYING (supérieur à toute distance parcourue)
+_FLYING_PRIORITY = 1e9
+
+
+# ═══════════════════════════════════════════════════════════
+# NOYAUX DE CALCUL VECTORISÉS
+# ═══════════════════════════════════════════════════════════
+
+def select_targets(tower_x: np.ndarray, tower_y: np.ndarray, tower_range_sq: np.ndarray,
+                   tower_mode: np.ndarray, enemy_x: np.ndarray, enemy_y: np.ndarray,
+                   alive: np.ndarray, flying: np.ndarray, health: np.ndarray,
+                   distance: np.ndarray) -> np.ndarray:
+    """
+    Choisit en une passe la cible de T tours parmi E ennemis (matrice T×E)
+    Chaque mode devient un score à maximiser; les ennemis hors de portée ou
+    morts sont exclus, distances comparées au carré
+    
+    Returns:
+        np.ndarray: Ligne de l'ennemi choisi pour chaque tour (-1: aucune cible)
+    """
+    dx = enemy_x[np.newaxis, :] - tower_x[:, np.newaxis]
+    dy = enemy_y[np.newaxis, :] - tower_y[:, np.newaxis]
+    distance_sq = dx * dx + dy * dy
+    in_range = distance_sq <= tower_range_sq[:, np.newaxis]
+    in_range &= alive[np.newaxis, :]
+    
+    scores = np.empty(distance_sq.shape, dtype=np.float64)
+    scores[tower_mode == _MODE_FIRST] = distance
+    scores[tower_mode == _MODE_LAST] = -distance
+    closest = tower_mode == _MODE_CLOSEST
+    scores[closest] = -distance_sq[closest]
+    scores[tower_mode == _MODE_STRONGEST] = health
+    scores[tower_mode == _MODE_WEAKEST] = -health
+    scores[tower_mode == _MODE_FLYING] = distance + flying * _FLYING_PRIORITY
+    np.copyto(scores, -np.inf, where=~in_range)
+    
+    best = np.argmax(scores, axis=1)
+    best[~in_range.any(axis=1)] = -1
+    return best
 
 
 class AttackComponent(EntityComponent):
     """Composant d'attaque pour les tours"""
     
+    __slots__ = ('stats', 'attack_timer', 'target', 'targeting_mode', 'recent_targets',
+                 'target_history_duration', 'target_history_timer')
+    
     def __init__(self, stats: TowerStats):
         super().__init__()
         self.stats = stats
@@ -101,7 +234,7 @@ class AttackComponent(EntityComponent):
     def start_attack(self):
         """Démarre une attaque"""
         if self.can_attack():
-            self.attack_timer = 1.0 / self.stats.attack_speed
+            self.attack_timer = self.stats.attack_cooldown
     
     def update(self, delta_time: float):
         """Met à jour le composant d'attaque"""
@@ -122,9 +255,12 @@ class AttackComponent(EntityComponent):
 class TargetingComponent(EntityComponent):
     """Composant de ciblage pour les tours"""
     
+    __slots__ = ('_range', 'range_sq', 'targeting_mode', 'enemy_priorities',
+                 'last_scan_time', 'scan_interval')
+    
     def __init__(self, range_radius: float):
         super().__init__()
-        self.range = range_radius
+        self.range = range_radius  # Met aussi à jour range_sq
         self.targeting_mode = TargetingMode.FIRST
         self.enemy_priorities: Dict[EnemyType, float] = {}
         
@@ -132,8 +268,20 @@ class TargetingComponent(EntityComponent):
         self.last_scan_time = 0.0
         self.scan_interval = 0.1  # Scan toutes les 100ms
     
+    @property
+    def range(self) -> float:
+        """Portée de ciblage"""
+        return self._range
+    
+    @range.setter
+    def range(self, value: float):
+        self._range = value
+        self.range_sq = value * value
+    
     def find_target(self, tower_position: Tuple[float, float], 
-                   enemies: List[Enemy], delta_time: float) -> Optional[Enemy]:
+                   enemies: List[Enemy], delta_time: float,
+                   spatial_hash: Optional[SpatialHash] = None,
+                   enemy_storage: Optional[EnemySoA] = None) -> Optional[Enemy]:
         """
         Trouve la meilleure cible selon le mode de ciblage
         
@@ -141,6 +289,10 @@ class TargetingComponent(EntityComponent):
             tower_position: Position de la tour
             enemies: Liste des ennemis disponibles
             delta_time: Temps écoulé
+            spatial_hash: Hachage spatial partagé des ennemis (si fourni, seules
+                les cellules à portée sont parcourues au lieu de toute la liste)
+            enemy_storage: Stockage en colonnes des ennemis (si fourni, portée et
+                choix de la cible sont calculés en une passe vectorisée)
             
         Returns:
             Enemy ou None: Meilleure cible trouvée
@@ -153,11 +305,19 @@ class TargetingComponent(EntityComponent):
         
         self.last_scan_time = 0.0
         
+        if enemy_storage is not None:
+            return self._select_best_target_soa(tower_position, enemy_storage)
+        
         # Filtrage des ennemis dans la portée
-        targets_in_range = []
-        for enemy in enemies:
-            if enemy.is_alive() and self._is_enemy_in_range(tower_position, enemy):
-                targets_in_range.append(enemy)
+        if spatial_hash is not None:
+            targets_in_range = [enemy for enemy in spatial_hash.query_radius(
+                                    tower_position[0], tower_position[1], self.range)
+                                if enemy.is_alive()]
+        else:
+            targets_in_range = []
+            for enemy in enemies:
+                if enemy.is_alive() and self._is_enemy_in_range(tower_position, enemy):
+                    targets_in_range.append(enemy)
         
         if not targets_in_range:
             return None
@@ -168,11 +328,27 @@ class TargetingComponent(EntityComponent):
     def _is_enemy_in_range(self, tower_position: Tuple[float, float], enemy: Enemy) -> bool:
         """Vérifie si un ennemi est dans la portée"""
         enemy_pos = enemy.get_position()
-        distance = math.sqrt(
-            (tower_position[0] - enemy_pos[0]) ** 2 + 
-            (tower_position[1] - enemy_pos[1]) ** 2
-        )
-        return distance <= self.range
+        dx = tower_position[0] - enemy_pos[0]
+        dy = tower_position[1] - enemy_pos[1]
+        return dx * dx + dy * dy <= self.range_sq
+    
+    def _select_best_target_soa(self, tower_position: Tuple[float, float],
+                                storage: EnemySoA) -> Optional[Enemy]:
+        """
+        Portée et sélection vectorisées sur les colonnes de l'EnemySoA
+        (noyau select_targets appliqué à cette seule tour)
+        """
+        n = storage.size
+        if n == 0:
+            return None
+        
+        row = select_targets(
+            np.array([tower_position[0]]), np.array([tower_position[1]]),
+            np.array([self.range_sq]), np.array([_MODE_INDEX[self.targeting_mode]]),
+            storage.pos_x[:n], storage.pos_y[:n], storage.alive[:n],
+            storage.flying[:n], storage.health[:n], storage.distance[:n]
+        )[0]
+        return storage.owners[row] if row >= 0 else None
     
     def _select_best_target(self, tower_position: Tuple[float, float], 
                           candidates: List[Enemy]) -> Optional[Enemy]:
@@ -190,13 +366,14 @@ class TargetingComponent(EntityComponent):
         
         elif self.targeting_mode == TargetingMode.CLOSEST:
             # Ennemi le plus proche
-            def distance_to_tower(enemy):
-                pos = enemy.get_position()
-                return math.sqrt(
-                    (tower_position[0] - pos[0]) ** 2 + 
-                    (tower_position[1] - pos[1]) ** 2
-                )
-            return min(candidates, key=distance_to_tower)
+            tower_x, tower_y = tower_position
+            
+            def distance_sq_to_tower(enemy):
+                x, y = enemy.get_position()
+                dx = tower_x - x
+                dy = tower_y - y
+                return dx * dx + dy * dy
+            return min(candidates, key=distance_sq_to_tower)
         
         elif self.targeting_mode == TargetingMode.STRONGEST:
             # Ennemi avec le plus de PV
@@ -220,6 +397,8 @@ class TargetingComponent(EntityComponent):
 class UpgradeComponent(EntityComponent):
     """Composant d'amélioration pour les tours"""
     
+    __slots__ = ('level', 'max_level', 'base_stats', 'current_stats', 'upgrade_costs')
+    
     def __init__(self, base_stats: TowerStats):
         super().__init__()
         self.level = 1
@@ -261,8 +440,20 @@ class UpgradeComponent(EntityComponent):
         range_multiplier = 1.0 + (self.level - 1) * 0.10   # +10% par niveau
         speed_multiplier = 1.0 + (self.level - 1) * 0.15   # +15% par niveau
         
+        # Améliorations spéciales aux niveaux élevés
+        pierce_count = self.base_stats.pierce_count
+        chain_count = self.base_stats.chain_count
+        area_radius = self.base_stats.area_radius * range_multiplier
+        if self.level >= 3:
+            pierce_count = max(pierce_count, 1)
+            
+        if self.level >= 5:
+            # Forme ultime avec bonus spéciaux
+            chain_count = max(chain_count, 2)
+            area_radius *= 1.5
+        
         # Création des nouvelles stats
-        new_stats = TowerStats(
+        return TowerStats(
             cost=self.base_stats.cost,
             damage=int(self.base_stats.damage * damage_multiplier),
             range=self.base_stats.range * range_multiplier,
@@ -270,9 +461,9 @@ class UpgradeComponent(EntityComponent):
             projectile_speed=self.base_stats.projectile_speed,
             
             area_damage=self.base_stats.area_damage,
-            area_radius=self.base_stats.area_radius * range_multiplier,
-            pierce_count=self.base_stats.pierce_count,
-            chain_count=self.base_stats.chain_count,
+            area_radius=area_radius,
+            pierce_count=pierce_count,
+            chain_count=chain_count,
             
             can_target_ground=self.base_stats.can_target_ground,
             can_target_air=self.base_stats.can_target_air,
@@ -283,17 +474,6 @@ class UpgradeComponent(EntityComponent):
             burn_damage=int(self.base_stats.burn_damage * damage_multiplier),
             burn_duration=self.base_stats.burn_duration * 1.2
         )
-        
-        # Améliorations spéciales aux niveaux élevés
-        if self.level >= 3:
-            new_stats.pierce_count = max(new_stats.pierce_count, 1)
-            
-        if self.level >= 5:
-            # Forme ultime avec bonus spéciaux
-            new_stats.chain_count = max(new_stats.chain_count, 2)
-            new_stats.area_radius *= 1.5
-        
-        return new_stats
 
 
 class Tower(Entity):
@@ -301,11 +481,20 @@ class Tower(Entity):
     Classe de base pour toutes les tours défensives
     """
     
+    __slots__ = ('logger', 'tower_type', 'sprite_factory', 'position', 'base_stats',
+                 'attack', 'targeting', 'upgrade', 'sprite',
+                 'construction_time', 'construction_timer', 'is_constructed',
+                 'muzzle_flash_timer', 'range_indicator_visible', 'active_projectiles',
+                 '_attack_fn', '_enemies', '_enemy_storage')
+    
+    # Projectiles terminés, partagés par toutes les tours et réutilisés au tir suivant
+    _projectile_pool = ProjectilePool()
+    
     def __init__(self, tower_type: TowerType, position: Tuple[float, float],
                  sprite_factory: SteampunkSpriteFactory):
+        self.logger = logging.getLogger(f'Tower.{tower_type.value}')  # Défini avant Entity.__init__ qui l'utilise
         super().__init__()
         
-        self.logger = logging.getLogger(f'Tower.{tower_type.value}')
         self.tower_type = tower_type
         self.sprite_factory = sprite_factory
         self.position = position
@@ -338,74 +527,27 @@ class Tower(Entity):
         # Projectiles créés
         self.active_projectiles: List[Projectile] = []
         
+        # Ennemis de la frame en cours, pour les requêtes de zone des attaques
+        self._enemies: List[Enemy] = []
+        self._enemy_storage: Optional[EnemySoA] = None
+        
+        # Attaque propre au type, résolue une fois pour toutes
+        self._attack_fn = {
+            TowerType.FLAME_THROWER: self._flame_thrower_attack,
+            TowerType.CRYO_STEAM: self._cryo_steam_attack,
+            TowerType.LIGHTNING_TOWER: self._lightning_attack,
+            TowerType.SHIELD_GENERATOR: lambda target: self._shield_generator_effect(),
+        }.get(tower_type, self._create_projectile)
+        
         self.logger.debug(f"Tour {tower_type.value} créée à {position}")
     
     def _load_tower_stats(self, tower_type: TowerType) -> TowerStats:
         """Charge les statistiques selon le type de tour"""
-        stats_database = {
-            TowerType.STEAM_CANNON: TowerStats(
-                cost=50, damage=120, range=96.0, attack_speed=0.8, projectile_speed=300.0,
-                area_damage=True, area_radius=32.0
-            ),
-            
-            TowerType.LIGHTNING_TOWER: TowerStats(
-                cost=80, damage=80, range=80.0, attack_speed=1.2, projectile_speed=1000.0,
-                chain_count=3, stun_duration=2.0
-            ),
-            
-            TowerType.FLAME_THROWER: TowerStats(
-                cost=60, damage=60, range=64.0, attack_speed=3.0, projectile_speed=0.0,
-                area_damage=True, area_radius=48.0, burn_damage=10, burn_duration=5.0,
-                can_target_air=False
-            ),
-            
-            TowerType.ANTI_AIR_GUN: TowerStats(
-                cost=90, damage=100, range=128.0, attack_speed=2.0, projectile_speed=500.0,
-                can_target_ground=False, can_target_air=True
-            ),
-            
-            TowerType.BRONZE_MORTAR: TowerStats(
-                cost=120, damage=250, range=160.0, attack_speed=0.4, projectile_speed=200.0,
-                area_damage=True, area_radius=48.0
-            ),
-            
-            TowerType.CRYO_STEAM: TowerStats(
-                cost=70, damage=40, range=80.0, attack_speed=1.0, projectile_speed=0.0,
-                area_damage=True, area_radius=64.0, slow_effect=0.5, slow_duration=4.0
-            ),
-            
-            TowerType.MINE_LAYER: TowerStats(
-                cost=40, damage=300, range=0.0, attack_speed=0.0, projectile_speed=0.0,
-                area_damage=True, area_radius=32.0, can_target_air=False
-            ),
-            
-            TowerType.SNIPER_MECHA: TowerStats(
-                cost=150, damage=400, range=200.0, attack_speed=0.6, projectile_speed=800.0,
-                pierce_count=2
-            ),
-            
-            TowerType.SHIELD_GENERATOR: TowerStats(
-                cost=100, damage=0, range=96.0, attack_speed=0.0, projectile_speed=0.0
-            )
-        }
-        
-        return stats_database[tower_type]
+        return _STATS_DB[tower_type]
     
     def _create_sprite(self) -> arcade.Sprite:
         """Crée le sprite de la tour"""
-        sprite_type_map = {
-            TowerType.STEAM_CANNON: SpriteType.STEAM_CANNON,
-            TowerType.LIGHTNING_TOWER: SpriteType.LIGHTNING_TOWER,
-            TowerType.FLAME_THROWER: SpriteType.FLAME_THROWER,
-            TowerType.ANTI_AIR_GUN: SpriteType.ANTI_AIR_GUN,
-            TowerType.BRONZE_MORTAR: SpriteType.BRONZE_MORTAR,
-            TowerType.CRYO_STEAM: SpriteType.CRYO_STEAM,
-            TowerType.MINE_LAYER: SpriteType.MINE_LAYER,
-            TowerType.SNIPER_MECHA: SpriteType.SNIPER_MECHA,
-            TowerType.SHIELD_GENERATOR: SpriteType.SHIELD_GENERATOR
-        }
-        
-        sprite_type = sprite_type_map[self.tower_type]
+        sprite_type = _SPRITE_MAP[self.tower_type]
         texture = self.sprite_factory.create_sprite(sprite_type)
         
         sprite = arcade.Sprite()
@@ -414,8 +556,23 @@ class Tower(Entity):
         
         return sprite
     
-    def update(self, delta_time: float, enemies: List[Enemy]):
-        """Met à jour la tour"""
+    def update(self, delta_time: float, enemies: List[Enemy],
+               spatial_hash: Optional[SpatialHash] = None,
+               enemy_storage: Optional[EnemySoA] = None):
+        """
+        Met à jour la tour
+        
+        Args:
+            delta_time: Temps écoulé
+            enemies: Liste des ennemis actifs
+            spatial_hash: Hachage spatial des ennemis, tenu à jour une fois par frame
+                par l'EnemyManager et partagé par toutes les tours (optionnel)
+            enemy_storage: Stockage en colonnes des ennemis de l'EnemyManager, pour
+                le ciblage et les requêtes de zone vectorisés (optionnel)
+        """
+        self._enemies = enemies
+        self._enemy_storage = enemy_storage
+        
         # Construction
         if not self.is_constructed:
             self.construction_timer -= delta_time
@@ -436,7 +593,8 @@ class Tower(Entity):
         
         # Recherche de cible si nécessaire
         if not self.attack.target:
-            new_target = self.targeting.find_target(self.position, enemies, delta_time)
+            new_target = self.targeting.find_target(self.position, enemies, delta_time,
+                                                    spatial_hash, enemy_storage)
             if new_target:
                 self.attack.set_target(new_target)
         
@@ -448,7 +606,7 @@ class Tower(Entity):
         self._update_projectiles(delta_time, enemies)
         
         # Comportements spéciaux selon le type
-        self._update_special_behavior(delta_time, enemies)
+        self._update_special_behavior(delta_time, enemies, spatial_hash)
     
     def _perform_attack(self):
         """Exécute une attaque"""
@@ -463,41 +621,31 @@ class Tower(Entity):
         self.muzzle_flash_timer = 0.2
         
         # Création du projectile ou application directe des dégâts
-        if self.tower_type == TowerType.FLAME_THROWER:
-            self._flame_thrower_attack(target)
-        elif self.tower_type == TowerType.CRYO_STEAM:
-            self._cryo_steam_attack(target)
-        elif self.tower_type == TowerType.LIGHTNING_TOWER:
-            self._lightning_attack(target)
-        elif self.tower_type == TowerType.SHIELD_GENERATOR:
-            self._shield_generator_effect()
-        else:
-            self._create_projectile(target)
+        self._attack_fn(target)
         
-        self.logger.debug(f"Tour {self.tower_type.value} attaque {target.enemy_type.value}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Tour {self.tower_type.value} attaque {target.enemy_type.key}")
     
     def _create_projectile(self, target: Enemy):
         """Crée un projectile vers la cible"""
-        projectile_type_map = {
-            TowerType.STEAM_CANNON: ProjectileType.CANNONBALL,
-            TowerType.ANTI_AIR_GUN: ProjectileType.BULLET,
-            TowerType.BRONZE_MORTAR: ProjectileType.MORTAR_SHELL,
-            TowerType.SNIPER_MECHA: ProjectileType.SNIPER_BULLET,
-        }
-        
-        projectile_type = projectile_type_map.get(self.tower_type, ProjectileType.BULLET)
+        projectile_type = _PROJECTILE_TYPE_MAP.get(self.tower_type, ProjectileType.BULLET)
         current_stats = self.upgrade.current_stats
         
-        # Création du projectile
-        projectile = Projectile(
-            projectile_type=projectile_type,
-            start_position=self.position,
-            target_position=target.get_position(),
-            damage=current_stats.damage,
-            speed=current_stats.projectile_speed,
-            tower_stats=current_stats,
-            sprite_factory=self.sprite_factory
-        )
+        # Recyclage d'un projectile du même type, sinon création
+        target_position = target.get_position()
+        projectile = self._projectile_pool.acquire(projectile_type, self.position, target_position,
+                                                   current_stats.damage,
+                                                   current_stats.projectile_speed, current_stats)
+        if projectile is None:
+            projectile = Projectile(
+                projectile_type=projectile_type,
+                start_position=self.position,
+                target_position=target_position,
+                damage=current_stats.damage,
+                speed=current_stats.projectile_speed,
+                tower_stats=current_stats,
+                sprite_factory=self.sprite_factory
+            )
         
         self.active_projectiles.append(projectile)
         
@@ -519,7 +667,7 @@ class Tower(Entity):
         
         for enemy in affected_enemies:
             if enemy.is_alive():
-                enemy.take_damage(current_stats.damage, "fire", self.position)
+                enemy.take_damage(current_stats.damage, DamageType.FIRE, self.position)
                 if current_stats.burn_damage > 0:
                     enemy.apply_effect("burn", current_stats.burn_duration,
                                      damage_per_second=current_stats.burn_damage)
@@ -541,7 +689,7 @@ class Tower(Entity):
         
         for enemy in affected_enemies:
             if enemy.is_alive():
-                enemy.take_damage(current_stats.damage, "ice", self.position)
+                enemy.take_damage(current_stats.damage, DamageType.ICE, self.position)
                 if current_stats.slow_effect > 0:
                     enemy.apply_effect("slow", current_stats.slow_duration,
                                      speed_multiplier=current_stats.slow_effect)
@@ -559,7 +707,7 @@ class Tower(Entity):
         current_target = target
         
         # Application des dégâts à la cible principale
-        current_target.take_damage(current_stats.damage, "electric", self.position)
+        current_target.take_damage(current_stats.damage, DamageType.ELECTRIC, self.position)
         if current_stats.stun_duration > 0:
             current_target.apply_effect("stun", current_stats.stun_duration)
         
@@ -571,7 +719,7 @@ class Tower(Entity):
             
             # Dégâts réduits pour les chaînes
             chain_damage = int(current_stats.damage * (0.8 ** (i + 1)))
-            next_target.take_damage(chain_damage, "electric", self.position)
+            next_target.take_damage(chain_damage, DamageType.ELECTRIC, self.position)
             
             targets_hit.append(next_target)
             current_target = next_target
@@ -587,21 +735,28 @@ class Tower(Entity):
         # Cette fonctionnalité sera implémentée avec le système de tours alliées
         pass
     
-    def _update_special_behavior(self, delta_time: float, enemies: List[Enemy]):
+    def _update_special_behavior(self, delta_time: float, enemies: List[Enemy],
+                                 spatial_hash: Optional[SpatialHash] = None):
         """Met à jour les comportements spéciaux selon le type de tour"""
         if self.tower_type == TowerType.MINE_LAYER:
-            self._update_mine_layer(delta_time, enemies)
+            self._update_mine_layer(delta_time, enemies, spatial_hash)
     
-    def _update_mine_layer(self, delta_time: float, enemies: List[Enemy]):
+    def _update_mine_layer(self, delta_time: float, enemies: List[Enemy],
+                           spatial_hash: Optional[SpatialHash] = None):
         """Comportement spécial du poseur de mines"""
         # Place automatiquement des mines autour de la tour
         # Les mines explosent quand un ennemi terrestre s'approche
+        if not self.attack.can_attack():
+            return  # Mine en cours de rechargement
         
         mine_range = 48.0  # Portée de détection des mines
+        mine_range_sq = mine_range * mine_range
+        if spatial_hash is not None:
+            enemies = spatial_hash.query_radius(self.position[0], self.position[1], mine_range)
         
         for enemy in enemies:
             if (enemy.is_alive() and not enemy.is_flying() and
-                self._distance_to_enemy(enemy) <= mine_range):
+                self._distance_sq_to_enemy(enemy) <= mine_range_sq):
                 
                 # Explosion de mine
                 current_stats = self.upgrade.current_stats
@@ -610,7 +765,7 @@ class Tower(Entity):
                 
                 for affected in affected_enemies:
                     if affected.is_alive() and not affected.is_flying():
-                        affected.take_damage(current_stats.damage, "physical", self.position)
+                        affected.take_damage(current_stats.damage, DamageType.PHYSICAL, self.position)
                 
                 # Effet visuel d'explosion
                 self.emit_event('mine_explosion', {
@@ -623,16 +778,24 @@ class Tower(Entity):
                 break
     
     def _update_projectiles(self, delta_time: float, enemies: List[Enemy]):
-        """Met à jour les projectiles actifs"""
-        for projectile in self.active_projectiles[:]:
+        """Met à jour les projectiles actifs (retrait par échange avec le dernier, sans copie)"""
+        projectiles = self.active_projectiles
+        i = 0
+        while i < len(projectiles):
+            projectile = projectiles[i]
             projectile.update(delta_time)
             
             # Vérification des collisions
             if projectile.has_hit_target():
                 self._handle_projectile_hit(projectile, enemies)
-                self.active_projectiles.remove(projectile)
-            elif projectile.is_expired():
-                self.active_projectiles.remove(projectile)
+            elif not projectile.is_expired():
+                i += 1
+                continue
+            
+            last = projectiles.pop()
+            if i < len(projectiles):
+                projectiles[i] = last
+            self._projectile_pool.release(projectile)
     
     def _handle_projectile_hit(self, projectile: Projectile, enemies: List[Enemy]):
         """Gère l'impact d'un projectile"""
@@ -644,12 +807,12 @@ class Tower(Entity):
             affected_enemies = self._get_enemies_in_radius(hit_position, stats.area_radius)
             for enemy in affected_enemies:
                 if enemy.is_alive():
-                    enemy.take_damage(projectile.damage, "physical", self.position)
+                    enemy.take_damage(projectile.damage, DamageType.PHYSICAL, self.position)
         else:
             # Recherche de l'ennemi le plus proche du point d'impact
             closest_enemy = self._find_closest_enemy_to_point(hit_position, enemies, 16.0)
             if closest_enemy and closest_enemy.is_alive():
-                closest_enemy.take_damage(projectile.damage, "physical", self.position)
+                closest_enemy.take_damage(projectile.damage, DamageType.PHYSICAL, self.position)
                 
                 # Effets spéciaux
                 if stats.slow_effect > 0:
@@ -786,24 +949,72 @@ class Tower(Entity):
     # ═══════════════════════════════════════════════════════════
     
     def _distance_to_enemy(self, enemy: Enemy) -> float:
-        """Calcule la distance à un ennemi"""
+        """Calcule la distance à un ennemi (pour les comparaisons, voir _distance_sq_to_enemy)"""
         enemy_pos = enemy.get_position()
-        return math.sqrt(
-            (self.position[0] - enemy_pos[0]) ** 2 + 
-            (self.position[1] - enemy_pos[1]) ** 2
-        )
+        return math.hypot(self.position[0] - enemy_pos[0], self.position[1] - enemy_pos[1])
+    
+    def _distance_sq_to_enemy(self, enemy: Enemy) -> float:
+        """Calcule la distance au carré à un ennemi (sans racine carrée)"""
+        enemy_pos = enemy.get_position()
+        dx = self.position[0] - enemy_pos[0]
+        dy = self.position[1] - enemy_pos[1]
+        return dx * dx + dy * dy
     
     def _get_enemies_in_radius(self, center: Tuple[float, float], 
                               radius: float) -> List[Enemy]:
-        """Retourne les ennemis dans un rayon donné"""
-        # Cette méthode sera appelée avec une liste d'ennemis du système de jeu
-        return []  # Placeholder
+        """Retourne les ennemis dans un rayon donné (masque vectorisé sur l'EnemySoA si disponible)"""
+        storage = self._enemy_storage
+        if storage is not None:
+            owners = storage.owners
+            return [owners[row] for row in storage.rows_in_radius(center[0], center[1], radius).tolist()]
+        
+        radius_sq = radius * radius
+        result = []
+        for enemy in self._enemies:
+            x, y = enemy.get_position()
+            dx = x - center[0]
+            dy = y - center[1]
+            if enemy.is_alive() and dx * dx + dy * dy <= radius_sq:
+                result.append(enemy)
+        return result
     
     def _get_enemies_in_cone(self, target_pos: Tuple[float, float], 
                            range_radius: float, angle_degrees: float) -> List[Enemy]:
-        """Retourne les ennemis dans un cône"""
-        # Calcul du cône depuis la tour vers la cible
-        return []  # Placeholder
+        """
+        Retourne les ennemis dans un cône partant de la tour vers la cible
+        Le cône s'étend jusqu'à la cible plus range_radius, d'ouverture totale angle_degrees
+        """
+        origin_x, origin_y = self.position
+        dx = target_pos[0] - origin_x
+        dy = target_pos[1] - origin_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return self._get_enemies_in_radius(target_pos, range_radius)
+        
+        dir_x = dx / distance
+        dir_y = dy / distance
+        length = distance + range_radius
+        half_angle = math.radians(angle_degrees) * 0.5
+        
+        storage = self._enemy_storage
+        if storage is not None:
+            owners = storage.owners
+            rows = storage.rows_in_cone(origin_x, origin_y, dir_x, dir_y, length, half_angle)
+            return [owners[row] for row in rows.tolist()]
+        
+        length_sq = length * length
+        cos_sq = math.cos(half_angle) ** 2
+        result = []
+        for enemy in self._enemies:
+            x, y = enemy.get_position()
+            ex = x - origin_x
+            ey = y - origin_y
+            distance_sq = ex * ex + ey * ey
+            dot = ex * dir_x + ey * dir_y
+            if (enemy.is_alive() and distance_sq <= length_sq and dot >= 0 and
+                    dot * dot >= cos_sq * distance_sq):
+                result.append(enemy)
+        return result
     
     def _find_nearest_enemy_for_chain(self, current_target: Enemy, 
                                     already_hit: List[Enemy]) -> Optional[Enemy]:
@@ -815,18 +1026,17 @@ class Tower(Entity):
                                    enemies: List[Enemy], max_distance: float) -> Optional[Enemy]:
         """Trouve l'ennemi le plus proche d'un point"""
         closest = None
-        min_distance = max_distance
+        min_distance_sq = max_distance * max_distance
         
         for enemy in enemies:
             if enemy.is_alive():
                 enemy_pos = enemy.get_position()
-                distance = math.sqrt(
-                    (point[0] - enemy_pos[0]) ** 2 + 
-                    (point[1] - enemy_pos[1]) ** 2
-                )
+                dx = point[0] - enemy_pos[0]
+                dy = point[1] - enemy_pos[1]
+                distance_sq = dx * dx + dy * dy
                 
-                if distance < min_distance:
-                    min_distance = distance
+                if distance_sq < min_distance_sq:
+                    min_distance_sq = distance_sq
                     closest = enemy
         
         return closest
@@ -884,13 +1094,55 @@ class Tower(Entity):
             f"Damage: {stats.damage}",
             f"Range: {stats.range:.1f}",
             f"Attack Speed: {stats.attack_speed:.1f}",
-            f"Target: {self.attack.target.enemy_type.value if self.attack.target else 'None'}",
+            f"Target: {self.attack.target.enemy_type.key if self.attack.target else 'None'}",
             f"Attack Timer: {self.attack.attack_timer:.1f}",
             f"Constructed: {self.is_constructed}",
             f"Active Projectiles: {len(self.active_projectiles)}"
         ]
 
 
+# ═══════════════════════════════════════════════════════════
+# CIBLAGE GROUPÉ
+# ═══════════════════════════════════════════════════════════
+
+def assign_targets(towers: List[Tower], enemy_storage: EnemySoA) -> int:
+    """
+    Attribue en une passe vectorisée une cible à toutes les tours construites
+    qui n'en ont pas (à appeler une fois par frame, avant les Tower.update)
+    
+    Args:
+        towers: Tours du niveau
+        enemy_storage: Stockage en colonnes des ennemis (données de ciblage à jour)
+        
+    Returns:
+        int: Nombre de tours ayant reçu une cible
+    """
+    n = enemy_storage.size
+    idle = [tower for tower in towers
+            if tower.is_constructed and tower.attack.target is None and tower.targeting.range > 0]
+    if n == 0 or not idle:
+        return 0
+    
+    count = len(idle)
+    best = select_targets(
+        np.fromiter((tower.position[0] for tower in idle), dtype=np.float64, count=count),
+        np.fromiter((tower.position[1] for tower in idle), dtype=np.float64, count=count),
+        np.fromiter((tower.targeting.range_sq for tower in idle), dtype=np.float64, count=count),
+        np.fromiter((_MODE_INDEX[tower.targeting.targeting_mode] for tower in idle),
+                    dtype=np.int8, count=count),
+        enemy_storage.pos_x[:n], enemy_storage.pos_y[:n], enemy_storage.alive[:n],
+        enemy_storage.flying[:n], enemy_storage.health[:n], enemy_storage.distance[:n]
+    )
+    
+    assigned = 0
+    owners = enemy_storage.owners
+    for tower, row in zip(idle, best.tolist()):
+        if row >= 0:
+            tower.attack.set_target(owners[row])
+            assigned += 1
+    return assigned
+
+
 # ═══════════════════════════════════════════════════════════
 # FACTORY POUR CRÉER LES TOURS
 # ═══════════════════════════════════════════════════════════
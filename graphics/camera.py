@@ -195,13 +195,8 @@ class Camera2D:
     
     def _animate_rotation(self, delta_time: float):
         """Anime la rotation vers la cible"""
-        angle_diff = self.target_angle - self.angle
-        
         # Normalisation de l'angle (-180° à 180°)
-        while angle_diff > 180:
-            angle_diff -= 360
-        while angle_diff < -180:
-            angle_diff += 360
+        angle_diff = math.remainder(self.target_angle - self.angle, 360.0)
         
         rotation_step = self.rotation_speed * delta_time
         if abs(angle_diff) < rotation_step: